@@ -0,0 +1,14 @@
+"""
+Command line tools for the AI Fellows lessons.
+
+    ai-fellows grade student_notebook.ipynb
+    ai-fellows montyhall --trials 10000
+    ai-fellows backprop --parts 1 2 --no-show
+
+(or `python -m ai_fellows ...` without installing). The lesson code lives in
+the subpackages `ai_fellows.montecarlo` and `ai_fellows.backprop`, next to the
+grader (`ai_fellows.grading`) and the Monty Hall simulation
+(`ai_fellows.montyhall`); the scripts in the lesson folders run the same code.
+"""
+
+__version__ = '0.1.0'
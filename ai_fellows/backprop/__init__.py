@@ -0,0 +1,120 @@
+"""
+Backpropagation library for the chain-rule lesson.
+
+The network classes and training routines used by the simulator
+(`ai_fellows.backprop.simulator`), importable without running the demo:
+
+    from ai_fellows.backprop import SimpleNetwork
+    net = SimpleNetwork(w1=1.0, w2=3.0)
+    net.train_step(2, 20, learning_rate=0.1)
+
+Importing the package only loads numpy. The plotting helpers import
+matplotlib the first time one of them is called.
+"""
+
+from .networks import (
+    SimpleNetwork,
+    NonlinearNetwork,
+    RegressionNetwork,
+    WORKSHEET_X,
+    WORKSHEET_TARGET,
+)
+from .history import History
+from .training import (
+    train,
+    train_batches,
+    steps_to_tolerance,
+    compare_optimizers,
+    make_regression_data,
+)
+from .optimizers import Optimizer, SGD, Momentum, Adam, LineSearch, LeastSquares, OPTIMIZERS
+from .data import ArrayDataset, CSVDataset, BatchLoader, csv_to_npy
+from .closed_form import (
+    Trajectory,
+    jump,
+    jump_matrix_power,
+    train_iteratively,
+    cross_check,
+    closed_form_steps_to_tolerance,
+    convergence_factor,
+    divergence_threshold,
+)
+from .ensemble import EnsembleResult, LinearEnsemble, train_ensemble
+from .search import SearchResult, SharedArray, param_grid, grid_search
+from .profiling import Profiler
+from .checkpoint import Checkpointer, save_checkpoint, load_checkpoint, resume
+from .landscape import Landscape, batch_evaluate, landscape_grid, plot_landscape
+from .explorer import WeightExplorer, cached_landscape
+from .activations import ACTIVATIONS, get_activation
+from .mlp import Dense, MLP
+from .autodiff import Tape, Var
+from .render import FigureRenderer, figure_key
+from .plots import (
+    plot_training,
+    explore_network,
+    plot_nonlinear_comparison,
+    plot_real_data,
+)
+
+__all__ = [
+    'SimpleNetwork',
+    'NonlinearNetwork',
+    'RegressionNetwork',
+    'WORKSHEET_X',
+    'WORKSHEET_TARGET',
+    'History',
+    'train',
+    'train_batches',
+    'steps_to_tolerance',
+    'compare_optimizers',
+    'make_regression_data',
+    'Optimizer',
+    'SGD',
+    'Momentum',
+    'Adam',
+    'LineSearch',
+    'LeastSquares',
+    'OPTIMIZERS',
+    'ArrayDataset',
+    'CSVDataset',
+    'BatchLoader',
+    'csv_to_npy',
+    'Trajectory',
+    'jump',
+    'jump_matrix_power',
+    'train_iteratively',
+    'cross_check',
+    'closed_form_steps_to_tolerance',
+    'convergence_factor',
+    'divergence_threshold',
+    'EnsembleResult',
+    'LinearEnsemble',
+    'train_ensemble',
+    'SearchResult',
+    'SharedArray',
+    'param_grid',
+    'grid_search',
+    'Profiler',
+    'Checkpointer',
+    'save_checkpoint',
+    'load_checkpoint',
+    'resume',
+    'Landscape',
+    'batch_evaluate',
+    'landscape_grid',
+    'plot_landscape',
+    'WeightExplorer',
+    'cached_landscape',
+    'ACTIVATIONS',
+    'get_activation',
+    'Dense',
+    'MLP',
+    'Tape',
+    'Var',
+    'FigureRenderer',
+    'figure_key',
+    'plot_training',
+    'explore_network',
+    'plot_nonlinear_comparison',
+    'plot_real_data',
+]
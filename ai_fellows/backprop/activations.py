@@ -0,0 +1,98 @@
+"""
+Activation functions and their derivatives.
+
+Each activation is a pair (f, df) where df(z, a) is f'(z) written in terms of
+the input z *and* the output a = f(z). The forward pass already computed a,
+so most derivatives cost one multiply instead of another exp or tanh:
+
+    sigmoid:   σ'(z) = a * (1 - a)
+    tanh:      tanh'(z) = 1 - a^2
+    softplus:  softplus'(z) = σ(z) = 1 - e^(-a)
+
+The functions are written so they never overflow: 1 / (1 + e^(-z)) breaks
+for large negative z (e^(-z) is inf), so sigmoid only ever exponentiates
+-|z|, and softplus uses np.logaddexp.
+
+Pick an activation by name:
+
+    f, df = get_activation('tanh')
+    NonlinearNetwork(activation='tanh')
+    MLP.build([1, 16, 1], activation='leaky_relu')
+"""
+
+import numpy as np
+
+LEAKY_SLOPE = 0.01
+
+
+def sigmoid(z):
+    """σ(z) = 1 / (1 + e^(-z)), without overflow for any z"""
+    e = np.exp(-np.abs(z))      # always in (0, 1]
+    s = 1 / (1 + e)             # σ(|z|)
+    return np.where(np.asarray(z) >= 0, s, e * s)[()]
+
+
+def sigmoid_derivative(z, a):
+    return a * (1 - a)
+
+
+def tanh(z):
+    return np.tanh(z)
+
+
+def tanh_derivative(z, a):
+    return 1 - a * a
+
+
+def relu(z):
+    return np.maximum(z, 0)
+
+
+def relu_derivative(z, a):
+    return (np.asarray(z) > 0).astype(np.result_type(a, np.float32))[()]
+
+
+def leaky_relu(z):
+    """z for z > 0, a small slope (LEAKY_SLOPE * z) otherwise, so gradients never die"""
+    return np.where(np.asarray(z) > 0, z, LEAKY_SLOPE * np.asarray(z))[()]
+
+
+def leaky_relu_derivative(z, a):
+    slope = np.where(np.asarray(z) > 0, 1.0, LEAKY_SLOPE)
+    return slope.astype(np.result_type(a, np.float32))[()]
+
+
+def softplus(z):
+    """log(1 + e^z), a smooth ReLU; logaddexp avoids overflow for large z"""
+    return np.logaddexp(0, z)
+
+
+def softplus_derivative(z, a):
+    # σ(z) = 1 - e^(-softplus(z)); expm1 stays accurate when a is tiny
+    return -np.expm1(-a)
+
+
+def linear(z):
+    return z
+
+
+def linear_derivative(z, a):
+    return 1.0
+
+
+ACTIVATIONS = {
+    'linear': (linear, linear_derivative),
+    'sigmoid': (sigmoid, sigmoid_derivative),
+    'tanh': (tanh, tanh_derivative),
+    'relu': (relu, relu_derivative),
+    'leaky_relu': (leaky_relu, leaky_relu_derivative),
+    'softplus': (softplus, softplus_derivative),
+}
+
+
+def get_activation(name):
+    """The (f, df) pair for an activation name"""
+    if name not in ACTIVATIONS:
+        raise ValueError(f"Unknown activation '{name}'. "
+                         f"Choose from: {', '.join(ACTIVATIONS)}")
+    return ACTIVATIONS[name]
@@ -0,0 +1,352 @@
+"""
+A tiny reverse-mode automatic differentiation tape.
+
+Every network class in this package writes its backward pass by hand. This
+module lets the computer do that bookkeeping: each operation on a Var is
+recorded on a Tape together with its local derivative, and backward() walks
+the tape in reverse multiplying local derivatives together — the chain rule,
+applied automatically.
+
+    tape = Tape()
+    w1 = tape.variable(1.0, 'w1')
+    w2 = tape.variable(3.0, 'w2')
+    h = (3 * 2 + w1).named('h')
+    y = (2 * h + w2).named('y')
+    E = (0.5 * (y - 20) ** 2).named('E')
+
+    tape.backward(E)
+    w1.grad                      # -6.0
+    print(tape.explain(E, w1))   # dE/dw1 = dE/dy × dy/dh × dh/dw1 = ...
+
+A recorded graph can be reused: change the variables' values, call
+tape.replay() to recompute every node in recorded order, then backward()
+again. Nothing is rebuilt, so a training loop only pays for the numpy work.
+"""
+
+import numpy as np
+
+from . import activations
+
+
+def _unbroadcast(grad, value):
+    """Sum grad down to the shape of value (undoing numpy broadcasting)"""
+    # getattr is much cheaper than np.shape, and Python floats have no .shape
+    shape = getattr(value, 'shape', ())
+    grad_shape = getattr(grad, 'shape', ())
+    if grad_shape == shape:
+        return grad
+    if len(grad_shape) < len(shape):
+        # A scalar gradient (e.g. from mean) spread over an array value
+        return np.broadcast_to(grad, shape).copy()
+    while grad.ndim > len(shape):
+        grad = np.add.reduce(grad, axis=0)
+    for axis, size in enumerate(shape):
+        if size == 1 and grad.shape[axis] != 1:
+            grad = np.add.reduce(grad, axis=axis, keepdims=True)
+    return grad
+
+
+class Var:
+    """A value recorded on a Tape, plus its gradient after backward()"""
+
+    __slots__ = ('tape', 'index', 'value', 'name', 'parents', 'fn', 'vjp', 'requires_grad', 'grad')
+
+    def __init__(self, tape, value, name=None, parents=(), fn=None, vjp=None, requires_grad=False):
+        self.tape = tape
+        self.index = None
+        self.value = value
+        self.name = name
+        self.parents = parents
+        self.fn = fn
+        self.vjp = vjp
+        self.requires_grad = requires_grad
+        self.grad = None
+
+    def named(self, name):
+        """Give this node a name for explain(); returns self so it can be chained"""
+        self.name = name
+        return self
+
+    def __repr__(self):
+        return f"Var({self.name or '?'}={self.value!r})"
+
+    # Arithmetic records a new node on the tape
+    def __add__(self, other):
+        return self.tape.record(np.add, _add_vjp, self, other)
+
+    def __radd__(self, other):
+        return self.tape.record(np.add, _add_vjp, other, self)
+
+    def __sub__(self, other):
+        return self.tape.record(np.subtract, _sub_vjp, self, other)
+
+    def __rsub__(self, other):
+        return self.tape.record(np.subtract, _sub_vjp, other, self)
+
+    def __mul__(self, other):
+        return self.tape.record(np.multiply, _mul_vjp, self, other)
+
+    def __rmul__(self, other):
+        return self.tape.record(np.multiply, _mul_vjp, other, self)
+
+    def __truediv__(self, other):
+        return self.tape.record(np.divide, _div_vjp, self, other)
+
+    def __rtruediv__(self, other):
+        return self.tape.record(np.divide, _div_vjp, other, self)
+
+    def __neg__(self):
+        return self.tape.record(np.negative, _neg_vjp, self)
+
+    def __pow__(self, exponent):
+        if exponent == 2:
+            return self.tape.record(np.square, _square_vjp, self)
+        return self.tape.record(lambda a: np.power(a, exponent),
+                                lambda g, out, a: (g * exponent * np.power(a.value, exponent - 1),),
+                                self)
+
+    def __matmul__(self, other):
+        return self.tape.record(np.matmul, _matmul_vjp, self, other)
+
+    def mean(self):
+        return self.tape.record(_mean, _mean_vjp, self)
+
+    def sum(self):
+        return self.tape.record(_sum, _sum_vjp, self)
+
+
+# Local derivatives. Each takes (dE/d_out, out, *parents) and returns dE/d_parent
+# for each parent; parents that don't need a gradient get None.
+
+def _add_vjp(g, out, a, b):
+    return (_unbroadcast(g, a.value) if a.requires_grad else None,
+            _unbroadcast(g, b.value) if b.requires_grad else None)
+
+
+def _sub_vjp(g, out, a, b):
+    return (_unbroadcast(g, a.value) if a.requires_grad else None,
+            _unbroadcast(-g, b.value) if b.requires_grad else None)
+
+
+def _mul_vjp(g, out, a, b):
+    return (_unbroadcast(g * b.value, a.value) if a.requires_grad else None,
+            _unbroadcast(g * a.value, b.value) if b.requires_grad else None)
+
+
+def _div_vjp(g, out, a, b):
+    return (_unbroadcast(g / b.value, a.value) if a.requires_grad else None,
+            _unbroadcast(-g * out / b.value, b.value) if b.requires_grad else None)
+
+
+def _neg_vjp(g, out, a):
+    return (-g,)
+
+
+def _square_vjp(g, out, a):
+    return (2 * g * a.value,)
+
+
+def _matmul_vjp(g, out, a, b):
+    return (g @ np.swapaxes(b.value, -1, -2) if a.requires_grad else None,
+            np.swapaxes(a.value, -1, -2) @ g if b.requires_grad else None)
+
+
+# np.add.reduce skips the Python-level overhead of np.mean / np.sum, which
+# dominates on the small arrays used in the lessons
+def _mean(a):
+    return np.add.reduce(a, axis=None) / np.size(a)
+
+
+def _sum(a):
+    return np.add.reduce(a, axis=None)
+
+
+# The gradient of a full reduction is the same number for every element of
+# its input, so it is spread out to the input's shape
+def _mean_vjp(g, out, a):
+    return (np.full(np.shape(a.value), g / np.size(a.value)),)
+
+
+def _sum_vjp(g, out, a):
+    return (np.full(np.shape(a.value), g),)
+
+
+def _sigmoid_vjp(g, out, a):
+    return (g * out * (1 - out),)
+
+
+def _exp_vjp(g, out, a):
+    return (g * out,)
+
+
+def _tanh_vjp(g, out, a):
+    return (g * (1 - out * out),)
+
+
+def _relu_vjp(g, out, a):
+    return (g * (a.value > 0),)
+
+
+def sigmoid(v):
+    """Record σ(v); its local derivative σ(v)(1 - σ(v)) reuses the stored output"""
+    return v.tape.record(activations.sigmoid, _sigmoid_vjp, v)
+
+
+def exp(v):
+    """Record e^v"""
+    return v.tape.record(np.exp, _exp_vjp, v)
+
+
+def tanh(v):
+    """Record tanh(v)"""
+    return v.tape.record(np.tanh, _tanh_vjp, v)
+
+
+def relu(v):
+    """Record max(v, 0)"""
+    return v.tape.record(lambda z: np.maximum(z, 0), _relu_vjp, v)
+
+
+class Tape:
+    """Records operations in order so they can be replayed and differentiated"""
+
+    def __init__(self):
+        self.nodes = []
+        self._ops = []        # nodes produced by an operation, in recorded order
+        self._plans = {}      # output index -> (nodes to clear, nodes to visit)
+
+    def variable(self, value, name=None):
+        """A value we want gradients for (a weight)"""
+        return self._append(Var(self, value, name, requires_grad=True))
+
+    def constant(self, value, name=None):
+        """A value we don't differentiate (inputs, targets, fixed coefficients)"""
+        return self._append(Var(self, value, name))
+
+    def _append(self, node):
+        node.index = len(self.nodes)
+        self.nodes.append(node)
+        if node.parents:
+            self._ops.append(node)
+        self._plans.clear()
+        return node
+
+    def record(self, fn, vjp, *parents):
+        """Apply fn to the parents' values and record the result as a new node"""
+        parents = tuple(p if isinstance(p, Var) else self.constant(p, repr(p)) for p in parents)
+        value = fn(*[p.value for p in parents])
+        requires_grad = any(p.requires_grad for p in parents)
+        return self._append(Var(self, value, None, parents, fn, vjp, requires_grad))
+
+    def replay(self):
+        """
+        Recompute every recorded operation from the current variable values.
+
+        Set var.value on the variables (and constants, e.g. a new batch)
+        first; the graph itself is reused as recorded.
+        """
+        for node in self._ops:
+            parents = node.parents
+            if len(parents) == 2:
+                node.value = node.fn(parents[0].value, parents[1].value)
+            else:
+                node.value = node.fn(parents[0].value)
+
+    def _plan(self, output):
+        """
+        The nodes backward(output) has to touch, worked out once per output.
+
+        Only nodes that depend on a variable and feed into output matter;
+        constants and side branches are skipped on every later call.
+        """
+        plan = self._plans.get(output.index)
+        if plan is None:
+            needed = {output.index}
+            for node in reversed(self.nodes[:output.index + 1]):
+                if node.index in needed:
+                    needed.update(p.index for p in node.parents if p.requires_grad)
+            clear = [self.nodes[i] for i in sorted(needed)]
+            visit = [node for node in reversed(clear) if node.parents]
+            plan = self._plans[output.index] = (clear, visit)
+        return plan
+
+    def backward(self, output):
+        """
+        Fill in .grad (d output / d node) for every node between output and the variables.
+
+        Walks the tape from the end back to the start, so each node's gradient
+        is complete before it is passed on to its parents.
+        """
+        clear, visit = self._plan(output)
+        for node in clear:
+            node.grad = None
+        output.grad = 1.0 if np.ndim(output.value) == 0 else np.ones_like(output.value)
+        for node in visit:
+            g = node.grad
+            if g is None:
+                continue
+            for parent, pg in zip(node.parents, node.vjp(g, node.value, *node.parents)):
+                if pg is not None:
+                    parent.grad = pg if parent.grad is None else parent.grad + pg
+        return output
+
+    def gradients(self, output, variables):
+        """backward(output), then return the gradients of the given variables"""
+        self.backward(output)
+        return [v.grad for v in variables]
+
+    def explain(self, output, variable):
+        """
+        Write out dOutput/dVariable as a chain of partial derivatives between
+        named nodes, the way Part 1 prints it:
+
+            dE/dw1 = dE/dy × dy/dh × dh/dw1
+                   = (-3.0) × (2.0) × (1.0) = -6.0
+
+        Unnamed intermediate nodes are folded into the link they sit on.
+        Works for graphs of scalar values. If the variable reaches the output
+        along more than one path, each path is listed and the terms add up.
+        """
+        chains = []
+        for path in self._paths(output, variable):
+            # Multiply local derivatives along the path, closing a link at each named node
+            links = []
+            upper = path[0]
+            local = 1.0
+            for child, parent in zip(path[:-1], path[1:]):
+                index = next(i for i, p in enumerate(child.parents) if p is parent)
+                local = local * child.vjp(np.ones_like(child.value), child.value, *child.parents)[index]
+                if parent.name is not None or parent is variable:
+                    links.append((upper.name or 'out', parent.name, float(local)))
+                    upper = parent
+                    local = 1.0
+            chains.append(links)
+
+        top = output.name or 'out'
+        lines = []
+        for links in chains:
+            symbols = ' × '.join(f'd{a}/d{b}' for a, b, _ in links)
+            values = ' × '.join(f'({v:.4g})' for _, _, v in links)
+            total = float(np.prod([v for _, _, v in links]))
+            lines.append((symbols, values, total))
+        lhs = f'd{top}/d{variable.name}'
+        pad = ' ' * len(lhs)
+        first = ' + '.join(s for s, _, _ in lines)
+        second = ' + '.join(v for _, v, _ in lines)
+        total = sum(t for _, _, t in lines)
+        return f"{lhs} = {first}\n{pad} = {second} = {total:.4g}"
+
+    @staticmethod
+    def _paths(output, variable):
+        """Every path of nodes from output back to variable"""
+        paths = []
+        stack = [(output, [output])]
+        while stack:
+            node, path = stack.pop()
+            if node is variable:
+                paths.append(path)
+                continue
+            for parent in node.parents:
+                if parent.requires_grad:
+                    stack.append((parent, path + [parent]))
+        return paths[::-1]
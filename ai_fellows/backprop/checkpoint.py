@@ -0,0 +1,230 @@
+"""
+Save training to disk and pick it up again later.
+
+A checkpoint is one .npz file holding the network's weights, its
+optimizer's running state, its (compact) history, the step count and the
+random number generator states. Loading it and training on gives exactly
+the same numbers, bit for bit, as never having stopped:
+
+    train(net, x, target, steps=5000, callback=Checkpointer('run.npz', every=500))
+
+    # ...after a crash or a kernel restart:
+    net, step = resume('run.npz')
+    train(net, x, target, steps=5000 - step, callback=Checkpointer('run.npz', every=500, start=step))
+
+Files are written to a temporary name and then renamed over the old
+checkpoint, so a crash mid-write never leaves a half-written file behind.
+Nothing is pickled: arrays are stored as arrays and everything else as JSON.
+
+Pass rngs={'loader': loader.rng} to also save and restore Generators used for
+shuffling. A BatchLoader shuffles a little ahead of training on its thread,
+so save those at the end of an epoch.
+"""
+
+import json
+import os
+import tempfile
+
+import numpy as np
+
+from .history import History
+from .mlp import MLP, Dense
+from .networks import SimpleNetwork, NonlinearNetwork, RegressionNetwork
+from .optimizers import OPTIMIZERS
+
+FORMAT_VERSION = 1
+
+_OPTIMIZER_CLASSES = {cls.__name__: cls for cls in OPTIMIZERS.values()}
+
+
+# -- turning state into arrays + JSON and back --------------------------------
+
+def _encode(value, key, arrays):
+    """Replace arrays inside value by references to entries of `arrays`"""
+    if isinstance(value, np.dtype):
+        return {'__dtype__': value.str}
+    if isinstance(value, (np.ndarray, np.generic)) and not type(value) is np.float64:
+        arrays[key] = np.asarray(value)
+        return {'__array__': key, 'scalar': np.ndim(value) == 0 and not isinstance(value, np.ndarray)}
+    if isinstance(value, dict):
+        return {'__dict__': {name: _encode(item, f'{key}/{name}', arrays)
+                             for name, item in value.items()}}
+    if isinstance(value, (list, tuple)):
+        return [_encode(item, f'{key}/{i}', arrays) for i, item in enumerate(value)]
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    raise TypeError(f"Can't checkpoint {key} of type {type(value).__name__}")
+
+
+def _decode(value, arrays):
+    if isinstance(value, list):
+        return [_decode(item, arrays) for item in value]
+    if isinstance(value, dict):
+        if '__dtype__' in value:
+            return np.dtype(value['__dtype__'])
+        if '__array__' in value:
+            array = arrays[value['__array__']]
+            return array[()] if value['scalar'] else array.copy()
+        return {name: _decode(item, arrays) for name, item in value['__dict__'].items()}
+    return value
+
+
+# -- network state ---------------------------------------------------------------
+
+def network_state(net):
+    """Plain dict describing a network: class, weights, history, optimizer"""
+    if isinstance(net, (SimpleNetwork, NonlinearNetwork)):
+        state = {'w1': net.w1, 'w2': net.w2}
+        if isinstance(net, NonlinearNetwork):
+            state['activation'] = net.activation
+    elif isinstance(net, RegressionNetwork):
+        state = {'w': net.w, 'b': net.b, 'fused': net.fused, 'dtype': net.dtype}
+    elif isinstance(net, MLP):
+        state = {'layers': [{'W': layer.W, 'b': layer.b, 'activation': layer.activation,
+                             'train_weights': layer.train_weights,
+                             'train_bias': layer.train_bias} for layer in net.layers]}
+    else:
+        raise TypeError(f"Don't know how to checkpoint {type(net).__name__}")
+    state['class'] = type(net).__name__
+    state['history'] = net.history.state()
+    optimizer = net.optimizer
+    state['optimizer'] = None if optimizer is None else {
+        'class': type(optimizer).__name__, 'state': optimizer.state()}
+    return state
+
+
+def network_from_state(state):
+    """Rebuild the network network_state() described"""
+    history = History.from_state(state['history'])
+    optimizer = state['optimizer']
+    if optimizer is not None:
+        optimizer = _OPTIMIZER_CLASSES[optimizer['class']].from_state(optimizer['state'])
+
+    name = state['class']
+    if name in ('SimpleNetwork', 'NonlinearNetwork'):
+        kwargs = {'activation': state['activation']} if name == 'NonlinearNetwork' else {}
+        net = (SimpleNetwork if name == 'SimpleNetwork' else NonlinearNetwork)(
+            state['w1'], state['w2'], history=History.off(), optimizer=optimizer, **kwargs)
+    elif name == 'RegressionNetwork':
+        # __init__ draws random starting weights; don't let that move numpy's global state
+        numpy_global = np.random.get_state()
+        net = RegressionNetwork(history=History.off(), optimizer=optimizer, fused=state['fused'],
+                                dtype=state['dtype'])
+        np.random.set_state(numpy_global)
+        net.w, net.b = state['w'], state['b']
+    elif name == 'MLP':
+        layers = []
+        for layer in state['layers']:
+            W, b = layer['W'], layer['b']
+            layers.append(Dense(W.shape[0], W.shape[1], layer['activation'], weights=W, bias=b,
+                                train_weights=layer['train_weights'],
+                                train_bias=layer['train_bias'], dtype=W.dtype))
+        net = MLP(layers, history=History.off(), optimizer=optimizer)
+    else:
+        raise ValueError(f"Unknown network class '{name}' in checkpoint")
+    net.history = history
+    return net
+
+
+# -- files -----------------------------------------------------------------------
+
+def save_checkpoint(path, net, step=0, rngs=None, extra=None):
+    """
+    Write a checkpoint atomically.
+
+    Args:
+        path: File to write (.npz)
+        net: Any of the network classes
+        step: Steps trained so far
+        rngs: Optional dict of name -> np.random.Generator to save
+        extra: Optional JSON-friendly dict (e.g. settings) stored alongside
+    """
+    arrays = {}
+    meta = {
+        'version': FORMAT_VERSION,
+        'step': step,
+        'network': _encode(network_state(net), 'network', arrays),
+        'numpy_global': _encode(list(np.random.get_state()), 'numpy_global', arrays),
+        'rngs': {name: _encode(rng.bit_generator.state, f'rngs/{name}', arrays)
+                 for name, rng in (rngs or {}).items()},
+        'extra': extra,
+    }
+    arrays['__meta__'] = np.frombuffer(json.dumps(meta).encode(), dtype=np.uint8)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    handle, temp_path = tempfile.mkstemp(prefix='.checkpoint-', suffix='.npz', dir=directory)
+    try:
+        with os.fdopen(handle, 'wb') as f:
+            np.savez(f, **arrays)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp makes the file private (0600); give it the mode a plain open() would
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(temp_path, 0o666 & ~umask)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+    return path
+
+
+def load_checkpoint(path):
+    """
+    Read a checkpoint without touching any random state.
+
+    Returns:
+        dict with 'network', 'step', 'numpy_global', 'rngs' and 'extra'
+    """
+    with np.load(path, allow_pickle=False) as data:
+        arrays = {name: data[name] for name in data.files}
+    meta = json.loads(arrays.pop('__meta__').tobytes().decode())
+    if meta['version'] != FORMAT_VERSION:
+        raise ValueError(f"Checkpoint format {meta['version']} isn't supported")
+    return {
+        'network': network_from_state(_decode(meta['network'], arrays)),
+        'step': meta['step'],
+        'numpy_global': _decode(meta['numpy_global'], arrays),
+        'rngs': {name: _decode(state, arrays) for name, state in meta['rngs'].items()},
+        'extra': meta['extra'],
+    }
+
+
+def resume(path, rngs=None):
+    """
+    Load a checkpoint and put every random state back where it was.
+
+    Args:
+        rngs: Dict of name -> Generator to restore in place (same names as saved)
+
+    Returns:
+        (network, step)
+    """
+    checkpoint = load_checkpoint(path)
+    np.random.set_state(tuple(checkpoint['numpy_global']))
+    for name, rng in (rngs or {}).items():
+        rng.bit_generator.state = checkpoint['rngs'][name]
+    return checkpoint['network'], checkpoint['step']
+
+
+class Checkpointer:
+    """
+    A train() callback that saves a checkpoint every `every` steps.
+
+    Args:
+        path: Checkpoint file
+        every: Steps between saves
+        start: Steps already done before this run (when resuming)
+        rngs: Generators to save with each checkpoint
+    """
+
+    def __init__(self, path, every=100, start=0, rngs=None):
+        self.path = path
+        self.every = every
+        self.start = start
+        self.rngs = rngs
+
+    def __call__(self, step, net, error):
+        done = self.start + step + 1
+        if done % self.every == 0:
+            save_checkpoint(self.path, net, done, self.rngs)
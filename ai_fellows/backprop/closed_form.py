@@ -0,0 +1,172 @@
+"""
+Jump straight to any step of SimpleNetwork's gradient descent.
+
+For the worksheet network, y = 2*(3x + w1) + w2, the gradients are
+
+    dE/dw1 = 2 r,   dE/dw2 = r,    where r = y - target
+
+so with g = (2, 1) one gradient descent step is w <- w - lr * r * g. That
+changes the output by -lr * r * (g . g) = -5 lr r, so the residual just gets
+multiplied by the same number every step:
+
+    r_k = q^k r_0,   q = 1 - 5 lr
+
+Written as a matrix, the update of (w1, w2) is the affine map w <- A w + c
+with A = I - lr g g^T. A has two eigenvectors: g itself (eigenvalue q) and
+(1, -2), along which the output doesn't change (eigenvalue 1). So
+A^k = I - (1 - q^k) g g^T / 5, and the weights after k steps are
+
+    w_k = w_0 - g r_0 (1 - q^k) / 5
+
+which costs the same for k = 10 as for k = 10^12, and works elementwise on
+arrays of starting weights, learning rates, inputs and step counts at once.
+
+It also says exactly when training blows up: the residual shrinks when
+|q| < 1, i.e. 0 < lr < 2/5. At lr = 2/5 it flips sign forever without
+shrinking, and above that it grows. divergence_threshold() returns 2/5
+(it doesn't depend on x, target or the starting weights).
+
+jump_matrix_power() gets the same numbers from the 3x3 homogeneous update
+matrix raised to the k-th power, and train_iteratively() from running
+SimpleNetwork.train_step k times; cross_check() compares all three.
+closed_form_steps_to_tolerance() likewise answers training.steps_to_tolerance()
+without a training loop.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+from .history import History
+from .networks import SimpleNetwork, WORKSHEET_X, WORKSHEET_TARGET
+
+# dy/dw1 and dy/dw2 for y = 2*(3x + w1) + w2
+GRADIENT = np.array([2.0, 1.0])
+_GRADIENT_SQUARED = float(GRADIENT @ GRADIENT)     # g . g = 5
+
+
+class Trajectory(NamedTuple):
+    """Weights, output and error after k steps, each shaped like the broadcast inputs"""
+    w1: np.ndarray
+    w2: np.ndarray
+    y: np.ndarray
+    error: np.ndarray
+
+
+def residual(w1, w2, x=WORKSHEET_X, target=WORKSHEET_TARGET):
+    """y - target for the worksheet network"""
+    return 2 * (3 * np.asarray(x) + w1) + w2 - target
+
+
+def convergence_factor(learning_rate):
+    """q = 1 - 5 lr: the residual is multiplied by q every step"""
+    return 1 - _GRADIENT_SQUARED * np.asarray(learning_rate, dtype=float)
+
+
+def divergence_threshold():
+    """Learning rate 2 / (g . g) = 0.4 at and above which training never converges"""
+    return 2 / _GRADIENT_SQUARED
+
+
+def jump(steps, w1=1.0, w2=3.0, learning_rate=0.1, x=WORKSHEET_X, target=WORKSHEET_TARGET):
+    """
+    The state after `steps` gradient descent steps, in closed form.
+
+    Every argument can be an array; they broadcast against each other, e.g.
+    steps=np.arange(1001)[:, None] with learning_rate=np.linspace(0.01, 0.5, 50)
+    gives the whole (1001, 50) trajectory grid in one go.
+
+    Args:
+        steps: Number of steps (integers >= 0)
+        w1, w2: Starting weights
+        learning_rate: Step size
+        x, target: Training example (the worksheet's by default)
+
+    Returns:
+        Trajectory with the weights after `steps` steps and the output and
+        error at those weights. (After k train_steps, net.error still holds
+        the error *before* the last update, i.e. the error of step k - 1.)
+    """
+    steps = np.asarray(steps)
+    r0 = residual(w1, w2, x, target)
+    with np.errstate(over='ignore', invalid='ignore'):
+        decay = np.power(convergence_factor(learning_rate), steps)
+        moved = r0 * (1 - decay) / _GRADIENT_SQUARED
+        r = r0 * decay
+        w1_k = w1 - GRADIENT[0] * moved
+        w2_k = w2 - GRADIENT[1] * moved
+        return Trajectory(w1_k, w2_k, r + target, 0.5 * r**2)
+
+
+def closed_form_steps_to_tolerance(tolerance=1e-6, w1=1.0, w2=3.0, learning_rate=0.1,
+                                   x=WORKSHEET_X, target=WORKSHEET_TARGET):
+    """
+    training.steps_to_tolerance() without training: the number of
+    train_step calls until the error returned is within tolerance.
+
+    Returns:
+        int array shaped like the broadcast inputs, -1 where it never gets there
+    """
+    r0 = residual(w1, w2, x, target)
+    error0 = 0.5 * np.asarray(r0, dtype=float) ** 2
+    shrink = np.abs(convergence_factor(learning_rate))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # error_k = error_0 q^(2k) <= tolerance
+        k = np.ceil(np.log(tolerance / error0) / (2 * np.log(shrink)))
+    # q = 0 (lr = 0.2) lands on the target in one step; log(0) would say 0
+    k = np.where(shrink == 0, 1, k)
+    k = np.where(error0 <= tolerance, 0, k)
+    never = (error0 > tolerance) & (shrink >= 1)
+    # train_step returns the error before its update, so error_k comes from step k + 1
+    return np.where(never, -1, np.nan_to_num(k, nan=0, posinf=0) + 1).astype(int)[()]
+
+
+def update_matrix(learning_rate=0.1, x=WORKSHEET_X, target=WORKSHEET_TARGET):
+    """
+    One step as a 3x3 matrix acting on (w1, w2, 1): [[A, c], [0, 0, 1]] with
+    A = I - lr g g^T and c = -lr g (6x - target).
+    """
+    matrix = np.eye(3)
+    matrix[:2, :2] -= learning_rate * np.outer(GRADIENT, GRADIENT)
+    matrix[:2, 2] = -learning_rate * GRADIENT * (6 * x - target)
+    return matrix
+
+
+def jump_matrix_power(steps, w1=1.0, w2=3.0, learning_rate=0.1, x=WORKSHEET_X, target=WORKSHEET_TARGET):
+    """jump() for scalars via np.linalg.matrix_power (O(log steps) matrix products)"""
+    w1_k, w2_k, _ = np.linalg.matrix_power(update_matrix(learning_rate, x, target), int(steps)) @ [w1, w2, 1.0]
+    r = residual(w1_k, w2_k, x, target)
+    return Trajectory(w1_k, w2_k, r + target, 0.5 * r**2)
+
+
+def train_iteratively(steps, w1=1.0, w2=3.0, learning_rate=0.1, x=WORKSHEET_X, target=WORKSHEET_TARGET):
+    """The same state the slow way: `steps` calls to SimpleNetwork.train_step"""
+    net = SimpleNetwork(w1, w2, history=History.off())
+    for _ in range(int(steps)):
+        net.train_step(x, target, learning_rate=learning_rate)
+    y, error = net.forward(x, target)
+    return Trajectory(net.w1, net.w2, y, error)
+
+
+def cross_check(steps=100, w1=1.0, w2=3.0, learning_rates=(0.01, 0.1, 0.2, 0.3, 0.39),
+                x=WORKSHEET_X, target=WORKSHEET_TARGET):
+    """
+    Largest relative difference between jump(), jump_matrix_power() and
+    train_iteratively() over a few learning rates. It is at the level of
+    rounding error (~1e-12) for converging learning rates.
+
+    Returns:
+        dict of learning rate -> {'matrix_power': diff, 'iterative': diff}
+    """
+    def difference(a, b):
+        scale = max(1.0, max(abs(float(v)) for v in a))
+        return max(abs(float(u) - float(v)) for u, v in zip(a, b)) / scale
+
+    report = {}
+    for learning_rate in learning_rates:
+        closed = jump(steps, w1, w2, learning_rate, x, target)
+        report[learning_rate] = {
+            'matrix_power': difference(closed, jump_matrix_power(steps, w1, w2, learning_rate, x, target)),
+            'iterative': difference(closed, train_iteratively(steps, w1, w2, learning_rate, x, target)),
+        }
+    return report
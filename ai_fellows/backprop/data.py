@@ -0,0 +1,229 @@
+"""
+Streaming mini-batches for datasets that don't fit in memory.
+
+Part 5 trains on 20 points held in RAM. The same RegressionNetwork can learn
+from a multi-GB file if it only ever sees one mini-batch at a time:
+
+    data = ArrayDataset.from_npy('x.npy', 'y.npy')     # memory-mapped, nothing loaded yet
+    loader = BatchLoader(data, batch_size=256, seed=0)
+    train_batches(RegressionNetwork(), loader, epochs=3, learning_rate=0.01)
+
+Rows are read in contiguous blocks (fast, sequential disk access), blocks are
+visited in random order, and rows are shuffled within each block. Only a
+block plus a few prefetched batches are ever in memory, so memory depends on
+batch_size and block_size, not on the size of the file.
+
+Batches are assembled on a background thread while the network trains on
+the previous one.
+"""
+
+import queue
+import threading
+from itertools import islice
+
+import numpy as np
+
+
+class ArrayDataset:
+    """
+    Inputs and targets as arrays with one row per sample.
+
+    The arrays can be ordinary numpy arrays or read-only memory maps; rows
+    are only copied into memory when a block is read.
+    """
+
+    def __init__(self, x, y, dtype=np.float64):
+        if len(x) != len(y):
+            raise ValueError(f"x has {len(x)} rows but y has {len(y)}")
+        self.x = x
+        self.y = y
+        self.dtype = dtype
+
+    @classmethod
+    def from_npy(cls, x_path, y_path, dtype=np.float64):
+        """Memory-map two .npy files (nothing is read until batches are drawn)"""
+        return cls(np.load(x_path, mmap_mode='r'), np.load(y_path, mmap_mode='r'), dtype)
+
+    def __len__(self):
+        return len(self.x)
+
+    def blocks(self, block_size, rng=None):
+        """Yield (x, y) blocks of contiguous rows, in random order if rng is given"""
+        starts = np.arange(0, len(self), block_size)
+        if rng is not None:
+            rng.shuffle(starts)
+        for start in starts:
+            stop = start + block_size
+            yield (np.asarray(self.x[start:stop], dtype=self.dtype),
+                   np.asarray(self.y[start:stop], dtype=self.dtype))
+
+
+class CSVDataset:
+    """
+    A CSV file read front to back in chunks.
+
+    Text can't be read at random positions, so blocks always come in file
+    order and shuffling only mixes rows within a block. For a full shuffle,
+    convert the file once with csv_to_npy() and use ArrayDataset.from_npy().
+
+    Args:
+        path: CSV file
+        x_columns: Column index (or list of indices) holding the inputs
+        y_columns: Column index (or list of indices) holding the targets
+        delimiter: Field separator
+        skip_header: Number of lines to skip at the top of the file
+    """
+
+    def __init__(self, path, x_columns=0, y_columns=1, delimiter=',', skip_header=1,
+                 dtype=np.float64):
+        self.path = path
+        self.x_columns = x_columns
+        self.y_columns = y_columns
+        self.delimiter = delimiter
+        self.skip_header = skip_header
+        self.dtype = dtype
+
+    def blocks(self, block_size, rng=None):
+        """Yield (x, y) blocks of block_size rows in file order"""
+        with open(self.path) as f:
+            for _ in range(self.skip_header):
+                next(f, None)
+            while True:
+                lines = list(islice(f, block_size))
+                if not lines:
+                    return
+                table = np.loadtxt(lines, delimiter=self.delimiter, dtype=self.dtype, ndmin=2)
+                yield table[:, self.x_columns], table[:, self.y_columns]
+
+
+def csv_to_npy(csv_path, x_path, y_path, x_columns=0, y_columns=1, delimiter=',',
+               skip_header=1, block_size=1_000_000, dtype=np.float64):
+    """
+    Convert a CSV file to two .npy files without loading it all at once.
+
+    The file is read twice: once to count rows, once to fill memory-mapped
+    output arrays block by block.
+
+    Returns:
+        Number of rows written
+    """
+    with open(csv_path) as f:
+        n_rows = sum(1 for line in f if line.strip()) - skip_header
+
+    source = CSVDataset(csv_path, x_columns, y_columns, delimiter, skip_header, dtype)
+    x_out = y_out = None
+    row = 0
+    for x, y in source.blocks(block_size):
+        if x_out is None:
+            x_out = np.lib.format.open_memmap(x_path, mode='w+', dtype=dtype,
+                                              shape=(n_rows,) + x.shape[1:])
+            y_out = np.lib.format.open_memmap(y_path, mode='w+', dtype=dtype,
+                                              shape=(n_rows,) + y.shape[1:])
+        x_out[row:row + len(x)] = x
+        y_out[row:row + len(y)] = y
+        row += len(x)
+    if x_out is not None:
+        x_out.flush()
+        y_out.flush()
+    return row
+
+
+class BatchLoader:
+    """
+    Iterate over shuffled (x_batch, y_batch) mini-batches; one pass is one epoch.
+
+    Args:
+        dataset: ArrayDataset or CSVDataset
+        batch_size: Rows per batch
+        shuffle: Shuffle block order (ArrayDataset only) and rows within blocks
+        block_size: Rows read from the file at a time (default 64 batches)
+        seed: Seed for shuffling; each epoch continues the same random stream
+        prefetch: Batches prepared ahead on the background thread (0 = no thread)
+        drop_last: Skip the final, smaller batch of each epoch
+    """
+
+    def __init__(self, dataset, batch_size=256, shuffle=True, block_size=None, seed=None,
+                 prefetch=4, drop_last=False):
+        self.dataset = dataset
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.block_size = block_size or 64 * batch_size
+        self.rng = np.random.default_rng(seed)
+        self.prefetch = prefetch
+        self.drop_last = drop_last
+
+    def __len__(self):
+        """Batches per epoch (needs a dataset with a known length)"""
+        n = len(self.dataset)
+        return n // self.batch_size if self.drop_last else -(-n // self.batch_size)
+
+    def _batches(self):
+        """Cut blocks into batches; leftover rows carry over into the next block"""
+        rng = self.rng if self.shuffle else None
+        x_left = y_left = None
+        for x, y in self.dataset.blocks(self.block_size, rng):
+            if rng is not None:
+                order = rng.permutation(len(x))
+                x, y = x[order], y[order]
+            if x_left is not None:
+                x = np.concatenate((x_left, x))
+                y = np.concatenate((y_left, y))
+            full = len(x) - len(x) % self.batch_size
+            for start in range(0, full, self.batch_size):
+                yield x[start:start + self.batch_size], y[start:start + self.batch_size]
+            x_left, y_left = (x[full:], y[full:]) if full < len(x) else (None, None)
+        if x_left is not None and not self.drop_last:
+            yield x_left, y_left
+
+    def __iter__(self):
+        if self.prefetch:
+            return _prefetched(self._batches(), self.prefetch)
+        return self._batches()
+
+
+class _Failure:
+    """An exception raised on the loader thread, handed over to the consumer"""
+
+    def __init__(self, exc):
+        self.exc = exc
+
+
+_DONE = object()
+
+
+def _prefetched(batches, depth):
+    """Run the batches generator on a daemon thread, `depth` items ahead"""
+    ready = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def put(item):
+        # Wake up regularly so the thread exits if the consumer stopped early
+        while not stop.is_set():
+            try:
+                ready.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def worker():
+        try:
+            for batch in batches:
+                if not put(batch):
+                    return
+            put(_DONE)
+        except BaseException as exc:
+            put(_Failure(exc))
+
+    thread = threading.Thread(target=worker, name='BatchLoader', daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = ready.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Failure):
+                raise item.exc
+            yield item
+    finally:
+        stop.set()
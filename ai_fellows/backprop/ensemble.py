@@ -0,0 +1,172 @@
+"""
+Train thousands of networks at once, one per setting in a sweep.
+
+The worksheet networks only use elementwise arithmetic, so a single network
+object can hold arrays of weights and learning rates: every array element
+is a separate network (an ensemble member) and one train_step moves all of
+them. Members that converge or blow up are dropped from the arrays, so the
+loop only keeps paying for the ones still training.
+
+    lr, w1 = np.meshgrid(np.linspace(0.01, 0.3, 100), np.linspace(-10, 10, 100))
+    result = train_ensemble(SimpleNetwork, {'w1': w1, 'w2': 3.0}, learning_rate=lr)
+    result.steps      # (100, 100) steps to converge, -1 if it never did
+    result.status     # CONVERGED, DIVERGED or RUNNING (out of steps)
+
+RegressionNetwork members all train on the same batch, and the loss of
+y = w*x + b only depends on the batch through a few averages (mean x, x^2,
+y, y^2, x*y), so its ensemble is computed from those: each step costs the
+same whatever the batch size.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+from .history import History
+from .networks import RegressionNetwork, WORKSHEET_X, WORKSHEET_TARGET
+
+RUNNING = 0
+CONVERGED = 1
+DIVERGED = 2
+
+
+class EnsembleResult(NamedTuple):
+    """Per-member results, each shaped like the broadcast inputs"""
+    weights: dict       # name -> final weights (where each member stopped)
+    error: np.ndarray   # error at those weights
+    steps: np.ndarray   # train_step calls until error was within tolerance, -1 if never
+    status: np.ndarray  # RUNNING, CONVERGED or DIVERGED
+
+
+class LinearEnsemble:
+    """
+    Many RegressionNetworks (arrays w and b) on one shared batch.
+
+    The loss, mean((w*x + b - y)^2), and its gradients are written in terms
+    of batch averages computed once, so no (members x batch) array is ever
+    built. Gradients follow RegressionNetwork's convention: mean(r*x), mean(r).
+    """
+
+    def __init__(self, w, b, x_batch, y_batch):
+        self.w = w
+        self.b = b
+        x = np.asarray(x_batch, dtype=float).ravel()
+        y = np.asarray(y_batch, dtype=float).ravel()
+        self.x_mean = x.mean()
+        self.xx_mean = x @ x / len(x)
+        self.y_mean = y.mean()
+        self.yy_mean = y @ y / len(y)
+        self.xy_mean = x @ y / len(x)
+
+    def _gradients(self, w, b):
+        """mean(r*x) and mean(r) with r = w*x + b - y"""
+        return (w * self.xx_mean + b * self.x_mean - self.xy_mean,
+                w * self.x_mean + b - self.y_mean)
+
+    def loss(self, w, b):
+        """mean((w*x + b - y)^2) for every member"""
+        dL_dw, dL_db = self._gradients(w, b)
+        # mean(r^2) = w*mean(r*x) + b*mean(r) - (w*mean(x*y) + b*mean(y) - mean(y^2))
+        return w * dL_dw + b * dL_db - (w * self.xy_mean + b * self.y_mean - self.yy_mean)
+
+    def train_step(self, x_batch, y_batch, learning_rate=0.01):
+        """
+        One gradient descent step for every member; returns the loss after
+        it, like RegressionNetwork.train_step
+        """
+        dL_dw, dL_db = self._gradients(self.w, self.b)
+        self.w = self.w - learning_rate * dL_dw
+        self.b = self.b - learning_rate * dL_db
+        return self.loss(self.w, self.b)
+
+
+def train_ensemble(network_class, weights, learning_rate, x=WORKSHEET_X, target=WORKSHEET_TARGET,
+                   steps=1000, tolerance=1e-8, best_error=0.0, diverge_at=1e12):
+    """
+    Train one network per element of the broadcast weight and learning-rate arrays.
+
+    Args:
+        network_class: SimpleNetwork, NonlinearNetwork or RegressionNetwork
+        weights: Dict of starting weights, one per network_class.weight_names:
+            {'w1': ..., 'w2': ...} or {'w': ..., 'b': ...}; scalars and
+            arrays broadcast together
+        learning_rate: Scalar or array, broadcast with the weights
+        x, target: Training input and target (x_batch, y_batch for regression)
+        steps: Maximum number of steps
+        tolerance: A member has converged once the error its train_step
+            returns is <= best_error + tolerance. Steps are counted the way
+            training.steps_to_tolerance() counts them for one network (the
+            worksheet networks return the error before their update,
+            RegressionNetwork the loss after it)
+        best_error: Lowest reachable error (0 for the worksheet)
+        diverge_at: A member has diverged once its error passes this (or is inf/nan)
+
+    Returns:
+        EnsembleResult with arrays shaped like the broadcast inputs
+    """
+    if steps < 1:
+        raise ValueError("steps must be at least 1")
+    names = list(network_class.weight_names)
+    if set(weights) != set(names):
+        raise ValueError(f"{network_class.__name__} needs weights {names}, not {list(weights)}")
+    arrays = np.broadcast_arrays(*(np.asarray(weights[name], dtype=float) for name in names),
+                                 np.asarray(learning_rate, dtype=float))
+    shape = arrays[0].shape
+    flat = [a.ravel().copy() for a in arrays]
+    rate = flat.pop()
+
+    # RegressionNetwork judges the weights after each update, the others before it
+    after_update = issubclass(network_class, RegressionNetwork)
+    if after_update:
+        net = LinearEnsemble(**dict(zip(names, flat)), x_batch=x, y_batch=target)
+    else:
+        net = network_class(**dict(zip(names, flat)), history=History.off())
+
+    size = rate.size
+    final = {name: np.full(size, np.nan) for name in names}
+    error_out = np.full(size, np.nan)
+    steps_out = np.full(size, -1)
+    status = np.full(size, RUNNING, dtype=np.int8)
+    members = np.arange(size)   # which member each position in the arrays belongs to
+
+    with np.errstate(over='ignore', invalid='ignore'):
+        for step in range(steps):
+            judged = [getattr(net, name) for name in names]
+            error = np.broadcast_to(net.train_step(x, target, learning_rate=rate), rate.shape)
+            if after_update:
+                judged = [getattr(net, name) for name in names]
+
+            converged = error <= best_error + tolerance
+            diverged = ~np.isfinite(error) | (error > diverge_at)
+            done = converged | diverged
+            if done.any():
+                # Record finished members at the weights where they were judged
+                finished = members[done]
+                for name, value in zip(names, judged):
+                    final[name][finished] = np.broadcast_to(value, rate.shape)[done]
+                error_out[finished] = error[done]
+                steps_out[finished[converged[done]]] = step + 1
+                status[finished] = np.where(converged[done], CONVERGED, DIVERGED)
+
+                # Drop them so later steps only compute the members still training
+                keep = ~done
+                for name in names:
+                    setattr(net, name, np.broadcast_to(getattr(net, name), rate.shape)[keep])
+                rate = rate[keep]
+                members = members[keep]
+                if not members.size:
+                    break
+
+        if members.size:
+            # Out of steps: report the weights and error from the last step
+            keep = ~done
+            for name, value in zip(names, judged):
+                final[name][members] = np.broadcast_to(value, keep.shape)[keep]
+            error_out[members] = error[keep]
+
+    return EnsembleResult(
+        weights={name: values.reshape(shape) for name, values in final.items()},
+        error=error_out.reshape(shape),
+        steps=steps_out.reshape(shape),
+        status=status.reshape(shape),
+    )
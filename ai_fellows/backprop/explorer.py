@@ -0,0 +1,183 @@
+"""
+Slider-driven weight explorer for Part 3.
+
+The figure and all of its artists are built once; moving a slider only
+updates artist data. Error curves come from a cached landscape grid over a
+window of weights, so:
+
+- the learning-rate slider only moves the gradient arrows
+- a weight slider reuses the cached grid until the weight leaves its window
+
+Uses matplotlib's own Slider widget, so it works in any interactive backend
+(including `%matplotlib widget` in Jupyter) without extra packages.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from .history import History
+from .networks import SimpleNetwork, WORKSHEET_X, WORKSHEET_TARGET
+from .landscape import landscape_grid
+
+
+@lru_cache(maxsize=32)
+def cached_landscape(network_class, w1_center, w2_center, span, resolution, x, target):
+    """
+    landscape_grid() memoized on (network type, weight window, resolution).
+
+    The arrays are marked read-only because every caller shares them.
+    """
+    land = landscape_grid(network_class, w1_center, w2_center, span, resolution, x, target)
+    for array in land:
+        array.flags.writeable = False
+    return land
+
+
+def window_center(value, span):
+    """
+    Snap a weight to the centre of its window.
+
+    Centres sit on a grid of span/2, so the window only moves once the weight
+    has drifted a quarter-window from the centre and the weight always stays
+    well inside the window.
+    """
+    step = span / 2
+    return round(value / step) * step
+
+
+def _interpolated_slice(grid_axis, fixed_value, rows):
+    """Blend the two grid rows either side of fixed_value"""
+    position = np.interp(fixed_value, grid_axis, np.arange(len(grid_axis)))
+    lower = min(int(position), len(grid_axis) - 2)
+    frac = position - lower
+    return (1 - frac) * rows[lower] + frac * rows[lower + 1]
+
+
+class WeightExplorer:
+    """
+    Interactive version of explore_network() with w1, w2 and learning-rate sliders.
+
+    Usage:
+        explorer = WeightExplorer()
+        explorer.show()
+    """
+
+    def __init__(self, network_class=SimpleNetwork, w1=1.0, w2=3.0, learning_rate=0.1,
+                 x=WORKSHEET_X, target=WORKSHEET_TARGET, span=5.0, resolution=401):
+        from matplotlib.widgets import Slider
+        from .plots import _pyplot
+
+        plt = _pyplot()
+        self.network_class = network_class
+        self.x = x
+        self.target = target
+        self.span = span
+        self.resolution = resolution
+        self.w1 = w1
+        self.w2 = w2
+        self.learning_rate = learning_rate
+        self._window = None
+
+        self.fig, axes = plt.subplots(1, 3, figsize=(16, 5))
+        self.fig.subplots_adjust(bottom=0.3, wspace=0.3)
+        self.ax_bar, self.ax_w2, self.ax_w1 = axes
+
+        # Plot 1: Current state
+        self.bars = self.ax_bar.bar(['Current\nOutput', 'Target\nOutput'], [0, target],
+                                    color=['orange', 'blue'], alpha=0.7,
+                                    edgecolor='black', linewidth=2)
+        self.ax_bar.axhline(target, color='blue', linestyle='--', linewidth=2, alpha=0.5)
+        self.ax_bar.set_ylabel('Value', fontsize=12)
+        self.ax_bar.set_title('Network Prediction vs Target', fontsize=13, fontweight='bold')
+        self.output_label = self.ax_bar.text(0, 0, '', ha='center', fontsize=11, fontweight='bold')
+        self.ax_bar.text(1, target + 1, f'{target}', ha='center', fontsize=11, fontweight='bold')
+
+        # Plots 2 and 3: Error curves, current position and gradient arrow
+        self.curve_w2, self.marker_w2, self.arrow_w2 = self._setup_curve(self.ax_w2, 'w2', 'r')
+        self.curve_w1, self.marker_w1, self.arrow_w1 = self._setup_curve(self.ax_w1, 'w1', 'b')
+
+        # Sliders
+        self.slider_w1 = Slider(self.fig.add_axes([0.15, 0.14, 0.7, 0.03]), 'w1',
+                                w1 - 10, w1 + 10, valinit=w1)
+        self.slider_w2 = Slider(self.fig.add_axes([0.15, 0.09, 0.7, 0.03]), 'w2',
+                                w2 - 10, w2 + 10, valinit=w2)
+        self.slider_lr = Slider(self.fig.add_axes([0.15, 0.04, 0.7, 0.03]), 'learning rate',
+                                0.0, 1.0, valinit=learning_rate)
+        self.slider_w1.on_changed(lambda value: self.set_weights(w1=value))
+        self.slider_w2.on_changed(lambda value: self.set_weights(w2=value))
+        self.slider_lr.on_changed(self.set_learning_rate)
+
+        self.set_weights(w1, w2)
+
+    @staticmethod
+    def _setup_curve(ax, name, color):
+        curve, = ax.plot([], [], f'{color}-', linewidth=2)
+        marker, = ax.plot([], [], f'{color}o', markersize=12, label='Current position')
+        arrow = ax.annotate('', xy=(0, 0), xytext=(0, 0),
+                            arrowprops=dict(arrowstyle='->', lw=2, color='green'))
+        ax.set_xlabel(f'{name} value', fontsize=12)
+        ax.set_ylabel('Error', fontsize=12)
+        ax.legend(fontsize=10)
+        ax.grid(True, alpha=0.3)
+        return curve, marker, arrow
+
+    def set_weights(self, w1=None, w2=None):
+        """Move to new weights, reusing the cached landscape when possible"""
+        if w1 is not None:
+            self.w1 = w1
+        if w2 is not None:
+            self.w2 = w2
+
+        net = self.network_class(w1=self.w1, w2=self.w2, history=History.off())
+        y_pred, self.error = net.forward(self.x, self.target)
+        self.dE_dw1, self.dE_dw2 = net.backward()
+
+        window = (window_center(self.w1, self.span), window_center(self.w2, self.span))
+        land = cached_landscape(self.network_class, window[0], window[1],
+                                self.span, self.resolution, self.x, self.target)
+        w1_axis = land.w1[0]
+        w2_axis = land.w2[:, 0]
+
+        # Error vs w2 at the current w1 (a column of the grid), and vice versa
+        errors_w2 = _interpolated_slice(w1_axis, self.w1, land.error.T)
+        errors_w1 = _interpolated_slice(w2_axis, self.w2, land.error)
+        self.curve_w2.set_data(w2_axis, errors_w2)
+        self.curve_w1.set_data(w1_axis, errors_w1)
+        if window != self._window:
+            self.ax_w2.set_xlim(w2_axis[0], w2_axis[-1])
+            self.ax_w1.set_xlim(w1_axis[0], w1_axis[-1])
+            self._window = window
+        self.ax_w2.set_ylim(0, max(errors_w2.max(), self.error) * 1.05 + 1e-9)
+        self.ax_w1.set_ylim(0, max(errors_w1.max(), self.error) * 1.05 + 1e-9)
+        self.marker_w2.set_data([self.w2], [self.error])
+        self.marker_w1.set_data([self.w1], [self.error])
+
+        # Prediction bar
+        self.bars[0].set_height(y_pred)
+        self.bars[0].set_color('orange' if abs(y_pred - self.target) > 1 else 'green')
+        self.output_label.set_position((0, y_pred + 1))
+        self.output_label.set_text(f'{y_pred:.2f}')
+        self.ax_bar.set_ylim(0, max(25, y_pred + 2))
+
+        self.set_learning_rate(self.learning_rate)
+
+    def set_learning_rate(self, learning_rate):
+        """Redraw only the gradient arrows and titles"""
+        self.learning_rate = learning_rate
+        for arrow, weight, grad in ((self.arrow_w2, self.w2, self.dE_dw2),
+                                    (self.arrow_w1, self.w1, self.dE_dw1)):
+            arrow.xy = (weight - learning_rate * grad * 10, self.error)
+            arrow.set_position((weight, self.error))
+        self.ax_w2.set_title(f'Error Landscape for w2\n(dE/dw2 = {self.dE_dw2:.2f}, '
+                             f'next w2 = {self.w2 - learning_rate * self.dE_dw2:.2f})',
+                             fontsize=13, fontweight='bold')
+        self.ax_w1.set_title(f'Error Landscape for w1\n(dE/dw1 = {self.dE_dw1:.2f}, '
+                             f'next w1 = {self.w1 - learning_rate * self.dE_dw1:.2f})',
+                             fontsize=13, fontweight='bold')
+        self.fig.canvas.draw_idle()
+
+    def show(self):
+        """Open the explorer window"""
+        import matplotlib.pyplot as plt
+        plt.show()
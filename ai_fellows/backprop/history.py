@@ -0,0 +1,180 @@
+"""
+Training history stored in preallocated numpy arrays.
+
+Appending Python floats to lists costs memory on very long runs: every
+value is a separate boxed object. History keeps one float array per field
+instead (struct-of-arrays), can keep only every `stride`-th training step,
+and can cap the stored steps at `max_length` (a ring buffer that keeps the
+most recent ones).
+
+It still reads like the old dict of lists:
+
+    net.history['w1']          # numpy array of the recorded w1 values
+    len(net.history['error'])
+    net.history.steps('w1')    # the training step each value belongs to
+
+Networks call start() once with their starting values (step 0) and log()
+once per training step. log() writes each value straight into its field's
+array at the next free slot, so nothing is kept as a Python float in between.
+"""
+
+from collections.abc import Mapping
+
+import numpy as np
+
+from .profiling import HISTORY_PHASE, Profiled
+
+
+class History(Mapping, Profiled):
+    """
+    Struct-of-arrays training history.
+
+    Args:
+        stride: Keep every stride-th training step (1 keeps everything)
+        max_length: If set, keep only the most recent max_length steps
+        capacity: Starting number of rows; arrays double in size when full
+        dtype: Array dtype for every field
+
+    History.off() gives one with enabled = False, which records nothing.
+    """
+
+    PROFILED_METHODS = {'log': HISTORY_PHASE}
+
+    def __init__(self, stride=1, max_length=None, capacity=1024, dtype=np.float64):
+        if stride < 1:
+            raise ValueError("stride must be at least 1")
+        if max_length is not None and max_length < 1:
+            raise ValueError("max_length must be at least 1")
+        self.stride = stride
+        self.max_length = max_length
+        self.enabled = True
+        self.dtype = np.dtype(dtype)
+        self._capacity = capacity if max_length is None else min(capacity, max_length)
+        self.start(())
+
+    @classmethod
+    def off(cls):
+        """A History that ignores everything (for throwaway networks)"""
+        history = cls(capacity=1)
+        history.enabled = False
+        return history
+
+    def start(self, fields, **initial):
+        """
+        (Re)start recording.
+
+        Args:
+            fields: Names of the values passed to each log() call, in order
+            **initial: Values before training (step 0), e.g. w1=1.0, w2=3.0
+        """
+        if not self.enabled:
+            return
+        self.fields = tuple(fields)
+        self.initial = {field: value for field, value in initial.items()}
+        self._index = {field: i for i, field in enumerate(self.fields)}
+        self._set_data(np.empty((len(self.fields), self._capacity), dtype=self.dtype))
+        self._count = 0     # rows stored so far (including overwritten ones)
+        self._calls = 0     # log() calls so far (including skipped ones)
+
+    def _set_data(self, data):
+        """Use data as the (fields x rows) storage; _columns are its rows"""
+        self._data = data
+        self._columns = list(data)
+        self._size = data.shape[1]
+
+    def log(self, *values):
+        """Record one training step: one value per field, in `fields` order"""
+        if not self.enabled:
+            return
+        calls = self._calls + 1
+        self._calls = calls
+        if calls % self.stride:
+            return
+        count = self._count
+        # Ring buffer: row number r lives in slot r % max_length
+        slot = count if self.max_length is None else count % self.max_length
+        if slot >= self._size:
+            self._grow()
+        for column, value in zip(self._columns, values):
+            column[slot] = value
+        self._count = count + 1
+
+    def _grow(self):
+        """Double the arrays (up to max_length rows)"""
+        size = 2 * max(self._size, 1)
+        if self.max_length is not None:
+            size = min(size, self.max_length)
+        grown = np.empty((len(self.fields), size), dtype=self.dtype)
+        grown[:, :self._size] = self._data
+        self._set_data(grown)
+
+    def state(self):
+        """Everything needed to rebuild this History (see from_state)"""
+        if not self.enabled:
+            return {'off': True}
+        used = self._count if self.max_length is None else min(self._count, self.max_length)
+        return {
+            'stride': self.stride, 'max_length': self.max_length,
+            'dtype': self.dtype.str, 'capacity': self._capacity,
+            'fields': list(self.fields), 'initial': dict(self.initial),
+            'data': self._data[:, :used].copy(), 'count': self._count, 'calls': self._calls,
+        }
+
+    @classmethod
+    def from_state(cls, state):
+        """A History that carries on exactly where state() left off"""
+        if state.get('off'):
+            return cls.off()
+        history = cls(state['stride'], state['max_length'], state['capacity'],
+                      np.dtype(state['dtype']))
+        history.start(state['fields'], **state['initial'])
+        data = np.asarray(state['data'], dtype=history.dtype).reshape(len(history.fields), -1)
+        used = data.shape[1]
+        if used > history._size:
+            history._set_data(np.empty((len(history.fields), used), dtype=history.dtype))
+        history._data[:, :used] = data
+        history._count = state['count']
+        history._calls = state['calls']
+        return history
+
+    def _column(self, field):
+        """Stored rows of one field, oldest first"""
+        row = self._data[self._index[field]]
+        count = self._count
+        if self.max_length is None or count <= self.max_length:
+            return row[:count]
+        start = count % self.max_length
+        return np.concatenate((row[start:], row[:start]))
+
+    def __getitem__(self, field):
+        """The recorded values of field (its starting value first, if it has one)"""
+        if field not in self._index:
+            if field in self.initial:
+                return np.array([self.initial[field]], dtype=self.dtype)
+            raise KeyError(field)
+        column = self._column(field)
+        if field in self.initial:
+            return np.concatenate(([self.initial[field]], column))
+        return column
+
+    def steps(self, field):
+        """
+        The training step each value of field belongs to (0 = before training).
+
+        Use this as the x-axis when stride > 1 or when old steps were dropped.
+        """
+        stored = self._count if self.max_length is None else min(self._count, self.max_length)
+        steps = (np.arange(self._count - stored, self._count) + 1) * self.stride
+        if field in self.initial:
+            return np.concatenate(([0], steps))
+        return steps
+
+    def __iter__(self):
+        return iter(dict.fromkeys(self.fields + tuple(self.initial)))
+
+    def __len__(self):
+        return len(set(self.fields) | set(self.initial))
+
+    def __repr__(self):
+        sizes = ', '.join(f"{field}: {len(self[field])}" for field in self)
+        return f"History({sizes}, stride={self.stride}, max_length={self.max_length})"
@@ -0,0 +1,125 @@
+"""
+Error landscapes over whole grids of (w1, w2).
+
+The forward and backward passes of SimpleNetwork and NonlinearNetwork only
+use elementwise arithmetic, so handing them numpy arrays of weights
+evaluates every (w1, w2) pair at once. One batched pass gives the error
+surface and the gradient field together.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+from .history import History
+from .networks import SimpleNetwork, NonlinearNetwork, WORKSHEET_X, WORKSHEET_TARGET
+
+
+class Landscape(NamedTuple):
+    """Error and gradients evaluated at every (w1, w2) pair"""
+    w1: np.ndarray
+    w2: np.ndarray
+    error: np.ndarray
+    dE_dw1: np.ndarray
+    dE_dw2: np.ndarray
+
+
+def batch_evaluate(network_class, w1, w2, x=WORKSHEET_X, target=WORKSHEET_TARGET):
+    """
+    Run one forward and backward pass over arrays of weights.
+
+    Args:
+        network_class: SimpleNetwork or NonlinearNetwork
+        w1, w2: Arrays (or scalars) that broadcast against each other
+        x: Network input
+        target: Target output
+
+    Returns:
+        Landscape with error, dE/dw1 and dE/dw2 at every (w1, w2)
+    """
+    w1, w2 = np.broadcast_arrays(np.asarray(w1, dtype=float), np.asarray(w2, dtype=float))
+    net = network_class(w1=w1, w2=w2, history=History.off())
+    _, error = net.forward(x, target)
+    dE_dw1, dE_dw2 = net.backward()
+    # Constant factors in the chain (like dy/dw2 = 1) leave some gradients
+    # unbroadcast, so give every field the grid's shape
+    return Landscape(w1, w2, error,
+                     np.broadcast_to(dE_dw1, w1.shape),
+                     np.broadcast_to(dE_dw2, w1.shape))
+
+
+def landscape_grid(network_class, w1_center=1.0, w2_center=3.0, span=5.0, resolution=1000,
+                   x=WORKSHEET_X, target=WORKSHEET_TARGET):
+    """
+    Evaluate a resolution x resolution grid centred on (w1_center, w2_center).
+
+    Rows vary w2 and columns vary w1, matching np.meshgrid and the
+    orientation matplotlib's contour functions expect.
+    """
+    w1_range = np.linspace(w1_center - span, w1_center + span, resolution)
+    w2_range = np.linspace(w2_center - span, w2_center + span, resolution)
+    return batch_evaluate(network_class, w1_range[np.newaxis, :], w2_range[:, np.newaxis], x, target)
+
+
+def plot_landscape(w1_value=1.0, w2_value=3.0, learning_rate=0.1, networks=None,
+                   resolution=1000, span=5.0, arrows=20,
+                   x=WORKSHEET_X, target=WORKSHEET_TARGET):
+    """
+    Contour and surface plots of the error over (w1, w2), one row per network.
+
+    The contour panel carries a quiver overlay of the downhill direction
+    (-gradient) taken from the same batched pass, plus the step gradient
+    descent would take from (w1_value, w2_value) at this learning rate.
+
+    Args:
+        networks: Network classes to plot (default: SimpleNetwork and NonlinearNetwork)
+        resolution: Grid points per axis
+        arrows: Quiver arrows per axis
+
+    Returns:
+        matplotlib Figure
+    """
+    from .plots import _pyplot
+
+    plt = _pyplot()
+    if networks is None:
+        networks = [SimpleNetwork, NonlinearNetwork]
+
+    fig = plt.figure(figsize=(14, 6 * len(networks)))
+    fig.suptitle('Error Landscape over (w1, w2)', fontsize=16, fontweight='bold')
+
+    stride = max(1, resolution // arrows)
+    for row, network_class in enumerate(networks):
+        land = landscape_grid(network_class, w1_value, w2_value, span, resolution, x, target)
+        here = batch_evaluate(network_class, w1_value, w2_value, x, target)
+        name = network_class.__name__
+
+        # Contour map with gradient field
+        ax1 = fig.add_subplot(len(networks), 2, 2 * row + 1)
+        contours = ax1.contourf(land.w1, land.w2, land.error, levels=30, cmap='viridis')
+        fig.colorbar(contours, ax=ax1, label='Error')
+        ax1.quiver(land.w1[::stride, ::stride], land.w2[::stride, ::stride],
+                   -land.dE_dw1[::stride, ::stride], -land.dE_dw2[::stride, ::stride],
+                   color='white', alpha=0.7)
+        ax1.plot(w1_value, w2_value, 'ro', markersize=10, label='Current weights')
+        ax1.annotate('', xy=(w1_value - learning_rate * here.dE_dw1,
+                             w2_value - learning_rate * here.dE_dw2),
+                     xytext=(w1_value, w2_value),
+                     arrowprops=dict(arrowstyle='->', lw=2, color='red'))
+        ax1.set_xlabel('w1 value', fontsize=12)
+        ax1.set_ylabel('w2 value', fontsize=12)
+        ax1.set_title(f'{name}: contours and downhill directions', fontsize=13, fontweight='bold')
+        ax1.legend(fontsize=10)
+
+        # Surface
+        ax2 = fig.add_subplot(len(networks), 2, 2 * row + 2, projection='3d')
+        ax2.plot_surface(land.w1, land.w2, land.error, cmap='viridis',
+                         rcount=100, ccount=100, linewidth=0, alpha=0.9)
+        ax2.scatter([w1_value], [w2_value], [here.error], color='red', s=60)
+        ax2.set_xlabel('w1')
+        ax2.set_ylabel('w2')
+        ax2.set_zlabel('Error')
+        ax2.set_title(f'{name}: error surface', fontsize=13, fontweight='bold')
+
+    fig.tight_layout()
+    return fig
@@ -0,0 +1,250 @@
+"""
+Multi-layer networks built from dense layers.
+
+The worksheet networks write out every derivative by hand. This module does
+the same chain rule with matrices, so a network can have any number of
+layers of any width and train on whole mini-batches at once:
+
+    forward:   z = a_in @ W + b,   a_out = f(z)
+    backward:  dE/dz = dE/da_out * f'(z)
+               dE/dW = a_in.T @ dE/dz
+               dE/db = sum of dE/dz over the batch
+               dE/da_in = dE/dz @ W.T        (passed to the previous layer)
+
+Rows of every array are samples, so a batch of 256 inputs with 3 features
+has shape (256, 3).
+"""
+
+import numpy as np
+
+from .activations import get_activation
+from .history import History
+from .profiling import Profiled
+
+
+class Dense:
+    """
+    A fully connected layer: a_out = activation(a_in @ W + b)
+
+    Args:
+        n_in: Number of inputs
+        n_out: Number of outputs (neurons)
+        activation: Name from ACTIVATIONS
+        weights: Optional starting W with shape (n_in, n_out)
+        bias: Optional starting b with shape (n_out,)
+        train_weights: If False, W stays fixed (like the 3 and 2 in the worksheet)
+        train_bias: If False, b stays fixed
+        rng: numpy Generator for random initialization
+        dtype: float64 or float32
+    """
+
+    def __init__(self, n_in, n_out, activation='linear', weights=None, bias=None,
+                 train_weights=True, train_bias=True, rng=None, dtype=np.float64):
+        self._f, self._df = get_activation(activation)
+        self.activation = activation
+
+        if weights is None:
+            rng = np.random.default_rng() if rng is None else rng
+            # He initialization for ReLU-like activations, Xavier-style otherwise
+            scale = np.sqrt((2.0 if 'relu' in activation else 1.0) / n_in)
+            weights = rng.normal(0.0, scale, size=(n_in, n_out))
+        if bias is None:
+            bias = np.zeros(n_out)
+        self.W = np.array(weights, dtype=dtype).reshape(n_in, n_out)
+        self.b = np.array(bias, dtype=dtype).reshape(n_out)
+        self.train_weights = train_weights
+        self.train_bias = train_bias
+        self.dW = np.zeros_like(self.W)
+        self.db = np.zeros_like(self.b)
+
+    @property
+    def n_params(self):
+        """Number of trainable numbers in this layer"""
+        return self.W.size * self.train_weights + self.b.size * self.train_bias
+
+    def forward(self, a_in):
+        """Forward pass for a batch with shape (batch, n_in)"""
+        self.a_in = a_in
+        self.z = a_in @ self.W
+        self.z += self.b
+        self.a_out = self._f(self.z)
+        return self.a_out
+
+    def backward(self, grad_out, need_input_grad=True):
+        """
+        Backward pass: turn dE/da_out into dE/dW, dE/db and dE/da_in.
+
+        The first layer has no use for dE/da_in, so it can skip that product.
+        """
+        # Chain rule through the activation
+        dz = grad_out * self._df(self.z, self.a_out)
+
+        if self.train_weights:
+            np.matmul(self.a_in.T, dz, out=self.dW)
+        if self.train_bias:
+            np.sum(dz, axis=0, out=self.db)
+        if need_input_grad:
+            return dz @ self.W.T
+        return None
+
+    def update_weights(self, learning_rate):
+        """Gradient descent step, in place"""
+        if self.train_weights:
+            self.W -= learning_rate * self.dW
+        if self.train_bias:
+            self.b -= learning_rate * self.db
+
+
+class MLP(Profiled):
+    """
+    A stack of Dense layers trained with E = 0.5 * mean over the batch of
+    sum over outputs of (y - target)^2.
+
+    For one sample and one output this is exactly the worksheet error
+    E = 0.5 * (y - target)^2. RegressionNetwork reports the plain mean
+    squared error, which is 2E.
+
+    Usage:
+        net = MLP.build([1, 64, 64, 1], activation='tanh', seed=0)
+        net.fit(x, y, epochs=20, batch_size=128, learning_rate=0.05)
+    """
+
+    # train_step takes a whole batch (see train_batches)
+    trains_on_batches = True
+
+    def __init__(self, layers, history=None, optimizer=None):
+        self.layers = list(layers)
+        self.optimizer = optimizer
+        self.history = History() if history is None else history
+        self.history.start(('error',))
+
+    @classmethod
+    def build(cls, sizes, activation='sigmoid', output_activation='linear',
+              seed=None, dtype=np.float64):
+        """
+        Create a network from a list of layer widths.
+
+        Args:
+            sizes: [n_inputs, hidden_1, ..., n_outputs]
+            activation: Activation for the hidden layers
+            output_activation: Activation for the last layer
+            seed: Seed for weight initialization
+            dtype: float64, or float32 for roughly twice the speed
+        """
+        if len(sizes) < 2:
+            raise ValueError("sizes needs at least an input and an output width")
+        rng = np.random.default_rng(seed)
+        layers = []
+        for i, (n_in, n_out) in enumerate(zip(sizes[:-1], sizes[1:])):
+            last = i == len(sizes) - 2
+            layers.append(Dense(n_in, n_out, output_activation if last else activation,
+                                rng=rng, dtype=dtype))
+        return cls(layers)
+
+    @property
+    def n_params(self):
+        """Total number of trainable numbers"""
+        return sum(layer.n_params for layer in self.layers)
+
+    @property
+    def dtype(self):
+        return self.layers[0].W.dtype
+
+    def _as_batch(self, a):
+        """Accept scalars, 1-D arrays of samples, or (batch, features) arrays"""
+        a = np.asarray(a, dtype=self.dtype)
+        if a.ndim == 0:
+            return a.reshape(1, 1)
+        if a.ndim == 1:
+            return a.reshape(-1, 1)
+        return a
+
+    def predict(self, x):
+        """Forward pass only"""
+        a = self._as_batch(x)
+        for layer in self.layers:
+            a = layer.forward(a)
+        return a
+
+    def forward(self, x, target):
+        """Forward pass through every layer, then the error"""
+        self.x = self._as_batch(x)
+        self.y = self.predict(self.x)
+        self.target = self._as_batch(target)
+        self.residual = self.y - self.target
+        self.error = 0.5 * np.sum(self.residual ** 2) / len(self.y)
+        return self.y, self.error
+
+    def backward(self):
+        """Backward pass: hand dE/dy back through the layers (chain rule!)"""
+        grad = self.residual / len(self.y)
+        for i in range(len(self.layers) - 1, -1, -1):
+            grad = self.layers[i].backward(grad, need_input_grad=i > 0)
+        return [(layer.dW, layer.db) for layer in self.layers]
+
+    def _parameters(self):
+        """(layer, parameter name, gradient) for every trainable array"""
+        params = []
+        for layer in self.layers:
+            if layer.train_weights:
+                params.append((layer, 'W', layer.dW))
+            if layer.train_bias:
+                params.append((layer, 'b', layer.db))
+        return params
+
+    def error_at(self, values):
+        """Error on the last forward pass's batch with other values for the trainable arrays"""
+        params = self._parameters()
+        saved = [getattr(layer, name) for layer, name, _ in params]
+        try:
+            for (layer, name, _), value in zip(params, values):
+                setattr(layer, name, value)
+            a = self.x
+            for layer in self.layers:
+                a = layer._f(a @ layer.W + layer.b)
+            return 0.5 * np.sum((a - self.target) ** 2) / len(a)
+        finally:
+            for (layer, name, _), value in zip(params, saved):
+                setattr(layer, name, value)
+
+    def update_weights(self, learning_rate=0.1):
+        """Update every layer using gradient descent (or the network's optimizer)"""
+        if self.optimizer is None:
+            for layer in self.layers:
+                layer.update_weights(learning_rate)
+        else:
+            params = self._parameters()
+            new = self.optimizer.update([getattr(layer, name) for layer, name, _ in params],
+                                        [grad for _, _, grad in params], learning_rate,
+                                        loss_at=self.error_at)
+            for (layer, name, _), value in zip(params, new):
+                getattr(layer, name)[...] = value
+        self.history.log(self.error)
+
+    def train_step(self, x, target, learning_rate=0.1):
+        """One complete training step on one batch"""
+        self.forward(x, target)
+        self.backward()
+        self.update_weights(learning_rate)
+        return self.error
+
+    def fit(self, x, target, epochs=1, batch_size=128, learning_rate=0.1, shuffle=True, seed=None):
+        """
+        Mini-batch gradient descent over a dataset.
+
+        Returns:
+            List with the mean error of each epoch
+        """
+        x = self._as_batch(x)
+        target = self._as_batch(target)
+        rng = np.random.default_rng(seed)
+        n = len(x)
+        epoch_errors = []
+        for _ in range(epochs):
+            order = rng.permutation(n) if shuffle else np.arange(n)
+            total = 0.0
+            for start in range(0, n, batch_size):
+                batch = order[start:start + batch_size]
+                total += self.train_step(x[batch], target[batch], learning_rate) * len(batch)
+            epoch_errors.append(total / n)
+        return epoch_errors
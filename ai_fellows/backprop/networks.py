@@ -0,0 +1,359 @@
+"""
+Network classes for the chain-rule lesson.
+
+Each class spells out its forward pass and its backward pass by hand so the
+chain rule stays visible. Only numpy is needed here.
+
+to_mlp() builds the same network from mlp.Dense layers. Its forward pass,
+gradients and training steps agree with the hand-written ones, so the
+matrix version in mlp.py can be checked against the worksheet.
+"""
+
+import numpy as np
+
+from . import activations
+from .activations import get_activation
+from .history import History
+from .profiling import Profiled
+
+# Values from the student worksheet
+WORKSHEET_X = 2
+WORKSHEET_TARGET = 20
+
+
+class SimpleNetwork(Profiled):
+    """
+    A simple 2-layer network matching the worksheet:
+    h = 3*x + w1
+    y = 2*h + w2
+    E = 0.5 * (y - target)^2
+
+    Pass a History(stride=..., max_length=...) to thin out or cap the
+    recorded training history on long runs, and an optimizer (see
+    optimizers.py) to replace plain gradient descent.
+    """
+
+    # Attribute names of the trainable numbers
+    weight_names = ('w1', 'w2')
+
+    def __init__(self, w1=1.0, w2=3.0, history=None, optimizer=None):
+        self.w1 = w1
+        self.w2 = w2
+        self.optimizer = optimizer
+        self.history = History() if history is None else history
+        self.history.start(('w1', 'w2', 'error'), w1=w1, w2=w2)
+
+    def forward(self, x, target):
+        """Forward pass through the network"""
+        # Hidden layer
+        self.x = x
+        self.h = 3 * x + self.w1
+
+        # Output layer
+        self.y = 2 * self.h + self.w2
+
+        # Calculate error
+        self.target = target
+        self.error = 0.5 * (self.y - target) ** 2
+
+        return self.y, self.error
+
+    def backward(self):
+        """
+        Backward pass: Calculate gradients using the chain rule
+        This is where the magic happens!
+        """
+        # Gradient of error with respect to output
+        dE_dy = (self.y - self.target)
+
+        # Gradient for w2: dE/dw2 = dE/dy * dy/dw2
+        dy_dw2 = 1  # because y = 2*h + w2
+        self.dE_dw2 = dE_dy * dy_dw2
+
+        # Gradient for w1: dE/dw1 = dE/dy * dy/dh * dh/dw1 (chain rule!)
+        dy_dh = 2   # because y = 2*h + w2
+        dh_dw1 = 1  # because h = 3*x + w1
+        self.dE_dw1 = dE_dy * dy_dh * dh_dw1
+
+        return self.dE_dw1, self.dE_dw2
+
+    def update_weights(self, learning_rate=0.1):
+        """Update weights using gradient descent (or the network's optimizer)"""
+        if self.optimizer is None:
+            self.w1 = self.w1 - learning_rate * self.dE_dw1
+            self.w2 = self.w2 - learning_rate * self.dE_dw2
+        else:
+            self.w1, self.w2 = self.optimizer.update(
+                (self.w1, self.w2), (self.dE_dw1, self.dE_dw2), learning_rate,
+                loss_at=self.error_at)
+
+        # Store history for visualization
+        self.history.log(self.w1, self.w2, self.error)
+
+    def error_at(self, weights):
+        """Error for the last forward pass's x and target at other weights (w1, w2)"""
+        w1, w2 = weights
+        return type(self)(w1, w2, history=History.off()).forward(self.x, self.target)[1]
+
+    def train_step(self, x, target, learning_rate=0.1):
+        """One complete training step"""
+        self.forward(x, target)
+        self.backward()
+        self.update_weights(learning_rate)
+        return self.error
+
+    def to_mlp(self):
+        """
+        The same network built from Dense layers: two 1x1 layers whose
+        weights (3 and 2) are fixed and whose biases are w1 and w2.
+        """
+        from .mlp import MLP, Dense
+        return MLP([
+            Dense(1, 1, 'linear', weights=[[3.0]], bias=[self.w1], train_weights=False),
+            Dense(1, 1, 'linear', weights=[[2.0]], bias=[self.w2], train_weights=False),
+        ])
+
+
+class NonlinearNetwork(Profiled):
+    """
+    Network with sigmoid activation:
+    h = sigmoid(3*x + w1)
+    y = 2*h + w2
+
+    Any activation from activations.py can replace the sigmoid, e.g.
+    NonlinearNetwork(activation='tanh').
+    """
+
+    # Attribute names of the trainable numbers
+    weight_names = ('w1', 'w2')
+
+    def __init__(self, w1=1.0, w2=3.0, history=None, optimizer=None, activation='sigmoid'):
+        self.w1 = w1
+        self.w2 = w2
+        self.optimizer = optimizer
+        self.activation = activation
+        self._f, self._df = get_activation(activation)
+        self.history = History() if history is None else history
+        self.history.start(('w1', 'w2', 'error'), w1=w1, w2=w2)
+
+    @staticmethod
+    def sigmoid(z):
+        """Sigmoid activation function (stable for large |z|)"""
+        return activations.sigmoid(z)
+
+    @staticmethod
+    def sigmoid_derivative(z):
+        """Derivative of sigmoid: σ'(z) = σ(z) * (1 - σ(z))"""
+        s = NonlinearNetwork.sigmoid(z)
+        return s * (1 - s)
+
+    def forward(self, x, target):
+        """Forward pass with nonlinear activation"""
+        self.x = x
+        self.z = 3 * x + self.w1  # Pre-activation
+        self.h = self._f(self.z)  # Activation
+        self.y = 2 * self.h + self.w2
+        self.target = target
+        self.error = 0.5 * (self.y - target) ** 2
+        return self.y, self.error
+
+    def backward(self):
+        """Backward pass with chain rule through sigmoid"""
+        # dE/dy
+        dE_dy = (self.y - self.target)
+
+        # dE/dw2 = dE/dy * dy/dw2
+        dy_dw2 = 1
+        self.dE_dw2 = dE_dy * dy_dw2
+
+        # dE/dw1 = dE/dy * dy/dh * dh/dz * dz/dw1
+        # This is longer because of the sigmoid!
+        dy_dh = 2
+        dh_dz = self._df(self.z, self.h)  # Key difference! (reuses h from forward)
+        dz_dw1 = 1
+        self.dE_dw1 = dE_dy * dy_dh * dh_dz * dz_dw1
+
+        return self.dE_dw1, self.dE_dw2
+
+    def update_weights(self, learning_rate=0.1):
+        """Update weights"""
+        if self.optimizer is None:
+            self.w1 = self.w1 - learning_rate * self.dE_dw1
+            self.w2 = self.w2 - learning_rate * self.dE_dw2
+        else:
+            self.w1, self.w2 = self.optimizer.update(
+                (self.w1, self.w2), (self.dE_dw1, self.dE_dw2), learning_rate,
+                loss_at=self.error_at)
+        self.history.log(self.w1, self.w2, self.error)
+
+    def error_at(self, weights):
+        """Error for the last forward pass's x and target at other weights (w1, w2)"""
+        w1, w2 = weights
+        net = type(self)(w1, w2, history=History.off(), activation=self.activation)
+        return net.forward(self.x, self.target)[1]
+
+    def train_step(self, x, target, learning_rate=0.1):
+        """One training step"""
+        self.forward(x, target)
+        self.backward()
+        self.update_weights(learning_rate)
+        return self.error
+
+    def to_mlp(self):
+        """The same network built from Dense layers, with a sigmoid hidden layer"""
+        from .mlp import MLP, Dense
+        return MLP([
+            Dense(1, 1, self.activation, weights=[[3.0]], bias=[self.w1], train_weights=False),
+            Dense(1, 1, 'linear', weights=[[2.0]], bias=[self.w2], train_weights=False),
+        ])
+
+
+class RegressionNetwork(Profiled):
+    """
+    Simple linear regression network: y = w*x + b
+
+    fused=True switches train_step to a single-pass kernel for large
+    batches (see _fused_step); dtype=np.float32 runs it in single precision.
+    """
+
+    # train_step takes a whole batch (see train_batches)
+    trains_on_batches = True
+
+    # Attribute names of the trainable numbers
+    weight_names = ('w', 'b')
+
+    def __init__(self, history=None, optimizer=None, fused=False, dtype=np.float64):
+        self.w = np.random.randn()
+        self.b = np.random.randn()
+        self.optimizer = optimizer
+        self.fused = fused
+        self.dtype = np.dtype(dtype)
+        self._buffers = None
+        self.history = History() if history is None else history
+        self.history.start(('w', 'b', 'loss'), w=self.w, b=self.b)
+
+    def forward(self, x):
+        """Forward pass"""
+        return self.w * x + self.b
+
+    def loss(self, x_batch, y_batch):
+        """Mean squared error"""
+        predictions = self.forward(x_batch)
+        return np.mean((predictions - y_batch) ** 2)
+
+    def train_step(self, x_batch, y_batch, learning_rate=0.01):
+        """Training step with batch gradient descent"""
+        if self.fused:
+            return self._fused_step(x_batch, y_batch, learning_rate)
+
+        # Forward pass
+        predictions = self.forward(x_batch)
+        errors = predictions - y_batch
+
+        # Backward pass (chain rule!)
+        # dL/dw = dL/dy * dy/dw = mean(errors * x)
+        # dL/db = dL/dy * dy/db = mean(errors * 1)
+        dL_dw = np.mean(errors * x_batch)
+        dL_db = np.mean(errors)
+
+        # Update
+        if self.optimizer is None:
+            self.w -= learning_rate * dL_dw
+            self.b -= learning_rate * dL_db
+        else:
+            self.w, self.b = self.optimizer.update(
+                (self.w, self.b), (dL_dw, dL_db), learning_rate,
+                loss_at=lambda params: np.mean((params[0] * x_batch + params[1] - y_batch) ** 2),
+                data=(x_batch, y_batch))
+
+        # Record
+        current_loss = self.loss(x_batch, y_batch)
+        self.history.log(self.w, self.b, current_loss)
+
+        return current_loss
+
+    def _batch_buffers(self, x_batch, y_batch):
+        """
+        x and y as flat arrays of self.dtype, plus a residual buffer.
+
+        Buffers are reused while the batch size stays the same. Inputs that
+        already have the right dtype are used as they are, without a copy.
+        """
+        x = np.asarray(x_batch).reshape(-1)
+        y = np.asarray(y_batch).reshape(-1)
+        if self._buffers is None or len(self._buffers['residual']) != len(x):
+            self._buffers = {'residual': np.empty(len(x), dtype=self.dtype)}
+        buffers = self._buffers
+        if x.dtype != self.dtype:
+            x = self._cast(x, buffers, 'x')
+        if y.dtype != self.dtype:
+            y = self._cast(y, buffers, 'y')
+        return x, y, buffers['residual']
+
+    def _cast(self, values, buffers, name):
+        """Copy values into the (reused) buffer called name, converting the dtype"""
+        if name not in buffers:
+            buffers[name] = np.empty(len(values), dtype=self.dtype)
+        np.copyto(buffers[name], values, casting='same_kind')
+        return buffers[name]
+
+    def _fused_step(self, x_batch, y_batch, learning_rate):
+        """
+        The same step as train_step, in one pass and without temporary arrays.
+
+        The residuals r = w*x + b - y are written into a preallocated buffer,
+        and everything else comes from a few reductions over them:
+
+            dL/dw = mean(r*x)     dL/db = mean(r)
+
+        After the update w -> w + dw, b -> b + db every residual changes by
+        dw*x + db, so the new loss needs no second forward pass:
+
+            mean((r + dw*x + db)^2) = mean(r^2) + 2*dw*mean(r*x) + 2*db*mean(r)
+                                      + dw^2*mean(x^2) + 2*dw*db*mean(x) + db^2
+        """
+        x, y, r = self._batch_buffers(x_batch, y_batch)
+        n = len(x)
+
+        # Forward pass into the buffer: r = w*x + b - y
+        np.multiply(x, self.w, out=r)
+        r += self.b
+        r -= y
+
+        # Reductions (np.dot doesn't allocate); float() keeps w and b in double
+        r_x = float(np.dot(r, x)) / n
+        r_mean = float(np.add.reduce(r)) / n
+        r_r = float(np.dot(r, r)) / n
+        x_x = float(np.dot(x, x)) / n
+        x_mean = float(np.add.reduce(x)) / n
+        dL_dw, dL_db = r_x, r_mean
+
+        # Update
+        w, b = self.w, self.b
+        if self.optimizer is None:
+            self.w = w - learning_rate * dL_dw
+            self.b = b - learning_rate * dL_db
+        else:
+            self.w, self.b = self.optimizer.update(
+                (w, b), (dL_dw, dL_db), learning_rate,
+                loss_at=lambda params: np.mean((params[0] * x + params[1] - y) ** 2),
+                data=(x, y))
+        dw = self.w - w
+        db = self.b - b
+
+        # Loss at the new weights, from the residuals we already have
+        current_loss = (r_r + 2 * dw * r_x + 2 * db * r_mean
+                        + dw * dw * x_x + 2 * dw * db * x_mean + db * db)
+        current_loss = max(current_loss, 0.0)  # rounding can push an exact fit just below 0
+        self.history.log(self.w, self.b, current_loss)
+        return current_loss
+
+    def to_mlp(self):
+        """
+        The same network as a single 1x1 Dense layer (weight w, bias b).
+
+        The MLP's error is half of this class's loss, so its gradients match
+        train_step's exactly.
+        """
+        from .mlp import MLP, Dense
+        return MLP([Dense(1, 1, 'linear', weights=[[self.w]], bias=[self.b])])
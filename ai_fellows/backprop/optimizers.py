@@ -0,0 +1,221 @@
+"""
+Optimizers: different rules for turning gradients into weight updates.
+
+Every network class does plain gradient descent, w = w - learning_rate * grad,
+unless it is given an optimizer:
+
+    net = SimpleNetwork(optimizer=Adam())
+    net.train_step(2, 20, learning_rate=0.5)
+
+The network still works out the gradients with the chain rule; the optimizer
+only decides how far to move. An optimizer's update() takes the current
+parameters and their gradients and returns the new parameters:
+
+    new_params = optimizer.update(params, grads, learning_rate, loss_at=..., data=...)
+
+loss_at(params) evaluates the loss at other parameter values (used by the
+line search) and data is the training batch (used by the closed-form
+least-squares solve). Optimizers that don't need them ignore them.
+
+steps_to_tolerance() and compare_optimizers() in training.py count how many
+steps each one needs.
+"""
+
+import numpy as np
+
+
+class Optimizer:
+    """Base class. Subclasses keep any per-parameter state by list position."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Forget any state from earlier steps"""
+        self.t = 0
+
+    def update(self, params, grads, learning_rate, loss_at=None, data=None):
+        raise NotImplementedError
+
+    def state(self):
+        """Hyperparameters and running state, for checkpoints"""
+        return dict(vars(self))
+
+    @classmethod
+    def from_state(cls, state):
+        """An optimizer that continues exactly where state() left off"""
+        optimizer = cls.__new__(cls)
+        vars(optimizer).update(state)
+        return optimizer
+
+    def __repr__(self):
+        return f"{type(self).__name__}()"
+
+
+class SGD(Optimizer):
+    """Plain gradient descent: w = w - learning_rate * grad"""
+
+    def update(self, params, grads, learning_rate, loss_at=None, data=None):
+        self.t += 1
+        return [p - learning_rate * g for p, g in zip(params, grads)]
+
+
+class Momentum(Optimizer):
+    """
+    Gradient descent with momentum: keep a running velocity of past gradients.
+
+        v = beta * v + grad
+        w = w - learning_rate * v
+
+    Steps keep going in directions where the gradient agrees from step to
+    step and cancel out where it flips sign.
+    """
+
+    def __init__(self, beta=0.9):
+        self.beta = beta
+        super().__init__()
+
+    def reset(self):
+        super().reset()
+        self.velocity = None
+
+    def update(self, params, grads, learning_rate, loss_at=None, data=None):
+        self.t += 1
+        if self.velocity is None:
+            self.velocity = [np.zeros_like(g, dtype=float) for g in grads]
+        self.velocity = [self.beta * v + g for v, g in zip(self.velocity, grads)]
+        return [p - learning_rate * v for p, v in zip(params, self.velocity)]
+
+    def __repr__(self):
+        return f"Momentum(beta={self.beta})"
+
+
+class Adam(Optimizer):
+    """
+    Adam: momentum plus a per-parameter step size.
+
+    Each parameter's step is scaled by a running average of its squared
+    gradient, so steps are about learning_rate in size whatever the scale
+    of the gradient.
+    """
+
+    def __init__(self, beta1=0.9, beta2=0.999, eps=1e-8):
+        self.beta1 = beta1
+        self.beta2 = beta2
+        self.eps = eps
+        super().__init__()
+
+    def reset(self):
+        super().reset()
+        self.m = None
+        self.v = None
+
+    def update(self, params, grads, learning_rate, loss_at=None, data=None):
+        self.t += 1
+        if self.m is None:
+            self.m = [np.zeros_like(g, dtype=float) for g in grads]
+            self.v = [np.zeros_like(g, dtype=float) for g in grads]
+        b1, b2 = self.beta1, self.beta2
+        self.m = [b1 * m + (1 - b1) * g for m, g in zip(self.m, grads)]
+        self.v = [b2 * v + (1 - b2) * g * g for v, g in zip(self.v, grads)]
+        # Bias correction: m and v start at zero, so early averages are too small
+        m_scale = 1 / (1 - b1 ** self.t)
+        v_scale = 1 / (1 - b2 ** self.t)
+        return [p - learning_rate * (m * m_scale) / (np.sqrt(v * v_scale) + self.eps)
+                for p, m, v in zip(params, self.m, self.v)]
+
+    def __repr__(self):
+        return f"Adam(beta1={self.beta1}, beta2={self.beta2})"
+
+
+class LineSearch(Optimizer):
+    """
+    Gradient descent with a backtracking (Armijo) line search.
+
+    Try a step; if the loss didn't drop by at least c * step * |grad|^2,
+    halve the step and try again. After a successful step the next one
+    starts `grow` times bigger, so the step size adapts in both directions
+    and learning_rate is only the first guess.
+
+    Works elementwise when the network holds arrays of weights (each
+    element gets its own step size).
+    """
+
+    def __init__(self, shrink=0.5, grow=2.0, c=1e-4, max_tries=60):
+        self.shrink = shrink
+        self.grow = grow
+        self.c = c
+        self.max_tries = max_tries
+        super().__init__()
+
+    def reset(self):
+        super().reset()
+        self.step_size = None
+
+    def update(self, params, grads, learning_rate, loss_at=None, data=None):
+        if loss_at is None:
+            raise ValueError("LineSearch needs the network to provide loss_at")
+        self.t += 1
+        loss = loss_at(params)
+        if np.ndim(loss) == 0:
+            slope = sum(np.sum(g * g) for g in grads)
+        else:
+            slope = sum(g * g for g in grads)
+
+        step = learning_rate if self.step_size is None else self.step_size * self.grow
+        step = np.broadcast_to(np.asarray(step, dtype=float), np.shape(loss)).copy()
+        for _ in range(self.max_tries):
+            trial = [p - step * g for p, g in zip(params, grads)]
+            failed = loss_at(trial) > loss - self.c * step * slope
+            if not np.any(failed):
+                break
+            step = np.where(failed, step * self.shrink, step)
+        else:
+            # No decrease found (already at a minimum, to rounding): stay put
+            step = np.where(failed, 0.0, step)
+            trial = [p - step * g for p, g in zip(params, grads)]
+
+        self.step_size = step if step.ndim else float(step)
+        return trial
+
+    def __repr__(self):
+        return f"LineSearch(shrink={self.shrink}, grow={self.grow})"
+
+
+class LeastSquares(Optimizer):
+    """
+    Exact solve for RegressionNetwork: no learning rate, no iterations.
+
+    Mean squared error of y = w*x + b is a quadratic in (w, b), so its
+    minimum solves the 2x2 "normal equations":
+
+        [sum x^2  sum x] [w]   [sum x*y]
+        [sum x    n    ] [b] = [sum y  ]
+
+    The sums are accumulated over every batch seen so far, so streaming
+    mini-batches (see BatchLoader) gives the exact fit over all of them.
+    """
+
+    def reset(self):
+        super().reset()
+        self.xtx = np.zeros((2, 2))
+        self.xty = np.zeros(2)
+
+    def update(self, params, grads, learning_rate, loss_at=None, data=None):
+        if data is None or len(params) != 2:
+            raise TypeError("LeastSquares only applies to RegressionNetwork (y = w*x + b)")
+        self.t += 1
+        x, y = (np.asarray(a, dtype=float).ravel() for a in data)
+        self.xtx += [[x @ x, x.sum()], [x.sum(), len(x)]]
+        self.xty += [x @ y, y.sum()]
+        w, b = np.linalg.lstsq(self.xtx, self.xty, rcond=None)[0]
+        return [float(w), float(b)]
+
+
+OPTIMIZERS = {
+    'sgd': SGD,
+    'momentum': Momentum,
+    'adam': Adam,
+    'line_search': LineSearch,
+    'least_squares': LeastSquares,
+}
@@ -0,0 +1,347 @@
+"""
+Figures for the backpropagation demo.
+
+matplotlib is imported the first time a figure is built, so importing the
+backprop package stays as cheap as importing numpy.
+"""
+
+import numpy as np
+
+from .networks import SimpleNetwork, WORKSHEET_X, WORKSHEET_TARGET
+from .landscape import batch_evaluate
+
+_style_applied = False
+
+
+def _pyplot():
+    """Import pyplot on first use and apply the lesson's plot style."""
+    global _style_applied
+    import matplotlib.pyplot as plt
+
+    if not _style_applied:
+        # Set style for better-looking plots
+        try:
+            plt.style.use('seaborn-v0_8-darkgrid')
+        except OSError:
+            plt.style.use('seaborn-darkgrid')
+        _style_applied = True
+    return plt
+
+
+def plot_training(net, x_input=WORKSHEET_X, target_output=WORKSHEET_TARGET):
+    """
+    Build the Part 2 figure: weight evolution, error curve, network diagram
+    and the chain rule for the final network state.
+
+    Returns:
+        matplotlib Figure
+    """
+    plt = _pyplot()
+
+    # Gradients at the final weights, for the chain rule panel
+    y_current, _ = net.forward(x_input, target_output)
+    dE_dw1, dE_dw2 = net.backward()
+
+    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+    fig.suptitle('Neural Network Learning via Backpropagation', fontsize=16, fontweight='bold')
+
+    # Plot 1: Weight evolution
+    ax1 = axes[0, 0]
+    iterations = net.history.steps('w1')
+    ax1.plot(iterations, net.history['w1'], 'b-', linewidth=2, label='w1 (hidden weight)', marker='o')
+    ax1.plot(iterations, net.history['w2'], 'r-', linewidth=2, label='w2 (output weight)', marker='s')
+    ax1.set_xlabel('Training Step', fontsize=12)
+    ax1.set_ylabel('Weight Value', fontsize=12)
+    ax1.set_title('How Weights Change During Training', fontsize=13, fontweight='bold')
+    ax1.legend(fontsize=11)
+    ax1.grid(True, alpha=0.3)
+
+    # Plot 2: Error reduction
+    ax2 = axes[0, 1]
+    ax2.plot(net.history.steps('error'), net.history['error'], 'g-', linewidth=2, marker='o')
+    ax2.set_xlabel('Training Step', fontsize=12)
+    ax2.set_ylabel('Error', fontsize=12)
+    ax2.set_title('Error Decreases Over Time', fontsize=13, fontweight='bold')
+    ax2.grid(True, alpha=0.3)
+    ax2.set_yscale('log')  # Log scale shows improvement better
+
+    # Plot 3: Network diagram
+    ax3 = axes[1, 0]
+    ax3.axis('off')
+    ax3.set_xlim(0, 10)
+    ax3.set_ylim(0, 10)
+
+    # Input
+    ax3.add_patch(plt.Circle((2, 5), 0.5, color='lightblue', ec='black', linewidth=2))
+    ax3.text(2, 5, f'x={x_input}', ha='center', va='center', fontsize=11, fontweight='bold')
+    ax3.text(2, 3.5, 'Input', ha='center', fontsize=10)
+
+    # Hidden
+    ax3.add_patch(plt.Circle((5, 5), 0.5, color='lightgreen', ec='black', linewidth=2))
+    ax3.text(5, 5, 'h', ha='center', va='center', fontsize=11, fontweight='bold')
+    ax3.text(5, 3.5, 'Hidden', ha='center', fontsize=10)
+
+    # Output
+    ax3.add_patch(plt.Circle((8, 5), 0.5, color='lightcoral', ec='black', linewidth=2))
+    ax3.text(8, 5, 'y', ha='center', va='center', fontsize=11, fontweight='bold')
+    ax3.text(8, 3.5, 'Output', ha='center', fontsize=10)
+
+    # Arrows with weights
+    ax3.annotate('', xy=(4.5, 5), xytext=(2.5, 5),
+                 arrowprops=dict(arrowstyle='->', lw=2, color='blue'))
+    ax3.text(3.5, 5.5, f'w1={net.w1:.2f}', ha='center', fontsize=10, color='blue', fontweight='bold')
+
+    ax3.annotate('', xy=(7.5, 5), xytext=(5.5, 5),
+                 arrowprops=dict(arrowstyle='->', lw=2, color='red'))
+    ax3.text(6.5, 5.5, f'w2={net.w2:.2f}', ha='center', fontsize=10, color='red', fontweight='bold')
+
+    ax3.text(5, 8, 'Final Network State', ha='center', fontsize=13, fontweight='bold')
+    ax3.text(5, 1.5, f'Prediction: {y_current:.2f} → Target: {target_output}',
+             ha='center', fontsize=11, bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
+
+    # Plot 4: The Chain Rule Visualization
+    ax4 = axes[1, 1]
+    ax4.axis('off')
+    ax4.set_xlim(0, 10)
+    ax4.set_ylim(0, 10)
+
+    ax4.text(5, 9, 'The Chain Rule in Action', ha='center', fontsize=13, fontweight='bold')
+
+    # Show the chain for w1
+    y_pos = 7.5
+    ax4.text(5, y_pos, 'Finding dE/dw1:', ha='center', fontsize=11, fontweight='bold', color='blue')
+    y_pos -= 1
+    ax4.text(5, y_pos, 'w1 → h → y → E', ha='center', fontsize=10,
+             bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.5))
+    y_pos -= 0.8
+    ax4.text(5, y_pos, 'dE/dw1 = dE/dy × dy/dh × dh/dw1', ha='center', fontsize=10)
+    y_pos -= 0.6
+    ax4.text(5, y_pos, f'= ({y_current-target_output:.1f}) × (2) × (1) = {dE_dw1:.1f}',
+             ha='center', fontsize=9, family='monospace')
+
+    y_pos -= 1.5
+    # Show the chain for w2
+    ax4.text(5, y_pos, 'Finding dE/dw2:', ha='center', fontsize=11, fontweight='bold', color='red')
+    y_pos -= 1
+    ax4.text(5, y_pos, 'w2 → y → E', ha='center', fontsize=10,
+             bbox=dict(boxstyle='round', facecolor='lightcoral', alpha=0.5))
+    y_pos -= 0.8
+    ax4.text(5, y_pos, 'dE/dw2 = dE/dy × dy/dw2', ha='center', fontsize=10)
+    y_pos -= 0.6
+    ax4.text(5, y_pos, f'= ({y_current-target_output:.1f}) × (1) = {dE_dw2:.1f}',
+             ha='center', fontsize=9, family='monospace')
+
+    y_pos -= 1.2
+    ax4.text(5, y_pos, '✓ Longer chains need more derivatives!', ha='center',
+             fontsize=10, style='italic', color='green')
+
+    fig.tight_layout()
+    return fig
+
+
+def explore_network(w1_value, w2_value, learning_rate,
+                    x_input=WORKSHEET_X, target_output=WORKSHEET_TARGET, show=True):
+    """Interactive exploration of weight effects"""
+    plt = _pyplot()
+    net_explore = SimpleNetwork(w1=w1_value, w2=w2_value)
+
+    # Forward pass
+    y_pred, error = net_explore.forward(x_input, target_output)
+
+    # Backward pass
+    dE_dw1, dE_dw2 = net_explore.backward()
+
+    # Create visualization
+    fig, axes = plt.subplots(1, 3, figsize=(16, 4))
+
+    # Plot 1: Current state
+    ax1 = axes[0]
+    ax1.bar(['Current\nOutput', 'Target\nOutput'], [y_pred, target_output],
+            color=['orange' if abs(y_pred - target_output) > 1 else 'green', 'blue'],
+            alpha=0.7, edgecolor='black', linewidth=2)
+    ax1.set_ylabel('Value', fontsize=12)
+    ax1.set_title('Network Prediction vs Target', fontsize=13, fontweight='bold')
+    ax1.axhline(target_output, color='blue', linestyle='--', linewidth=2, alpha=0.5)
+    ax1.set_ylim(0, max(25, y_pred + 2))
+    ax1.text(0, y_pred + 1, f'{y_pred:.2f}', ha='center', fontsize=11, fontweight='bold')
+    ax1.text(1, target_output + 1, f'{target_output}', ha='center', fontsize=11, fontweight='bold')
+
+    # Plot 2: Error surface for w2
+    ax2 = axes[1]
+    w2_range = np.linspace(w2_value - 5, w2_value + 5, 100)
+    errors_w2 = batch_evaluate(SimpleNetwork, w1_value, w2_range, x_input, target_output).error
+
+    ax2.plot(w2_range, errors_w2, 'r-', linewidth=2)
+    ax2.plot(w2_value, error, 'ro', markersize=12, label='Current position')
+
+    # Show gradient arrow
+    arrow_length = -learning_rate * dE_dw2 * 10
+    ax2.arrow(w2_value, error, arrow_length, 0,
+              head_width=max(errors_w2)*0.05, head_length=0.3,
+              fc='green', ec='green', linewidth=2, label='Gradient direction')
+
+    ax2.set_xlabel('w2 value', fontsize=12)
+    ax2.set_ylabel('Error', fontsize=12)
+    ax2.set_title(f'Error Landscape for w2\n(dE/dw2 = {dE_dw2:.2f})',
+                  fontsize=13, fontweight='bold')
+    ax2.legend(fontsize=10)
+    ax2.grid(True, alpha=0.3)
+
+    # Plot 3: Error surface for w1
+    ax3 = axes[2]
+    w1_range = np.linspace(w1_value - 5, w1_value + 5, 100)
+    errors_w1 = batch_evaluate(SimpleNetwork, w1_range, w2_value, x_input, target_output).error
+
+    ax3.plot(w1_range, errors_w1, 'b-', linewidth=2)
+    ax3.plot(w1_value, error, 'bo', markersize=12, label='Current position')
+
+    # Show gradient arrow
+    arrow_length = -learning_rate * dE_dw1 * 10
+    ax3.arrow(w1_value, error, arrow_length, 0,
+              head_width=max(errors_w1)*0.05, head_length=0.3,
+              fc='green', ec='green', linewidth=2, label='Gradient direction')
+
+    ax3.set_xlabel('w1 value', fontsize=12)
+    ax3.set_ylabel('Error', fontsize=12)
+    ax3.set_title(f'Error Landscape for w1\n(dE/dw1 = {dE_dw1:.2f})',
+                  fontsize=13, fontweight='bold')
+    ax3.legend(fontsize=10)
+    ax3.grid(True, alpha=0.3)
+
+    fig.tight_layout()
+    if show:
+        plt.show()
+
+    # Print summary
+    print("\n" + "="*60)
+    print("CURRENT NETWORK STATE")
+    print("="*60)
+    print(f"Weights: w1 = {w1_value:.2f}, w2 = {w2_value:.2f}")
+    print(f"Hidden layer: h = 3*{x_input} + {w1_value:.2f} = {net_explore.h:.2f}")
+    print(f"Output: y = 2*{net_explore.h:.2f} + {w2_value:.2f} = {y_pred:.2f}")
+    print(f"Target: {target_output}")
+    print(f"Error: {error:.4f}")
+    print(f"\nGradients (Chain Rule):")
+    print(f"  dE/dw1 = {dE_dw1:.4f} ({'decrease w1' if dE_dw1 > 0 else 'increase w1'} to reduce error)")
+    print(f"  dE/dw2 = {dE_dw2:.4f} ({'decrease w2' if dE_dw2 > 0 else 'increase w2'} to reduce error)")
+    print(f"\nWith learning_rate = {learning_rate}:")
+    print(f"  Next w1 = {w1_value:.2f} - {learning_rate}*{dE_dw1:.2f} = {w1_value - learning_rate*dE_dw1:.2f}")
+    print(f"  Next w2 = {w2_value:.2f} - {learning_rate}*{dE_dw2:.2f} = {w2_value - learning_rate*dE_dw2:.2f}")
+
+    return fig
+
+
+def plot_nonlinear_comparison(net_linear, net_nonlinear):
+    """
+    Build the Part 4 figure: learning curves for the linear and sigmoid
+    networks next to a comparison of their derivative chains.
+
+    Returns:
+        matplotlib Figure
+    """
+    plt = _pyplot()
+    fig, axes = plt.subplots(1, 2, figsize=(14, 5))
+    fig.suptitle('Linear vs Nonlinear Activation Functions', fontsize=16, fontweight='bold')
+
+    # Error comparison
+    ax1 = axes[0]
+    ax1.plot(net_linear.history.steps('error'), net_linear.history['error'], 'b-', linewidth=2,
+             label='Linear Network', marker='o', markersize=4)
+    ax1.plot(net_nonlinear.history.steps('error'), net_nonlinear.history['error'], 'r-', linewidth=2,
+             label='Nonlinear Network (Sigmoid)', marker='s', markersize=4)
+    ax1.set_xlabel('Training Step', fontsize=12)
+    ax1.set_ylabel('Error', fontsize=12)
+    ax1.set_title('Learning Curves Comparison', fontsize=13, fontweight='bold')
+    ax1.legend(fontsize=11)
+    ax1.grid(True, alpha=0.3)
+    ax1.set_yscale('log')
+
+    # Chain rule visualization
+    ax2 = axes[1]
+    ax2.axis('off')
+    ax2.set_xlim(0, 10)
+    ax2.set_ylim(0, 10)
+
+    ax2.text(5, 9, 'Chain Rule Comparison', ha='center', fontsize=13, fontweight='bold')
+
+    # Linear
+    y_pos = 7.5
+    ax2.text(5, y_pos, 'Linear Network:', ha='center', fontsize=11, fontweight='bold', color='blue')
+    y_pos -= 0.8
+    ax2.text(5, y_pos, 'dE/dw1 = dE/dy × dy/dh × dh/dw1', ha='center', fontsize=9,
+             bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.5))
+    y_pos -= 0.6
+    ax2.text(5, y_pos, '(3 terms in chain)', ha='center', fontsize=9, style='italic')
+
+    y_pos -= 1.5
+    # Nonlinear
+    ax2.text(5, y_pos, 'Nonlinear Network:', ha='center', fontsize=11, fontweight='bold', color='red')
+    y_pos -= 0.8
+    ax2.text(5, y_pos, 'dE/dw1 = dE/dy × dy/dh × dh/dz × dz/dw1', ha='center', fontsize=9,
+             bbox=dict(boxstyle='round', facecolor='lightcoral', alpha=0.5))
+    y_pos -= 0.6
+    ax2.text(5, y_pos, '(4 terms in chain - includes sigmoid derivative!)',
+             ha='center', fontsize=9, style='italic')
+
+    y_pos -= 1.5
+    ax2.text(5, y_pos, 'Key Insight:', ha='center', fontsize=11, fontweight='bold', color='green')
+    y_pos -= 0.7
+    ax2.text(5, y_pos, 'More layers = longer chains', ha='center', fontsize=10)
+    y_pos -= 0.6
+    ax2.text(5, y_pos, 'But the chain rule still works!', ha='center', fontsize=10)
+    y_pos -= 0.9
+    ax2.text(5, y_pos, 'GPT-4 has ~100 layers ≈ 100 terms in the chain',
+             ha='center', fontsize=9, style='italic', color='purple')
+
+    fig.tight_layout()
+    return fig
+
+
+def plot_real_data(reg_net, x_data, y_data):
+    """
+    Build the Part 5 figure: learned fit, loss curve and parameter evolution.
+
+    Returns:
+        matplotlib Figure
+    """
+    plt = _pyplot()
+    fig, axes = plt.subplots(1, 3, figsize=(16, 5))
+    fig.suptitle('Learning from Real Data', fontsize=16, fontweight='bold')
+
+    # Data and fit
+    ax1 = axes[0]
+    ax1.scatter(x_data, y_data, color='blue', s=50, alpha=0.6, label='Training data', edgecolors='black')
+    x_line = np.linspace(0, 10, 100)
+    y_pred = reg_net.forward(x_line)
+    ax1.plot(x_line, y_pred, 'r-', linewidth=2, label=f'Learned: y={reg_net.w:.2f}x+{reg_net.b:.2f}')
+    ax1.plot(x_line, 2*x_line + 3, 'g--', linewidth=2, label='True: y=2x+3')
+    ax1.set_xlabel('x', fontsize=12)
+    ax1.set_ylabel('y', fontsize=12)
+    ax1.set_title('Network Learned the Pattern!', fontsize=13, fontweight='bold')
+    ax1.legend(fontsize=10)
+    ax1.grid(True, alpha=0.3)
+
+    # Loss curve
+    ax2 = axes[1]
+    ax2.plot(reg_net.history.steps('loss'), reg_net.history['loss'], 'g-', linewidth=2)
+    ax2.set_xlabel('Training Step', fontsize=12)
+    ax2.set_ylabel('Loss (MSE)', fontsize=12)
+    ax2.set_title('Loss Decreases via Backpropagation', fontsize=13, fontweight='bold')
+    ax2.grid(True, alpha=0.3)
+    ax2.set_yscale('log')
+
+    # Parameter evolution
+    ax3 = axes[2]
+    iterations = reg_net.history.steps('w')
+    ax3.plot(iterations, reg_net.history['w'], 'b-', linewidth=2, label='Weight (w)', marker='o', markersize=3)
+    ax3.axhline(2.0, color='blue', linestyle='--', alpha=0.5, linewidth=2, label='True w=2.0')
+    ax3.plot(iterations, reg_net.history['b'], 'r-', linewidth=2, label='Bias (b)', marker='s', markersize=3)
+    ax3.axhline(3.0, color='red', linestyle='--', alpha=0.5, linewidth=2, label='True b=3.0')
+    ax3.set_xlabel('Training Step', fontsize=12)
+    ax3.set_ylabel('Parameter Value', fontsize=12)
+    ax3.set_title('Parameters Converge to True Values', fontsize=13, fontweight='bold')
+    ax3.legend(fontsize=10)
+    ax3.grid(True, alpha=0.3)
+
+    fig.tight_layout()
+    return fig
@@ -0,0 +1,296 @@
+"""
+Find out where training time goes: forward, backward, update or history.
+
+    profiler = Profiler(every=100)
+    with profiler.attach(net):
+        train(net, 2, 20, steps=10_000)
+    print(profiler.summary())
+    profiler.write_chrome_trace('trace.json')   # open in chrome://tracing or ui.perfetto.dev
+
+The network classes and History inherit from Profiled, which names the
+methods worth timing (PROFILED_METHODS). attach() switches the network and
+its history to a timed subclass of their own class, built once per class,
+and detaching switches them back. Networks that aren't attached run the
+plain class methods, so profiling costs nothing unless it is switched on.
+
+Times are "self" times: update_weights calls history.log, and the time spent
+in history.log is counted under history, not update. Anything train_step
+does itself (RegressionNetwork computes its gradients and update inline)
+shows up as "train_step (inline)".
+
+Profiler(allocations=True) also counts, per phase, the memory blocks a call
+allocated and still held when it returned (sys.getallocatedblocks()).
+Temporaries freed before the call returns cancel out, so this shows what a
+phase keeps rather than its churn; a negative count means the phase freed
+more than it allocated. Counting walks the interpreter's memory arenas on
+every call, so it is off by default.
+"""
+
+import json
+import sys
+import time
+from contextlib import contextmanager
+
+# Method name -> phase it is reported under
+PHASES = {
+    'forward': 'forward',
+    'loss': 'forward',
+    'backward': 'backward',
+    'update_weights': 'update',
+    '_fused_step': 'fused step',
+    'train_step': 'train_step (inline)',
+}
+HISTORY_PHASE = 'history'
+
+
+def _timed(method, phase, counts_step):
+    """method, reporting to the instance's profiler (if it has one)"""
+    def timed(self, *args, **kwargs):
+        profiler = self._profiler
+        if profiler is None:
+            return method(self, *args, **kwargs)
+        frame = profiler._enter(phase)
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            profiler._leave(frame, counts_step)
+    timed.__name__ = method.__name__
+    timed.__doc__ = method.__doc__
+    return timed
+
+
+class Profiled:
+    """
+    Mixin for classes a Profiler can attach to.
+
+    PROFILED_METHODS maps method names to the phase they are reported under;
+    names the class doesn't have are skipped.
+    """
+
+    PROFILED_METHODS = PHASES
+    _profiler = None
+
+    @classmethod
+    def _profiled_class(cls):
+        """A subclass whose PROFILED_METHODS are timed, made once per class"""
+        profiled = cls.__dict__.get('_profiled_subclass')
+        if profiled is None:
+            namespace = {name: _timed(getattr(cls, name), phase, name == 'train_step')
+                         for name, phase in cls.PROFILED_METHODS.items() if hasattr(cls, name)}
+            namespace['__module__'] = cls.__module__
+            namespace['__qualname__'] = cls.__qualname__
+            profiled = type(cls)(cls.__name__, (cls,), namespace)
+            # Only a subclass made for this very class counts (not the parent's)
+            cls._profiled_subclass = profiled
+            profiled._profiled_subclass = profiled
+        return profiled
+
+
+class _Frame:
+    """One running timed call"""
+
+    __slots__ = ('phase', 'start', 'child_time', 'blocks_start', 'child_blocks')
+
+    def __init__(self, phase, start):
+        self.phase = phase
+        self.start = start
+        self.child_time = 0.0
+        self.blocks_start = 0
+        self.child_blocks = 0
+
+
+class _Probe(Profiled):
+    PROFILED_METHODS = {'noop': 'probe'}
+
+    def noop(self):
+        pass
+
+
+_calibrated = {}
+
+
+def _wrapper_overhead(allocations, calls=2000):
+    """
+    Seconds a timed method adds to its caller's clock outside its own
+    measurement (measured once per process, with and without allocation counting).
+    """
+    if allocations not in _calibrated:
+        probe_profiler = Profiler(every=calls + 1, allocations=allocations)
+        probe = _Probe()
+        best = float('inf')
+        with probe_profiler._attached(probe):
+            for _ in range(5):
+                start = time.perf_counter()
+                for _ in range(calls):
+                    probe.noop()
+                outside = (time.perf_counter() - start) / calls
+                inside = probe_profiler.totals['probe'][1] / probe_profiler.totals['probe'][0]
+                probe_profiler.totals.clear()
+                best = min(best, outside - inside)
+        _calibrated[allocations] = max(best, 0.0)
+    return _calibrated[allocations]
+
+
+class Profiler:
+    """
+    Per-phase wall time (and optionally allocation counts) for training loops.
+
+    Args:
+        every: Steps (train_step calls) per aggregation window
+        allocations: Also count the memory blocks each phase allocates and keeps
+    """
+
+    def __init__(self, every=100, allocations=False):
+        self.every = every
+        self.allocations = allocations
+        self.totals = {}    # phase -> [calls, seconds, blocks]
+        self.windows = []   # one dict per `every` steps
+        self._window = {}
+        self._window_start = None
+        self._steps = 0
+        self._stack = []
+        self._overhead = 0.0
+
+    # -- attaching ---------------------------------------------------------
+
+    @contextmanager
+    def attach(self, net):
+        """Profile net (and its history) inside a with block"""
+        self._overhead = _wrapper_overhead(self.allocations)
+        objects = [net]
+        history = getattr(net, 'history', None)
+        if isinstance(history, Profiled):
+            objects.append(history)
+        try:
+            with self._attached(*objects):
+                yield self
+        finally:
+            self.flush()
+
+    @contextmanager
+    def _attached(self, *objects):
+        """Switch objects to their timed classes for the duration"""
+        for obj in objects:
+            if not isinstance(obj, Profiled):
+                raise TypeError(f"{type(obj).__name__} can't be profiled (it isn't Profiled)")
+            if '_profiler' in vars(obj):
+                raise RuntimeError(f"{type(obj).__name__} is already attached to a Profiler")
+        originals = [type(obj) for obj in objects]
+        try:
+            for obj, cls in zip(objects, originals):
+                obj._profiler = self
+                obj.__class__ = cls._profiled_class()
+            yield
+        finally:
+            for obj, cls in zip(objects, originals):
+                obj.__class__ = cls
+                vars(obj).pop('_profiler', None)
+
+    # -- timing ------------------------------------------------------------
+
+    def _enter(self, phase):
+        if self._window_start is None:
+            self._window_start = time.perf_counter()
+        frame = _Frame(phase, 0.0)
+        if self.allocations:
+            frame.blocks_start = sys.getallocatedblocks()
+        self._stack.append(frame)
+        frame.start = time.perf_counter()
+        return frame
+
+    def _leave(self, frame, counts_step):
+        end = time.perf_counter()
+        elapsed = end - frame.start
+        self._stack.pop()
+        blocks = 0
+        if self.allocations:
+            blocks = sys.getallocatedblocks() - frame.blocks_start
+        if self._stack:
+            parent = self._stack[-1]
+            # The parent's clock also ran while this wrapper did its bookkeeping
+            parent.child_time += elapsed + self._overhead
+            parent.child_blocks += blocks
+
+        # The overhead estimate can exceed a very short call's own time
+        self_time = max(elapsed - frame.child_time, 0.0)
+        self_blocks = blocks - frame.child_blocks
+        self._add(self.totals, frame.phase, self_time, self_blocks)
+        self._add(self._window, frame.phase, self_time, self_blocks)
+        if counts_step and not self._stack:
+            self._steps += 1
+            if self._steps % self.every == 0:
+                self._close_window(end)
+
+    @staticmethod
+    def _add(table, phase, seconds, blocks):
+        entry = table.get(phase)
+        if entry is None:
+            table[phase] = [1, seconds, blocks]
+        else:
+            entry[0] += 1
+            entry[1] += seconds
+            entry[2] += blocks
+
+    def _close_window(self, end):
+        self.windows.append({
+            'start': self._window_start,
+            'end': end,
+            'steps': self._steps,
+            'phases': {phase: tuple(entry) for phase, entry in self._window.items()},
+        })
+        self._window = {}
+        self._window_start = None
+
+    def flush(self):
+        """Close the current, partly filled window (done automatically on detach)"""
+        if self._window:
+            self._close_window(time.perf_counter())
+
+    # -- reports -----------------------------------------------------------
+
+    def summary(self):
+        """A plain-text table of calls, total and mean time (and blocks kept) per phase"""
+        total = sum(entry[1] for entry in self.totals.values()) or 1.0
+        header = f"{'phase':<22}{'calls':>10}{'total ms':>12}{'mean µs':>11}{'share':>8}"
+        if self.allocations:
+            header += f"{'blocks':>10}"
+        lines = [header, '-' * len(header)]
+        for phase, (calls, seconds, blocks) in sorted(self.totals.items(), key=lambda item: -item[1][1]):
+            line = (f"{phase:<22}{calls:>10}{seconds * 1e3:>12.2f}"
+                    f"{seconds / calls * 1e6:>11.2f}{seconds / total:>8.1%}")
+            if self.allocations:
+                line += f"{blocks:>10}"
+            lines.append(line)
+        lines.append(f"{self._steps} steps in {len(self.windows)} windows of {self.every}")
+        return '\n'.join(lines)
+
+    def chrome_trace(self):
+        """
+        The windows as Chrome trace events.
+
+        Each window is one slice on the "steps" track (its args hold the
+        per-phase totals), and each phase gets a counter track showing the
+        milliseconds it took per window.
+        """
+        if not self.windows:
+            return {'traceEvents': []}
+        origin = self.windows[0]['start']
+        events = [{'name': 'process_name', 'ph': 'M', 'pid': 1, 'args': {'name': 'training'}}]
+        for window in self.windows:
+            ts = (window['start'] - origin) * 1e6
+            events.append({
+                'name': f"steps to {window['steps']}", 'cat': 'window', 'ph': 'X',
+                'pid': 1, 'tid': 1, 'ts': ts, 'dur': (window['end'] - window['start']) * 1e6,
+                'args': {phase: {'calls': calls, 'ms': seconds * 1e3, 'blocks': blocks}
+                         for phase, (calls, seconds, blocks) in window['phases'].items()},
+            })
+            for phase, (calls, seconds, blocks) in window['phases'].items():
+                events.append({'name': phase, 'ph': 'C', 'pid': 1, 'ts': ts,
+                               'args': {'ms': seconds * 1e3}})
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def write_chrome_trace(self, path):
+        """Save chrome_trace() as JSON"""
+        with open(path, 'w') as f:
+            json.dump(self.chrome_trace(), f)
+        return path
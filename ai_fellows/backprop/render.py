@@ -0,0 +1,247 @@
+"""
+Cached figure rendering in a background process.
+
+Building a multi-panel figure and saving it at dpi=150 takes a while, and
+the demo does it for every part even when nothing changed. FigureRenderer
+keys each figure on a hash of everything that goes into it (the plot
+function, its arguments including the networks' weights and history arrays,
+the dpi, and the source of the plotting modules):
+
+- if a PNG with that key is in the cache, it is copied into place
+- otherwise the figure is drawn on a separate process with the
+  non-interactive Agg backend, and the console demo carries on meanwhile
+
+    with FigureRenderer(cache_dir='.figure-cache') as renderer:
+        job = renderer.render('plot_training', 'backprop_training.png', net, 2, 20)
+        ...
+    job.result()     # path of the PNG (waits for the render if needed)
+    job.cached       # True if nothing had to be drawn
+
+A figure that is also going to be shown on screen is built once, here, with
+draw(): the same Figure is saved and then handed back for plt.show().
+"""
+
+import hashlib
+import importlib
+import multiprocessing
+import os
+import shutil
+from concurrent.futures import Future, ProcessPoolExecutor
+
+import numpy as np
+
+from .history import History
+
+
+_NETWORK_ATTRIBUTES = ('w1', 'w2', 'w', 'b', 'activation', 'history')
+
+
+def _feed(hasher, value):
+    """Add a stable description of value to hasher"""
+    if isinstance(value, (np.ndarray, np.generic)):
+        array = np.ascontiguousarray(value)
+        hasher.update(f"array{array.dtype.str}{array.shape}".encode())
+        hasher.update(array.tobytes())
+    elif isinstance(value, History):
+        for field in sorted(value):
+            hasher.update(f"field {field}".encode())
+            _feed(hasher, value[field])
+            _feed(hasher, value.steps(field))
+    elif isinstance(value, dict):
+        for name in sorted(value, key=repr):
+            _feed(hasher, name)
+            _feed(hasher, value[name])
+    elif isinstance(value, (list, tuple)):
+        hasher.update(f"seq{len(value)}".encode())
+        for item in value:
+            _feed(hasher, item)
+    elif value is None or isinstance(value, (bool, int, float, str, bytes)):
+        hasher.update(repr(value).encode())
+    elif hasattr(value, 'history'):
+        # A network: its class, weights and history (not the values cached by
+        # its last forward pass, which plots recompute anyway)
+        hasher.update(type(value).__name__.encode())
+        _feed(hasher, {name: getattr(value, name) for name in _NETWORK_ATTRIBUTES
+                       if hasattr(value, name)})
+        if hasattr(value, 'layers'):
+            _feed(hasher, [(layer.W, layer.b, layer.activation) for layer in value.layers])
+    else:
+        hasher.update(f"{type(value).__name__}:{value!r}".encode())
+
+
+# Modules whose figure functions render() draws, looked up by name
+_PLOT_MODULES = ('plots', 'landscape')
+
+_plots_source_hash = []
+
+
+def _plots_version():
+    """Hash of the plotting modules, so editing a plot invalidates its cached PNGs"""
+    if not _plots_source_hash:
+        hasher = hashlib.sha256()
+        for name in _PLOT_MODULES:
+            with open(os.path.join(os.path.dirname(__file__), name + '.py'), 'rb') as f:
+                hasher.update(f.read())
+        _plots_source_hash.append(hasher.hexdigest())
+    return _plots_source_hash[0]
+
+
+def _plot_function(plot):
+    """The figure function called `plot` in plots.py or landscape.py"""
+    for name in _PLOT_MODULES:
+        module = importlib.import_module(f'.{name}', __package__)
+        if hasattr(module, plot):
+            return getattr(module, plot)
+    raise AttributeError(f"no plot function named {plot!r}")
+
+
+def figure_key(plot, args=(), kwargs=None, dpi=150):
+    """Hex digest identifying the PNG that plot(*args, **kwargs) would produce"""
+    hasher = hashlib.sha256()
+    _feed(hasher, [plot, _plots_version(), dpi])
+    _feed(hasher, list(args))
+    _feed(hasher, kwargs or {})
+    return hasher.hexdigest()[:32]
+
+
+def _save(fig, path, dpi):
+    """Save fig to path atomically, so a half-written PNG is never cached"""
+    temp_path = f"{path}.{os.getpid()}.tmp.png"
+    fig.savefig(temp_path, dpi=dpi, bbox_inches='tight')
+    os.replace(temp_path, path)
+    return path
+
+
+def _render(plot, args, kwargs, path, dpi):
+    """Runs in the worker process: draw the figure with Agg and save it"""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    fig = _plot_function(plot)(*args, **kwargs)
+    _save(fig, path, dpi)
+    plt.close(fig)
+    return path
+
+
+class RenderJob:
+    """A figure on its way to `path`"""
+
+    def __init__(self, path, key, cached, future):
+        self.path = path
+        self.key = key
+        self.cached = cached
+        self.future = future
+
+    def done(self):
+        return self.future.done()
+
+    def result(self, timeout=None):
+        """Wait for the PNG and return its path (re-raises render errors)"""
+        return self.future.result(timeout)
+
+
+class FigureRenderer:
+    """
+    Renders figures from plots.py and landscape.py to PNG files, cached and in the background.
+
+    Args:
+        cache_dir: Where cached PNGs live (created if missing)
+        dpi: Resolution of the saved PNGs
+        background: Render in a separate process (False renders in this one)
+    """
+
+    def __init__(self, cache_dir='.figure-cache', dpi=150, background=True):
+        self.cache_dir = cache_dir
+        self.dpi = dpi
+        self.background = background
+        self.jobs = []
+        self._pool = None
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def render(self, plot, path, *args, **kwargs):
+        """
+        Produce path from plots.<plot>(*args, **kwargs).
+
+        Returns a RenderJob straight away; the PNG is ready once job.result()
+        returns.
+        """
+        key, cached_path = self._cache_entry(plot, args, kwargs)
+        future = Future()
+        if os.path.exists(cached_path):
+            future.set_result(_copy(cached_path, path))
+            job = RenderJob(path, key, True, future)
+        elif self.background:
+            rendering = self._executor().submit(_render, plot, args, kwargs, cached_path, self.dpi)
+            rendering.add_done_callback(lambda done: _finish(done, cached_path, path, future))
+            job = RenderJob(path, key, False, future)
+        else:
+            _render(plot, args, kwargs, cached_path, self.dpi)
+            future.set_result(_copy(cached_path, path))
+            job = RenderJob(path, key, False, future)
+        self.jobs.append(job)
+        return job
+
+    def draw(self, plot, path, *args, **kwargs):
+        """
+        Build plots.<plot>(*args, **kwargs) in this process and save it to path.
+
+        For figures that are shown as well: the one Figure is both saved
+        (unless the cache already has the PNG) and returned.
+
+        Returns:
+            (RenderJob, Figure); the job is already finished
+        """
+        key, cached_path = self._cache_entry(plot, args, kwargs)
+        fig = _plot_function(plot)(*args, **kwargs)
+        cached = os.path.exists(cached_path)
+        if not cached:
+            _save(fig, cached_path, self.dpi)
+        future = Future()
+        future.set_result(_copy(cached_path, path))
+        job = RenderJob(path, key, cached, future)
+        self.jobs.append(job)
+        return job, fig
+
+    def _cache_entry(self, plot, args, kwargs):
+        """The figure's key and where its PNG is cached"""
+        key = figure_key(plot, args, kwargs, self.dpi)
+        return key, os.path.join(self.cache_dir, key + '.png')
+
+    def _executor(self):
+        if self._pool is None:
+            # spawn: a fresh interpreter, unaffected by the GUI backend in this one
+            self._pool = ProcessPoolExecutor(1, mp_context=multiprocessing.get_context('spawn'))
+        return self._pool
+
+    def wait(self):
+        """Wait for every job; returns them"""
+        for job in self.jobs:
+            job.result()
+        return self.jobs
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _copy(source, destination):
+    if os.path.abspath(source) != os.path.abspath(destination):
+        shutil.copyfile(source, destination)
+    return destination
+
+
+def _finish(rendering, cached_path, path, future):
+    """Pass the worker's result (or error) on once the PNG is copied into place"""
+    try:
+        rendering.result()
+        future.set_result(_copy(cached_path, path))
+    except BaseException as exc:
+        future.set_exception(exc)
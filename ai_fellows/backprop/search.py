@@ -0,0 +1,261 @@
+"""
+Grid search over network settings on several processes.
+
+train_ensemble() handles sweeps where every member has the same shape. For
+sweeps over different architectures, batch sizes or optimizers, each
+configuration is trained separately, spread over a process pool:
+
+    configs = param_grid(network=['MLP'], sizes=[[1, 8, 1], [1, 32, 32, 1]],
+                         learning_rate=[0.01, 0.05, 0.2], batch_size=[16, 64], epochs=[30])
+    for result in grid_search(configs, x_data, y_data, workers=4):
+        print(result.config, result.status, result.losses[-1])
+
+The training data is copied into shared memory once; workers map it
+instead of receiving a pickled copy with every configuration. Results are
+yielded as each configuration finishes.
+
+Every epoch, workers report their loss. From min_epochs on, a running
+configuration whose loss is more than cancel_ratio times the best loss any
+configuration has reported for the same epoch is told to stop, and does so
+at its next report. Configurations still waiting for a worker don't hold
+anything up, and a better loss arriving later for an epoch is checked
+against the running configurations that already reported it. One that is
+told after its last epoch has simply finished and counts as DONE.
+"""
+
+import itertools
+import math
+import multiprocessing
+import queue
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+from typing import NamedTuple
+
+import numpy as np
+
+DONE = 'done'
+CANCELLED = 'cancelled'
+FAILED = 'failed'
+
+
+class SearchResult(NamedTuple):
+    """How one configuration did"""
+    index: int          # position in the list of configs
+    config: dict
+    losses: list        # loss after each epoch
+    status: str         # DONE, CANCELLED or FAILED
+    error: str          # exception message if FAILED, else None
+    seconds: float
+
+
+def param_grid(**choices):
+    """
+    Every combination of the given choices, as a list of config dicts.
+
+        param_grid(learning_rate=[0.01, 0.1], batch_size=[16, 64])
+        # [{'learning_rate': 0.01, 'batch_size': 16}, ... 4 configs]
+    """
+    names = list(choices)
+    return [dict(zip(names, values)) for values in itertools.product(*choices.values())]
+
+
+class SharedArray:
+    """
+    A numpy array in a named shared-memory block.
+
+    The parent creates it from an array; workers attach() with the small,
+    picklable spec() and get a read-only view of the same memory.
+    """
+
+    def __init__(self, array):
+        array = np.ascontiguousarray(array)
+        self.shape = array.shape
+        self.dtype = array.dtype
+        self.block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        self.array = np.ndarray(self.shape, self.dtype, buffer=self.block.buf)
+        self.array[...] = array
+
+    def spec(self):
+        return self.block.name, self.shape, self.dtype.str
+
+    @staticmethod
+    def attach(spec):
+        """Map a shared block in a worker; returns (block, read-only array)"""
+        name, shape, dtype = spec
+        block = shared_memory.SharedMemory(name=name)
+        array = np.ndarray(shape, np.dtype(dtype), buffer=block.buf)
+        array.flags.writeable = False
+        return block, array
+
+    def close(self):
+        """Free the block (call once, in the process that created it)"""
+        self.array = None
+        self.block.close()
+        self.block.unlink()
+
+
+def build_network(config):
+    """
+    Create the network a config describes.
+
+    Keys: network ('SimpleNetwork', 'NonlinearNetwork', 'RegressionNetwork'
+    or 'MLP'), seed, optimizer (a name from OPTIMIZERS), and per class
+    w1/w2, fused, or sizes/activation.
+    """
+    from . import networks
+    from .mlp import MLP
+    from .optimizers import OPTIMIZERS
+
+    name = config.get('network', 'RegressionNetwork')
+    seed = config.get('seed', 0)
+    optimizer = config.get('optimizer')
+    optimizer = OPTIMIZERS[optimizer]() if optimizer else None
+
+    if name == 'MLP':
+        net = MLP.build(config['sizes'], activation=config.get('activation', 'tanh'), seed=seed)
+        net.optimizer = optimizer
+        return net
+    if name == 'RegressionNetwork':
+        np.random.seed(seed)
+        return networks.RegressionNetwork(optimizer=optimizer, fused=config.get('fused', False))
+    if name in ('SimpleNetwork', 'NonlinearNetwork'):
+        return getattr(networks, name)(w1=config.get('w1', 1.0), w2=config.get('w2', 3.0),
+                                       optimizer=optimizer)
+    raise ValueError(f"Unknown network '{name}'")
+
+
+def train_config(config, x, y, report):
+    """
+    Default training function: mini-batch training for config['epochs'] epochs.
+
+    report(epoch, loss) is called after every epoch and returns False once
+    the search has cancelled this configuration. Returns True if training
+    stopped before its last epoch because of that.
+    """
+    from .training import train_batches
+
+    net = build_network(config)
+    batch_size = config.get('batch_size', len(x))
+    rng = np.random.default_rng(config.get('seed', 0))
+    epochs = config.get('epochs', 10)
+    for epoch in range(epochs):
+        order = rng.permutation(len(x))
+        batches = [(x[order[i:i + batch_size]], y[order[i:i + batch_size]])
+                   for i in range(0, len(x), batch_size)]
+        loss = train_batches(net, batches, learning_rate=config.get('learning_rate', 0.01))[0]
+        if not report(epoch, loss) and epoch + 1 < epochs:
+            return True
+    return False
+
+
+# Worker-side state, set once per process by _init_worker
+_worker = {}
+
+
+def _init_worker(x_spec, y_spec, cancel_flags, progress):
+    x_block, x = SharedArray.attach(x_spec)
+    y_block, y = SharedArray.attach(y_spec)
+    # Keep the blocks referenced for as long as the worker lives
+    _worker.update(blocks=(x_block, y_block), x=x, y=y, cancel=cancel_flags, progress=progress)
+
+
+def _run(index, config, train_fn):
+    """Train one config in a worker; returns (losses, status, error message, seconds)"""
+    losses = []
+    cancel = _worker['cancel']
+    progress = _worker['progress']
+
+    def report(epoch, loss):
+        losses.append(float(loss))
+        progress.put((index, epoch, float(loss)))
+        return not cancel[index]
+
+    start = time.perf_counter()
+    try:
+        stopped_early = train_fn(config, _worker['x'], _worker['y'], report)
+    except Exception as exc:
+        return losses, FAILED, f"{type(exc).__name__}: {exc}", time.perf_counter() - start
+    status = CANCELLED if stopped_early else DONE
+    return losses, status, None, time.perf_counter() - start
+
+
+def grid_search(configs, x, y, train_fn=train_config, workers=None, cancel_ratio=2.0,
+                min_epochs=3, poll=0.05):
+    """
+    Train every config on a process pool and yield SearchResults as they finish.
+
+    Args:
+        configs: List of config dicts (see param_grid and build_network)
+        x, y: Training data, shared with the workers through shared memory
+        train_fn: Top-level function train_fn(config, x, y, report) returning
+            True if it stopped early when report() said so; see train_config
+        workers: Number of processes (default: CPU count)
+        cancel_ratio: Cancel a config whose loss is this many times the best
+            loss reported so far for the same epoch (None never cancels)
+        min_epochs: Epochs every config gets before it can be cancelled
+        poll: Seconds between checks for progress reports
+
+    Closing the generator early (e.g. breaking out of the loop) drops the
+    configs that haven't started and stops the running ones at their next
+    report.
+    """
+    configs = list(configs)
+    shared = [SharedArray(x), SharedArray(y)]
+    context = multiprocessing.get_context()
+    cancel_flags = context.Array('b', len(configs), lock=False)
+    progress = context.Queue()
+    best_at_epoch = {}          # epoch -> lowest loss any config reported for it
+    running_losses = {}         # epoch -> {config index: loss} for configs still training
+    finished_indices = set()
+
+    def record(index, epoch, loss, running=True):
+        """Note one epoch's loss; cancel running configs too far behind that epoch's best"""
+        if epoch + 1 < min_epochs:
+            return
+        if running:
+            running_losses.setdefault(epoch, {})[index] = loss
+        if loss < best_at_epoch.get(epoch, math.inf):
+            best_at_epoch[epoch] = loss
+        if epoch not in best_at_epoch:
+            return
+        limit = cancel_ratio * best_at_epoch[epoch]
+        for other, other_loss in running_losses.get(epoch, {}).items():
+            if not other_loss <= limit:
+                cancel_flags[other] = 1
+
+    pool = ProcessPoolExecutor(workers, mp_context=context, initializer=_init_worker,
+                               initargs=(shared[0].spec(), shared[1].spec(), cancel_flags, progress))
+    try:
+        pending = {pool.submit(_run, i, config, train_fn): i for i, config in enumerate(configs)}
+        while pending:
+            finished, _ = wait(pending, timeout=poll, return_when=FIRST_COMPLETED)
+
+            # Progress reports, as each config finishes an epoch
+            while True:
+                try:
+                    index, epoch, loss = progress.get_nowait()
+                except queue.Empty:
+                    break
+                if cancel_ratio is not None and index not in finished_indices:
+                    record(index, epoch, loss)
+
+            results = []
+            for future in finished:
+                index = pending.pop(future)
+                result = SearchResult(index, configs[index], *future.result())
+                finished_indices.add(index)
+                if cancel_ratio is not None:
+                    for losses in running_losses.values():
+                        losses.pop(index, None)
+                    # The result has every loss, even reports still on their way
+                    for epoch, loss in enumerate(result.losses):
+                        record(index, epoch, loss, running=False)
+                results.append(result)
+            yield from results
+    finally:
+        for index in range(len(configs)):
+            cancel_flags[index] = 1
+        pool.shutdown(wait=True, cancel_futures=True)
+        for array in shared:
+            array.close()
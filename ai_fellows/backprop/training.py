@@ -0,0 +1,130 @@
+"""
+Training routines shared by the demo script and the notebook.
+"""
+
+import numpy as np
+
+
+def train(net, x, target, steps, learning_rate=0.1, callback=None):
+    """
+    Run `steps` training steps on any of the network classes.
+
+    Args:
+        net: A network with a train_step(x, target, learning_rate) method
+        x: Input value (or x_batch for RegressionNetwork)
+        target: Target value (or y_batch for RegressionNetwork)
+        steps: Number of training steps
+        learning_rate: Step size for gradient descent
+        callback: Optional function called as callback(step, net, error)
+
+    Returns:
+        List of the error (or loss) returned by each step
+    """
+    errors = []
+    for step in range(steps):
+        error = net.train_step(x, target, learning_rate=learning_rate)
+        errors.append(error)
+        if callback is not None:
+            callback(step, net, error)
+    return errors
+
+
+def train_batches(net, batches, epochs=1, learning_rate=0.01, callback=None):
+    """
+    Train on a stream of (x_batch, y_batch) mini-batches, e.g. a BatchLoader.
+
+    RegressionNetwork and MLP take one step per batch. The worksheet networks
+    only understand one example at a time, so they take one step per row.
+
+    Args:
+        net: Any of the network classes
+        batches: Re-iterable source of (x_batch, y_batch) pairs
+        epochs: Passes over the batches
+        learning_rate: Step size for gradient descent
+        callback: Optional function called as callback(epoch, batch, net, error)
+
+    Returns:
+        List with the mean error (or loss) of each epoch
+    """
+    per_batch = getattr(net, 'trains_on_batches', False)
+    epoch_errors = []
+    for epoch in range(epochs):
+        total = 0.0
+        rows = 0
+        for i, (x_batch, y_batch) in enumerate(batches):
+            if per_batch:
+                error = net.train_step(x_batch, y_batch, learning_rate=learning_rate)
+            else:
+                error = np.mean([net.train_step(x, y, learning_rate=learning_rate)
+                                 for x, y in zip(x_batch, y_batch)])
+            total += error * len(x_batch)
+            rows += len(x_batch)
+            if callback is not None:
+                callback(epoch, i, net, error)
+        epoch_errors.append(total / max(rows, 1))
+    return epoch_errors
+
+
+def steps_to_tolerance(net, x, target, tolerance=1e-6, learning_rate=0.1, max_steps=10_000,
+                       best_error=0.0):
+    """
+    Train until the error is within tolerance of the best possible error.
+
+    Args:
+        net: A network (with or without an optimizer)
+        x, target: Training input and target (or x_batch, y_batch)
+        tolerance: How close to best_error counts as converged
+        learning_rate: Step size passed to every train_step
+        max_steps: Give up after this many steps
+        best_error: The lowest reachable error (0 for the worksheet; the
+            least-squares loss for noisy regression data)
+
+    Returns:
+        Number of steps taken, or None if it never got there
+    """
+    for step in range(1, max_steps + 1):
+        error = net.train_step(x, target, learning_rate=learning_rate)
+        if np.all(np.abs(error - best_error) <= tolerance):
+            return step
+    return None
+
+
+def compare_optimizers(make_net, optimizers, x, target, learning_rate=0.1, **kwargs):
+    """
+    steps_to_tolerance() for a fresh network with each optimizer.
+
+    Args:
+        make_net: Function taking optimizer= and returning a new network,
+            e.g. lambda optimizer: SimpleNetwork(optimizer=optimizer)
+        optimizers: Dict of label -> optimizer (None for plain gradient descent)
+        x, target: Training data
+        learning_rate: A single step size, or a dict of label -> step size
+        **kwargs: Passed on to steps_to_tolerance (tolerance, max_steps, best_error)
+
+    Returns:
+        Dict of label -> steps to tolerance (None if it didn't converge)
+    """
+    results = {}
+    for label, optimizer in optimizers.items():
+        rate = learning_rate[label] if isinstance(learning_rate, dict) else learning_rate
+        results[label] = steps_to_tolerance(make_net(optimizer=optimizer), x, target,
+                                            learning_rate=rate, **kwargs)
+    return results
+
+
+def make_regression_data(n_points=20, slope=2.0, intercept=3.0, noise=1.0, seed=42):
+    """
+    Generate the Part 5 dataset: y = slope*x + intercept + noise on [0, 10].
+
+    Seeding uses numpy's global random state (like the notebook), so a
+    RegressionNetwork created right afterwards gets the same starting weights
+    every run.
+
+    Returns:
+        tuple of numpy arrays (x_data, y_data)
+    """
+    if seed is not None:
+        np.random.seed(seed)
+    x_data = np.linspace(0, 10, n_points)
+    y_data = slope * x_data + intercept + np.random.normal(0, noise, n_points)
+    return x_data, y_data
@@ -0,0 +1,115 @@
+"""
+The `ai-fellows` command.
+
+Starting up must stay cheap: `ai-fellows --help` is answered before numpy or
+matplotlib is imported. Each subcommand imports its lesson module, and with it
+the libraries it needs, only when it runs, so grading never loads pyplot itself
+and only the figure-making commands pay for matplotlib.
+"""
+
+import argparse
+import os
+import sys
+
+
+def headless():
+    """Draw figures without a window (unless a backend was chosen already)"""
+    os.environ.setdefault('MPLBACKEND', 'Agg')
+
+
+# -- subcommands -------------------------------------------------------------------
+
+def grade(args):
+    # Notebooks call plt.show(); there is nobody to look at the windows
+    headless()
+    from . import grading
+
+    status = 0
+    for notebook in args.notebooks:
+        try:
+            grading.main([notebook])
+        except SystemExit as exc:
+            status = max(status, exc.code or 0)
+    return status
+
+
+def montyhall(args):
+    if args.no_show:
+        headless()
+    from . import montyhall as simulation
+
+    plt = simulation.plt
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    print(f"Creating static visualization with {args.trials:,} trials...")
+    fig = simulation.create_static_visualization(args.trials)
+    path = os.path.join(args.output_dir, 'monty_hall_static.png')
+    fig.savefig(path, dpi=150, bbox_inches='tight')
+    plt.close(fig)
+    print(f"Saved: {path}")
+
+    print("\nCreating sample size comparison...")
+    fig = simulation.run_comparison(args.comparison)
+    path = os.path.join(args.output_dir, 'monty_hall_comparison.png')
+    fig.savefig(path, dpi=150, bbox_inches='tight')
+    plt.close(fig)
+    print(f"Saved: {path}")
+
+    if args.animate and not args.no_show:
+        print("\nCreating animated visualization...")
+        print("Close the window when animation completes.")
+        anim = simulation.create_animated_visualization(target_trials=args.animate, interval=50)
+        plt.show()
+    simulation.teacher_instructions()
+    return 0
+
+
+def backprop(args, extra):
+    from .backprop import simulator
+
+    simulator.main(extra, prog='ai-fellows backprop')
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='ai-fellows', description="Run the AI Fellows lessons from the command line.")
+    parser.add_argument('--version', action='version', version='%(prog)s 0.1.0')
+    commands = parser.add_subparsers(dest='command', metavar='COMMAND', required=True)
+
+    grade_parser = commands.add_parser(
+        'grade', help="grade Monte Carlo π notebooks",
+        description="Grade student notebooks for the Monte Carlo π lesson. Each report "
+                    "is saved next to its notebook as <name>_grade_report.txt.")
+    grade_parser.add_argument('notebooks', nargs='+', metavar='NOTEBOOK', help=".ipynb files to grade")
+
+    monty_parser = commands.add_parser(
+        'montyhall', help="Monty Hall simulation figures",
+        description="Simulate the Monty Hall problem and save the classroom figures.")
+    monty_parser.add_argument('--trials', type=int, default=10000,
+                              help="trials for the static figure (default 10000)")
+    monty_parser.add_argument('--comparison', type=int, nargs='+', default=[100, 1000, 10000],
+                              metavar='N', help="trial counts to compare (default 100 1000 10000)")
+    monty_parser.add_argument('--output-dir', default='.', help="where to save the PNGs")
+    monty_parser.add_argument('--animate', type=int, nargs='?', const=1000, default=None,
+                              metavar='TRIALS', help="also show the live animation (default 1000 trials)")
+    monty_parser.add_argument('--no-show', action='store_true', help="never open plot windows")
+
+    commands.add_parser(
+        'backprop', add_help=False, help="the backpropagation simulator (chain rule lesson)",
+        description="Run the backpropagation simulator; every option is passed on to it "
+                    "(see `ai-fellows backprop --help`).")
+    return parser
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    parser = build_parser()
+    args, extra = parser.parse_known_args(argv)
+    if args.command == 'backprop':
+        return backprop(args, extra)
+    if extra:
+        parser.error(f"unrecognized arguments: {' '.join(extra)}")
+    if args.command == 'grade':
+        return grade(args)
+    return montyhall(args)
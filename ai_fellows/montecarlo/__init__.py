@@ -0,0 +1,84 @@
+"""
+Monte Carlo π library for the calculating-pi lesson.
+
+Reference implementations of the notebook's functions:
+
+    from ai_fellows.montecarlo import estimate_pi
+    np.random.seed(42)
+    pi_est, x, y, inside = estimate_pi(1000)         # same as the KEY notebook
+    pi_est = estimate_pi(10**10, return_points=False)   # constant memory
+    estimate_pi_parallel(10**10, seed=42)                # every core, ± standard error
+    estimate_pi(2**16, return_points=False, method='sobol')   # quasi-Monte Carlo
+
+Importing the package only loads numpy. The plotting functions import
+matplotlib the first time one of them is called.
+"""
+
+from .estimate import (
+    CHUNK_SIZE,
+    random_source,
+    generate_random_points,
+    is_inside_circle,
+    sample_points,
+    count_inside,
+    estimate_pi,
+)
+from .sampling import SAMPLERS, get_sampler
+from .convergence import (
+    convergence_sizes,
+    analyze_convergence,
+    sampling_convergence,
+    points_needed,
+    sampling_report,
+)
+from .statistics import RunningStats, run_multiple_simulations
+from .plots import SCATTER_LIMIT, rasterize, density_to_rgba, visualize_simulation
+from .fast import (
+    PRECISIONS,
+    FLOAT32_BIAS_BOUND,
+    count_inside_fast,
+    estimate_pi_fast,
+    fixed_point_bias,
+    bias_bound,
+)
+from .parallel import (
+    BLOCK_SIZE,
+    ParallelEstimate,
+    block_sizes,
+    standard_error,
+    estimate_pi_parallel,
+)
+
+__all__ = [
+    'CHUNK_SIZE',
+    'random_source',
+    'generate_random_points',
+    'is_inside_circle',
+    'sample_points',
+    'count_inside',
+    'estimate_pi',
+    'SAMPLERS',
+    'get_sampler',
+    'convergence_sizes',
+    'analyze_convergence',
+    'sampling_convergence',
+    'points_needed',
+    'sampling_report',
+    'RunningStats',
+    'run_multiple_simulations',
+    'SCATTER_LIMIT',
+    'rasterize',
+    'density_to_rgba',
+    'visualize_simulation',
+    'PRECISIONS',
+    'FLOAT32_BIAS_BOUND',
+    'count_inside_fast',
+    'estimate_pi_fast',
+    'fixed_point_bias',
+    'bias_bound',
+    'BLOCK_SIZE',
+    'ParallelEstimate',
+    'block_sizes',
+    'standard_error',
+    'estimate_pi_parallel',
+]
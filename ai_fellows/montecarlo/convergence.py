@@ -0,0 +1,169 @@
+"""
+How fast the estimate converges, and how many points an accuracy costs.
+
+For each sampling method the estimate is repeated with independently seeded
+runs at n = min_n, 2 min_n, 4 min_n, ... max_n points, and the root mean
+square error against math.pi is measured at each size. On a log-log plot
+that error is a straight line, error ≈ C n^slope:
+
+- random points: slope -1/2 (100x the points for 10x the accuracy)
+- stratified grids and QMC sequences: slope about -3/4 (the circle's sharp
+  edge keeps them from the -1 they reach for smooth functions)
+
+sampling_report() turns that into a table of the points each method needs
+to reach a target error:
+
+    print(sampling_report(target_error=1e-3))
+
+analyze_convergence() is the notebook's function done in one pass: rather
+than a fresh simulation for every sample size (total cost the sum of all the
+sizes), it throws max_n darts once and reads the estimate after 100, 200, ...
+darts off a running count of hits.
+"""
+
+import math
+
+import numpy as np
+
+from .estimate import CHUNK_SIZE, count_inside, is_inside_circle, random_source
+from .sampling import SAMPLERS, get_sampler
+
+
+def convergence_sizes(max_n, num_points, min_n=100, log_spaced=False):
+    """
+    The sample sizes analyze_convergence reads the estimate at.
+
+    Linear spacing matches the notebook (np.linspace(100, max_n, num_points)).
+    Log spacing puts as many sizes in 100-1000 as in 10^4-10^5; sizes that
+    round to the same integer are merged, so there can be fewer than num_points.
+    """
+    if log_spaced:
+        return np.unique(np.geomspace(min_n, max_n, num_points).astype(np.int64))
+    return np.linspace(min_n, max_n, num_points, dtype=np.int64)
+
+
+def analyze_convergence(max_n=100000, num_points=50, log_spaced=False, min_n=100,
+                        chunk_size=CHUNK_SIZE, seed=None, method='uniform',
+                        return_errors=False):
+    """
+    Analyze how the π estimate converges as sample size increases.
+
+    The estimate at each size is that of the first n darts of a single run
+    of max_n, so the cost is max_n points, and memory is one chunk plus the
+    results, however many sizes are asked for.
+
+    Args:
+        max_n: Maximum number of samples
+        num_points: Number of different sample sizes to test
+        log_spaced: Space the sizes logarithmically instead of linearly
+        min_n: Smallest sample size
+        chunk_size: Points generated at a time
+        seed: See random_source() (default: the global np.random state)
+        method: Sampling method. Not 'stratified', whose grid depends on n,
+            so the first darts of a big grid aren't a smaller grid.
+        return_errors: Also return |estimate - π| at each size
+
+    Returns:
+        (sample_sizes, pi_estimates), plus errors if return_errors is True
+    """
+    if method == 'stratified':
+        raise ValueError("A stratified grid can't be read off at smaller sizes; "
+                         "use sampling_convergence() for it")
+    sample_sizes = convergence_sizes(max_n, num_points, min_n, log_spaced)
+    inside_at = np.empty(len(sample_sizes), dtype=np.int64)
+
+    inside = 0       # hits among the darts before this chunk
+    start = 0
+    next_size = 0    # index of the first size not read yet
+    for x, y in get_sampler(method)(int(sample_sizes[-1]), random_source(seed), chunk_size):
+        hits = is_inside_circle(x, y)
+        end = start + len(hits)
+        last = np.searchsorted(sample_sizes, end, side='right')
+        if last > next_size:
+            # Running count at the sizes that fall inside this chunk
+            running = np.cumsum(hits, dtype=np.int64)
+            inside_at[next_size:last] = inside + running[sample_sizes[next_size:last] - start - 1]
+            next_size = last
+        inside += int(np.count_nonzero(hits))
+        start = end
+
+    pi_estimates = 4 * inside_at / sample_sizes
+    if return_errors:
+        return sample_sizes, pi_estimates, np.abs(pi_estimates - math.pi)
+    return sample_sizes, pi_estimates
+
+
+def sampling_convergence(methods=None, min_n=2**6, max_n=2**20, repeats=10, seed=0,
+                         chunk_size=CHUNK_SIZE):
+    """
+    RMS error of each sampling method at powers-of-2 sample sizes.
+
+    Args:
+        methods: Method names (default: all of them)
+        min_n, max_n: Smallest and largest sample size (powers of 2 in between)
+        repeats: Independently seeded runs per size
+        seed: Seed for the whole comparison
+
+    Returns:
+        dict of method -> {'n': sizes, 'rmse': errors, 'slope': fitted exponent}
+    """
+    sizes = 2 ** np.arange(int(math.log2(min_n)), int(math.log2(max_n)) + 1)
+    results = {}
+    for method in methods or SAMPLERS:
+        streams = np.random.SeedSequence(seed).spawn(repeats)
+        errors = np.empty((repeats, len(sizes)))
+        for r, stream in enumerate(streams):
+            rng = np.random.default_rng(stream)
+            for i, n in enumerate(sizes):
+                errors[r, i] = 4 * count_inside(int(n), chunk_size, rng, method) / n - math.pi
+        rmse = np.sqrt(np.mean(errors**2, axis=0))
+        slope = np.polyfit(np.log(sizes), np.log(rmse), 1)[0]
+        results[method] = {'n': sizes, 'rmse': rmse, 'slope': slope}
+    return results
+
+
+def points_needed(sizes, rmse, target_error):
+    """
+    Smallest size whose error is within target_error.
+
+    If no measured size gets there, the fitted line through the larger half
+    of the sizes is extended until it does.
+
+    Returns:
+        (points, measured): measured is False for an extrapolated answer
+    """
+    reached = np.flatnonzero(rmse <= target_error)
+    if len(reached):
+        return int(sizes[reached[0]]), True
+    tail = slice(len(sizes) // 2, None)
+    slope, intercept = np.polyfit(np.log(sizes[tail]), np.log(rmse[tail]), 1)
+    if slope >= 0:
+        return None, False
+    return int(math.ceil(math.exp((math.log(target_error) - intercept) / slope))), False
+
+
+def sampling_report(target_error=1e-3, **kwargs):
+    """
+    A plain-text table comparing sampling methods.
+
+    Columns: how fast the error falls (its exponent), the error at the largest
+    size, and the points needed to reach target_error, also relative to
+    plain random points. Keyword arguments go to sampling_convergence().
+    """
+    results = sampling_convergence(**kwargs)
+    needed = {method: points_needed(r['n'], r['rmse'], target_error) for method, r in results.items()}
+    baseline = needed.get('uniform', (None,))[0]
+
+    header = (f"{'method':<12}{'error ~ n^':>11}{'RMSE at ' + format(results[next(iter(results))]['n'][-1], ','):>20}"
+              f"{'points for ' + format(target_error, 'g'):>22}{'vs uniform':>14}")
+    lines = [header, '-' * len(header)]
+    for method, r in results.items():
+        points, measured = needed[method]
+        if points is None:
+            points_text, ratio_text = 'not reached', ''
+        else:
+            points_text = f"{'' if measured else '~'}{points:,}"
+            ratio_text = f"{baseline / points:.1f}x fewer" if baseline and method != 'uniform' else ''
+        lines.append(f"{method:<12}{r['slope']:>11.2f}{r['rmse'][-1]:>20.2e}{points_text:>22}{ratio_text:>14}")
+    lines.append("~ marks a count extrapolated beyond the largest sample size")
+    return '\n'.join(lines)
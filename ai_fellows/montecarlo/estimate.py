@@ -0,0 +1,125 @@
+"""
+Reference versions of the notebook's π estimator.
+
+estimate_pi(n) behaves exactly like the function in
+monte_carlo_pi_simulation_KEY.ipynb: it draws n x-coordinates and then n
+y-coordinates from np.random, and returns the points with the estimate.
+That needs three arrays of length n (about 17 bytes per point), so
+n = 10^9 takes ~17 GB.
+
+With return_points=False only the number of points inside the circle is
+kept. The points are generated CHUNK_SIZE at a time, so memory stays the
+same however large n gets:
+
+    np.random.seed(42)
+    pi_est = estimate_pi(10**10, return_points=False)
+
+Seeding works the same in both modes. By default points come from the global
+np.random state, so np.random.seed(42) makes a run repeatable, exactly like
+the notebook. Pass seed=<int> (or a RandomState / Generator) to use a
+separate stream instead. Each chunk draws its x-coordinates and then its
+y-coordinates, so for n <= chunk_size both modes use the very same numbers.
+
+method='antithetic', 'stratified', 'halton' or 'sobol' spreads the points
+more evenly than independent random points do (see sampling.py).
+"""
+
+import numpy as np
+
+from .sampling import get_sampler
+
+CHUNK_SIZE = 2**20
+
+
+def random_source(seed=None):
+    """
+    Where random numbers come from.
+
+    Args:
+        seed: None for the global np.random state (what np.random.seed
+            controls), an int for a fresh RandomState(seed), or an existing
+            RandomState / Generator
+
+    Returns:
+        An object with a uniform(low, high, size) method
+    """
+    if seed is None:
+        return np.random
+    if hasattr(seed, 'uniform'):
+        return seed
+    return np.random.RandomState(seed)
+
+
+def generate_random_points(n, seed=None):
+    """
+    Generate n random points within a 2x2 square centered at the origin.
+
+    Returns:
+        (x_coordinates, y_coordinates)
+    """
+    rng = random_source(seed)
+    x = rng.uniform(-1, 1, n)
+    y = rng.uniform(-1, 1, n)
+    return x, y
+
+
+def is_inside_circle(x, y):
+    """True where x^2 + y^2 <= 1"""
+    return x**2 + y**2 <= 1
+
+
+def sample_points(n, method='uniform', seed=None):
+    """
+    n points in the 2x2 square chosen by a sampling method.
+
+    method='uniform' gives the same points as generate_random_points.
+
+    Returns:
+        (x_coordinates, y_coordinates)
+    """
+    chunks = list(get_sampler(method)(n, random_source(seed), max(n, 1)))
+    if len(chunks) == 1:
+        return chunks[0]
+    return tuple(np.concatenate(coords) for coords in zip(*chunks))
+
+
+def count_inside(n, chunk_size=CHUNK_SIZE, seed=None, method='uniform'):
+    """
+    Number of n points that land inside the unit circle.
+
+    Only one chunk of points exists at a time, so memory is about
+    16 * chunk_size bytes for any n.
+
+    Returns:
+        Exact count as a Python int
+    """
+    inside = 0
+    for x, y in get_sampler(method)(n, random_source(seed), chunk_size):
+        inside += int(np.count_nonzero(is_inside_circle(x, y)))
+    return inside
+
+
+def estimate_pi(n, return_points=True, chunk_size=CHUNK_SIZE, seed=None, method='uniform'):
+    """
+    Estimate the value of π using Monte Carlo simulation.
+
+    Args:
+        n: Number of random points
+        return_points: Keep and return the points (for plotting, small n).
+            False streams the points in chunks and returns only the estimate.
+        chunk_size: Points per chunk when streaming
+        seed: See random_source()
+        method: How points are chosen: 'uniform' (random, as in the
+            notebook), 'antithetic', 'stratified', 'halton' or 'sobol'
+
+    Returns:
+        (estimated_pi, x_coords, y_coords, inside_circle_mask), or just
+        estimated_pi when return_points is False
+    """
+    if not return_points:
+        return 4 * count_inside(n, chunk_size, seed, method) / n
+
+    x, y = sample_points(n, method, seed)
+    inside = is_inside_circle(x, y)
+    pi_estimate = 4 * np.sum(inside) / n
+    return pi_estimate, x, y, inside
@@ -0,0 +1,111 @@
+"""
+Estimate π on every core.
+
+The n points are split into blocks of BLOCK_SIZE, and block i draws from its
+own Generator seeded with SeedSequence(seed).spawn(...)[i]. The spawned
+seed sequences are statistically independent streams, and which block gets
+which stream depends only on (seed, n, block_size), never on how many
+workers there are or which one ran the block. The per-block inside-counts
+are integers and are summed exactly, so
+
+    estimate_pi_parallel(10**10, seed=42, workers=2)
+    estimate_pi_parallel(10**10, seed=42, workers=16)
+
+return exactly the same estimate. The count of hits is binomial, so the
+estimate comes with a standard error of 4 * sqrt(p (1 - p) / n), where
+p = inside / n, which shrinks like 1/sqrt(n).
+"""
+
+import math
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+import numpy as np
+
+from .estimate import CHUNK_SIZE, count_inside
+
+BLOCK_SIZE = 2**24
+
+
+class ParallelEstimate(NamedTuple):
+    """Result of estimate_pi_parallel"""
+    pi: float
+    standard_error: float
+    inside: int         # points inside the circle, summed over blocks
+    n: int
+    seed: int           # entropy of the root SeedSequence; reuse it to repeat the run
+    blocks: int
+    workers: int
+    seconds: float
+
+
+def _count_block(seed_sequence, size, chunk_size):
+    """Runs in a worker: inside-count for one block from its own stream"""
+    rng = np.random.Generator(np.random.PCG64(seed_sequence))
+    return count_inside(size, chunk_size, rng)
+
+
+def block_sizes(n, block_size=BLOCK_SIZE):
+    """Sizes of the blocks n points are split into (all full but the last)"""
+    full, rest = divmod(n, block_size)
+    return [block_size] * full + ([rest] if rest else [])
+
+
+def standard_error(inside, n):
+    """Standard error of 4 * inside / n for a binomial count"""
+    p = inside / n
+    return 4 * math.sqrt(p * (1 - p) / n)
+
+
+def estimate_pi_parallel(n, seed=None, workers=None, block_size=BLOCK_SIZE,
+                         chunk_size=CHUNK_SIZE):
+    """
+    Estimate π from n points spread over a process pool.
+
+    Args:
+        n: Number of random points
+        seed: Int (or SeedSequence) the run is reproducible from. None picks
+            fresh entropy, which is returned as result.seed. A SeedSequence
+            is not modified: passing the same one twice repeats the run.
+        workers: Processes to use (default: all CPUs). 1 runs in this process.
+        block_size: Points per independently seeded block. Changing it changes
+            the random numbers; changing workers does not.
+        chunk_size: Points generated at a time inside a block (memory use)
+
+    Returns:
+        ParallelEstimate
+    """
+    if n <= 0:
+        raise ValueError(f"n must be a positive number of points, not {n}")
+    start = time.perf_counter()
+    if isinstance(seed, np.random.SeedSequence):
+        # spawn() counts the children it made; spawn from a copy, not the caller's
+        root = np.random.SeedSequence(seed.entropy, spawn_key=seed.spawn_key,
+                                      pool_size=seed.pool_size)
+    else:
+        root = np.random.SeedSequence(seed)
+    sizes = block_sizes(n, block_size)
+    streams = root.spawn(len(sizes))
+    workers = min(workers or os.cpu_count() or 1, len(sizes)) or 1
+
+    if workers == 1:
+        counts = [_count_block(stream, size, chunk_size) for stream, size in zip(streams, sizes)]
+    else:
+        with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context()) as pool:
+            counts = list(pool.map(_count_block, streams, sizes,
+                                   [chunk_size] * len(sizes)))
+
+    inside = sum(counts)
+    return ParallelEstimate(
+        pi=4 * inside / n,
+        standard_error=standard_error(inside, n),
+        inside=inside,
+        n=n,
+        seed=root.entropy,
+        blocks=len(sizes),
+        workers=workers,
+        seconds=time.perf_counter() - start,
+    )
@@ -0,0 +1,137 @@
+"""
+Pictures of the simulation that stay fast for any number of points.
+
+plt.scatter draws one marker per point, which is fine for the notebook's
+1000 points but takes many seconds (and a huge figure) past about 10^5.
+visualize_simulation(mode='density') instead bins the points straight into
+a pixel grid as they are generated, one np.bincount for the points inside
+the circle and one for those outside, and shows that grid with imshow. Only
+the binning depends on n, so 10^8 points draw as fast as 10^4.
+
+Each pixel is coloured like the scatter plot would look: blue for inside,
+red for outside, and as opaque as `alpha` markers stacked `count` deep,
+1 - (1 - alpha)^count.
+
+matplotlib is only imported when a plotting function is called.
+"""
+
+import math
+
+import numpy as np
+
+from .estimate import CHUNK_SIZE, estimate_pi, is_inside_circle, random_source
+from .sampling import get_sampler
+
+# Above this many points, mode='auto' draws a density image instead of markers
+SCATTER_LIMIT = 20_000
+
+
+def rasterize(n, resolution=800, chunk_size=CHUNK_SIZE, seed=None, method='uniform'):
+    """
+    Generate n points and count them per pixel, without keeping them.
+
+    Args:
+        n: Number of points
+        resolution: The image is resolution x resolution pixels over the square
+        chunk_size: Points generated at a time
+        seed: See random_source()
+        method: Sampling method (see sampling.py)
+
+    Returns:
+        (inside, outside): int64 arrays of shape (resolution, resolution),
+        indexed [row (y), column (x)] with row 0 at y = -1
+    """
+    pixels = resolution * resolution
+    inside = np.zeros(pixels, dtype=np.int64)
+    outside = np.zeros(pixels, dtype=np.int64)
+    for x, y in get_sampler(method)(n, random_source(seed), chunk_size):
+        column = np.clip(((x + 1) * (resolution / 2)).astype(np.int64), 0, resolution - 1)
+        row = np.clip(((y + 1) * (resolution / 2)).astype(np.int64), 0, resolution - 1)
+        pixel = row * resolution + column
+        hits = is_inside_circle(x, y)
+        inside += np.bincount(pixel[hits], minlength=pixels)
+        outside += np.bincount(pixel[~hits], minlength=pixels)
+    return inside.reshape(resolution, resolution), outside.reshape(resolution, resolution)
+
+
+def density_to_rgba(inside, outside, inside_color='blue', outside_color='red', alpha=0.5):
+    """
+    Turn per-pixel counts into an RGBA image.
+
+    A pixel's colour mixes inside_color and outside_color by the share of its
+    points that were inside, and its opacity is that of `alpha` markers
+    drawn on top of each other.
+    """
+    from matplotlib.colors import to_rgb
+
+    total = inside + outside
+    share_inside = np.divide(inside, total, out=np.zeros(total.shape), where=total > 0)
+    rgba = np.empty(total.shape + (4,))
+    rgba[..., :3] = (share_inside[..., None] * to_rgb(inside_color)
+                     + (1 - share_inside[..., None]) * to_rgb(outside_color))
+    rgba[..., 3] = 1 - (1 - alpha) ** total
+    return rgba
+
+
+def visualize_simulation(n=1000, mode='auto', resolution=800, seed=None, method='uniform',
+                         chunk_size=CHUNK_SIZE, show=True):
+    """
+    Create a visualization of the Monte Carlo simulation.
+
+    Args:
+        n: Number of points to plot
+        mode: 'scatter' (one marker per point, as in the notebook), 'density'
+            (a pixel image, for any n), or 'auto' (scatter up to SCATTER_LIMIT)
+        resolution: Pixels per side in density mode
+        seed: See random_source()
+        method: Sampling method (see sampling.py)
+        chunk_size: Points generated at a time in density mode
+        show: Call plt.show(); False leaves the figure open as plt.gcf()
+
+    Returns:
+        The π estimate from the plotted points
+    """
+    import matplotlib.pyplot as plt
+    from matplotlib.lines import Line2D
+
+    if mode == 'auto':
+        mode = 'scatter' if n <= SCATTER_LIMIT else 'density'
+    if mode not in ('scatter', 'density'):
+        raise ValueError(f"Unknown mode '{mode}'. Choose from: auto, scatter, density")
+
+    plt.figure(figsize=(10, 10))
+    ax = plt.gca()
+    if mode == 'scatter':
+        pi_est, x, y, inside = estimate_pi(n, seed=seed, method=method)
+        ax.scatter(x[inside], y[inside], c='blue', s=1, alpha=0.5, label='Inside circle')
+        ax.scatter(x[~inside], y[~inside], c='red', s=1, alpha=0.5, label='Outside circle')
+        handles = []
+    else:
+        inside, outside = rasterize(n, resolution, chunk_size, seed, method)
+        pi_est = 4 * int(inside.sum()) / n
+        ax.imshow(density_to_rgba(inside, outside), extent=(-1, 1, -1, 1), origin='lower',
+                  interpolation='nearest')
+        # imshow has no legend entry, so stand-ins for the two colours
+        handles = [Line2D([], [], marker='s', linestyle='', color=color, alpha=0.5, label=label)
+                   for color, label in (('blue', 'Inside circle'), ('red', 'Outside circle'))]
+
+    # Draw the circle and the square on top
+    ax.add_patch(plt.Circle((0, 0), 1, color='green', fill=False, linewidth=2, label='Unit circle'))
+    ax.plot([-1, 1, 1, -1, -1], [-1, -1, 1, 1, -1], 'k-', linewidth=2, label='Square boundary')
+
+    ax.set_xlim(-1.1, 1.1)
+    ax.set_ylim(-1.1, 1.1)
+    ax.set_aspect('equal')
+    ax.grid(True, alpha=0.3)
+    ax.set_xlabel('x', fontsize=12)
+    ax.set_ylabel('y', fontsize=12)
+    ax.set_title(f'Monte Carlo Simulation for π\nn = {n:,} points\n'
+                 f'Estimated π = {pi_est:.6f}\nActual π = {math.pi:.6f}',
+                 fontsize=14, fontweight='bold')
+    existing, labels = ax.get_legend_handles_labels()
+    ax.legend(handles=handles + existing, loc='upper right', fontsize=10)
+
+    plt.tight_layout()
+    if show:
+        plt.show()
+    return pi_est
@@ -0,0 +1,179 @@
+"""
+Ways of choosing the points, from plain random to evenly spread.
+
+Plain random points leave gaps and clumps, and the error of the estimate
+falls like 1/sqrt(n): 100x the points for 10x the accuracy. Spreading the
+points out more evenly makes the error fall faster:
+
+- 'uniform': independent random points (what the notebook does)
+- 'antithetic': pairs a random point (u, v) in a quadrant with its mirror
+  image (1 - u, 1 - v). When one lands near the centre the other lands near
+  the corner, so their errors partly cancel
+- 'stratified': splits the square into a k x k grid and puts one random
+  ("jittered") point in every cell
+- 'halton': the Halton sequence (digits of the point's index, reversed, in
+  bases 2 and 3), scrambled with random digit permutations
+- 'sobol': the 2-D Sobol sequence, scrambled with a random linear matrix
+  scramble plus a digital shift. It is most even when n is a power of 2
+
+'halton' and 'sobol' are quasi-Monte Carlo (QMC) sequences, and their error
+falls roughly like 1/n instead of 1/sqrt(n). The random scrambling keeps them
+unbiased and means different seeds give different, independent estimates,
+so errors can be averaged just as for random points.
+
+Every sampler is a generator: sampler(n, rng, chunk_size) yields (x, y)
+arrays of at most chunk_size points in [-1, 1] until n points have been made.
+"""
+
+import math
+
+import numpy as np
+
+_BITS = 32
+
+
+def uniform(n, rng, chunk_size):
+    for start in range(0, n, chunk_size):
+        size = min(chunk_size, n - start)
+        yield rng.uniform(-1, 1, size), rng.uniform(-1, 1, size)
+
+
+def _random_signs(rng, size):
+    return np.where(rng.random(size) < 0.5, -1.0, 1.0)
+
+
+def antithetic(n, rng, chunk_size):
+    # Being inside the circle depends only on |x| and |y|, so work in one
+    # quadrant and pick each pair's quadrant at random
+    chunk_size = max(2, chunk_size - chunk_size % 2)
+    for start in range(0, n - n % 2, chunk_size):
+        half = min(chunk_size, n - n % 2 - start) // 2
+        u, v = rng.random(half), rng.random(half)
+        sx, sy = _random_signs(rng, half), _random_signs(rng, half)
+        yield np.concatenate([sx * u, sx * (1 - u)]), np.concatenate([sy * v, sy * (1 - v)])
+    if n % 2:
+        yield rng.uniform(-1, 1, 1), rng.uniform(-1, 1, 1)
+
+
+def stratified(n, rng, chunk_size):
+    # One jittered point per cell of a k x k grid; the n - k^2 points that
+    # don't fill another whole row of cells are plain random points
+    k = math.isqrt(n)
+    for start in range(0, k * k, chunk_size):
+        cells = np.arange(start, min(start + chunk_size, k * k))
+        row, col = np.divmod(cells, k)
+        yield (-1 + 2 * (col + rng.random(len(cells))) / k,
+               -1 + 2 * (row + rng.random(len(cells))) / k)
+    yield from uniform(n - k * k, rng, chunk_size)
+
+
+# -- Halton ----------------------------------------------------------------------
+
+def _digit_count(base):
+    """Digits in a base that resolve a point as finely as 32 bits do"""
+    return math.ceil(_BITS / math.log2(base))
+
+
+def _scrambled_radical_inverse(index, base, permutations):
+    """
+    Reverse the base-`base` digits of index behind the radix point, sending
+    digit position k through permutations[k]. Positions past the last digit
+    of index permute a 0, which fills in the rest of the point's cell at random.
+    """
+    result = np.zeros(len(index))
+    index = index.copy()
+    scale = 1.0
+    for permutation in permutations:
+        scale /= base
+        index, digit = np.divmod(index, base)
+        result += permutation[digit] * scale
+    return result
+
+
+def halton(n, rng, chunk_size, bases=(2, 3)):
+    permutations = [[rng.permutation(base) for _ in range(_digit_count(base))]
+                    for base in bases]
+    for start in range(0, n, chunk_size):
+        index = np.arange(start, min(start + chunk_size, n), dtype=np.int64)
+        x, y = (_scrambled_radical_inverse(index, base, perms)
+                for base, perms in zip(bases, permutations))
+        yield 2 * x - 1, 2 * y - 1
+
+
+# -- Sobol -------------------------------------------------------------------------
+
+def sobol_direction_numbers():
+    """
+    Direction numbers of the first two Sobol dimensions, as 32-bit integers.
+
+    Dimension 1 is the van der Corput sequence (v_j = 2^-j). Dimension 2
+    comes from the primitive polynomial x + 1: m_1 = 1, m_k = 2 m_{k-1} XOR m_{k-1}.
+    """
+    first = [1 << (_BITS - 1 - j) for j in range(_BITS)]
+    m = [1]
+    for _ in range(_BITS - 1):
+        m.append((2 * m[-1]) ^ m[-1])
+    second = [m_k << (_BITS - 1 - j) for j, m_k in enumerate(m)]
+    return first, second
+
+
+def _random_bits(rng, bits):
+    """A random integer with `bits` bits, from uniforms (works with any rng)"""
+    value = 0
+    for _ in range(bits):
+        value = (value << 1) | int(rng.random() < 0.5)
+    return value
+
+
+def _linear_scramble(directions, rng):
+    """
+    Multiply every direction number by one random lower-triangular binary
+    matrix with a unit diagonal (mod 2). Bit r of the result (counting from
+    the most significant) mixes bits 0..r of the input, which keeps the
+    sequence's even spread while randomising it.
+    """
+    rows = [(_random_bits(rng, r) << (_BITS - r)) | (1 << (_BITS - 1 - r)) for r in range(_BITS)]
+    scrambled = []
+    for v in directions:
+        out = 0
+        for r, row in enumerate(rows):
+            out |= (bin(row & v).count('1') & 1) << (_BITS - 1 - r)
+        scrambled.append(out)
+    return scrambled
+
+
+def sobol(n, rng, chunk_size):
+    if n > 2**_BITS:
+        raise ValueError(f"The Sobol sampler makes at most 2^{_BITS} points")
+    dimensions = []
+    for directions in sobol_direction_numbers():
+        directions = np.array(_linear_scramble(directions, rng), dtype=np.uint64)
+        dimensions.append((directions, np.uint64(_random_bits(rng, _BITS))))
+
+    for start in range(0, n, chunk_size):
+        index = np.arange(start, min(start + chunk_size, n), dtype=np.uint64)
+        coords = []
+        for directions, shift in dimensions:
+            # Point i is the XOR of the direction numbers of i's set bits
+            bits = np.full(len(index), shift)
+            for j in range(max(int(index[-1]).bit_length(), 1)):
+                bits ^= np.where((index >> np.uint64(j)) & np.uint64(1), directions[j], np.uint64(0))
+            coords.append(2 * (bits + 0.5) / 2.0**_BITS - 1)
+        yield coords[0], coords[1]
+
+
+SAMPLERS = {
+    'uniform': uniform,
+    'antithetic': antithetic,
+    'stratified': stratified,
+    'halton': halton,
+    'sobol': sobol,
+}
+
+
+def get_sampler(name):
+    """The sampler generator for a method name"""
+    if name not in SAMPLERS:
+        raise ValueError(f"Unknown sampling method '{name}'. "
+                         f"Choose from: {', '.join(SAMPLERS)}")
+    return SAMPLERS[name]
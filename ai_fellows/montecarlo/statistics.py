@@ -0,0 +1,110 @@
+"""
+Statistics over many simulation runs, without keeping every run.
+
+RunningStats keeps the count, mean, sum of squared deviations (M2), minimum
+and maximum of a stream of values. Adding a whole batch at once uses the
+parallel form of Welford's algorithm (Chan et al.): the batch's own mean and
+M2 are computed with numpy and merged in with
+
+    delta = mean_b - mean_a
+    mean  = mean_a + delta * n_b / n
+    M2    = M2_a + M2_b + delta^2 * n_a * n_b / n
+
+which stays accurate where the textbook sum(x^2)/n - mean^2 loses every
+digit (the estimates all agree to many places, so that difference cancels).
+
+run_multiple_simulations() is the notebook's function done as blocks of
+(runs x points): each block is a single numpy draw, hits are counted per
+row, and memory stays around CHUNK_SIZE points for any n and num_runs.
+"""
+
+import math
+
+import numpy as np
+
+from .estimate import CHUNK_SIZE, random_source
+
+
+class RunningStats:
+    """Count, mean, variance, min and max of values added in batches"""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, values):
+        """Merge a batch of values in"""
+        values = np.asarray(values, dtype=float).ravel()
+        if len(values):
+            batch = RunningStats()
+            batch.count = len(values)
+            batch.mean = float(values.mean())
+            batch.m2 = float(np.sum((values - batch.mean) ** 2))
+            batch.min = float(values.min())
+            batch.max = float(values.max())
+            self.merge(batch)
+        return self
+
+    def merge(self, other):
+        """Combine with another RunningStats (e.g. from another process)"""
+        if other.count == 0:
+            return self
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def variance(self, ddof=0):
+        return self.m2 / (self.count - ddof) if self.count > ddof else math.nan
+
+    def std(self, ddof=0):
+        return math.sqrt(self.variance(ddof))
+
+
+def run_multiple_simulations(n=10000, num_runs=100, chunk_size=CHUNK_SIZE, seed=None):
+    """
+    Run multiple Monte Carlo simulations and analyze the results.
+
+    Runs are simulated a block at a time: a block holds as many whole runs
+    as fit in chunk_size points (or one run's next chunk_size points when n
+    is bigger than that), so for n <= chunk_size the random numbers are
+    used in exactly the notebook's order.
+
+    Args:
+        n: Number of samples per simulation
+        num_runs: Number of simulations to run
+        chunk_size: Points per block (memory is about 17 bytes per point)
+        seed: See random_source() (default: the global np.random state)
+
+    Returns:
+        dict with 'mean', 'std', 'min', 'max' and 'mean_error' of the estimates
+    """
+    rng = random_source(seed)
+    columns = min(n, chunk_size)
+    runs_per_block = max(1, chunk_size // columns)
+    stats = RunningStats()
+
+    for first_run in range(0, num_runs, runs_per_block):
+        runs = min(runs_per_block, num_runs - first_run)
+        inside = np.zeros(runs, dtype=np.int64)
+        for start in range(0, n, columns):
+            # Axis 1 is (x, y), so each run draws its x's and then its y's
+            points = rng.uniform(-1, 1, (runs, 2, min(columns, n - start)))
+            x, y = points[:, 0], points[:, 1]
+            inside += np.count_nonzero(x**2 + y**2 <= 1, axis=1)
+        stats.add(4 * inside / n)
+
+    return {
+        'mean': stats.mean,
+        'std': stats.std(),
+        'min': stats.min,
+        'max': stats.max,
+        'mean_error': abs(stats.mean - math.pi),
+    }
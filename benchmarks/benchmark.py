@@ -0,0 +1,327 @@
+"""
+Benchmarks for the hot paths of all three lessons.
+
+    python benchmarks/benchmark.py run                         # everything
+    python benchmarks/benchmark.py run --quick --only pi backprop
+    python benchmarks/benchmark.py run --output baseline.json
+    python benchmarks/benchmark.py compare baseline.json benchmarks/results.json
+
+What is measured:
+
+- pi: the reference π estimator (ai_fellows.montecarlo) at several n,
+  in points per second
+- montyhall: MontyHallSimulation.run_simulation, in trials per second
+- backprop: training steps per second for each network class
+- grade: the time the grader takes per notebook in calculating-pi
+
+Every case runs `--warmup` times untimed and then `--repeats` times timed.
+The report gives the median and best wall time, the CPU time (CPU/wall above
+100% means numpy used several cores), and the peak memory allocated, which
+comes from one extra tracemalloc run so tracing doesn't slow the timed ones.
+
+Results are saved as JSON. `compare` matches two result files case by case
+and flags every case whose median time grew by more than --threshold (10% by
+default); it exits with status 1 if there is any, so it can gate a change.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+import warnings
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PI_DIR = os.path.join(ROOT, 'calculating-pi')
+GROUPS = ('pi', 'montyhall', 'backprop', 'grade')
+DEFAULT_OUTPUT = os.path.join(ROOT, 'benchmarks', 'results.json')
+
+
+try:
+    import ai_fellows
+except ImportError:
+    # Not installed: benchmark the checkout this script belongs to
+    sys.path.insert(0, ROOT)
+
+
+class Case:
+    """
+    One benchmark: `run()` does `units` units of work (points, trials, steps...).
+
+    setup() is called once per timed run, outside the timing, and returns the
+    function to time. That way each run starts from the same state.
+    """
+
+    def __init__(self, name, group, setup, units, unit):
+        self.name = name
+        self.group = group
+        self.setup = setup
+        self.units = units
+        self.unit = unit
+
+
+# -- the cases ---------------------------------------------------------------------
+
+def pi_cases(quick):
+    from ai_fellows import montecarlo
+
+    cases = []
+    for n in ((10**4, 10**6) if quick else (10**4, 10**6, 10**7)):
+        cases.append(Case(f'pi/stream n={n:.0e}', 'pi',
+                          lambda n=n: lambda: montecarlo.estimate_pi(n, return_points=False, seed=0),
+                          n, 'points'))
+    n = 10**5 if quick else 10**6
+    cases.append(Case(f'pi/arrays n={n:.0e}', 'pi',
+                      lambda n=n: lambda: montecarlo.estimate_pi(n, seed=0), n, 'points'))
+    n = 10**6 if quick else 10**7
+    cases.append(Case(f'pi/fast float32 n={n:.0e}', 'pi',
+                      lambda n=n: lambda: montecarlo.estimate_pi_fast(n, seed=0), n, 'points'))
+    return cases
+
+
+def montyhall_cases(quick):
+    from ai_fellows import montyhall as module
+    trials = 10**4 if quick else 10**5
+
+    def setup():
+        sim = module.MontyHallSimulation()
+        return lambda: sim.run_simulation(trials)
+    return [Case('montyhall/run_simulation', 'montyhall', setup, trials, 'trials')]
+
+
+def backprop_cases(quick):
+    import numpy as np
+    from ai_fellows.backprop import MLP, NonlinearNetwork, RegressionNetwork, SimpleNetwork, make_regression_data
+
+    steps = 2000 if quick else 20000
+    x_data, y_data = make_regression_data(n_points=100, seed=42)
+    x_column, y_column = x_data.reshape(-1, 1), y_data.reshape(-1, 1)
+
+    def trainer(make_net, x, target, learning_rate):
+        def setup():
+            net = make_net()
+
+            def run():
+                for _ in range(steps):
+                    net.train_step(x, target, learning_rate=learning_rate)
+            return run
+        return setup
+
+    return [
+        Case('backprop/SimpleNetwork', 'backprop',
+             trainer(SimpleNetwork, 2, 20, 0.1), steps, 'steps'),
+        Case('backprop/NonlinearNetwork', 'backprop',
+             trainer(NonlinearNetwork, 2, 20, 0.1), steps, 'steps'),
+        Case('backprop/RegressionNetwork (100 rows)', 'backprop',
+             trainer(lambda: (np.random.seed(0), RegressionNetwork())[1], x_data, y_data, 0.001),
+             steps, 'steps'),
+        Case('backprop/MLP 1-16-1 (100 rows)', 'backprop',
+             trainer(lambda: MLP.build([1, 16, 1], seed=0), x_column / 10, y_column / 10, 0.05),
+             steps, 'steps'),
+    ]
+
+
+def grade_cases(quick):
+    from ai_fellows import grading as grader_module
+    tasks = ('generate_random_points', 'is_inside_circle', 'estimate_pi',
+             'analyze_convergence', 'run_multiple_simulations')
+    cases = []
+    for filename in sorted(os.listdir(PI_DIR)):
+        if not filename.endswith('.ipynb'):
+            continue
+        path = os.path.join(PI_DIR, filename)
+
+        def setup(path=path):
+            def grade():
+                # What main() does, minus printing and writing the report
+                import matplotlib.pyplot as plt
+                grader = grader_module.MonteCarloGrader()
+                with contextlib.redirect_stdout(io.StringIO()):
+                    namespace = grader_module.extract_functions_from_notebook(path)
+                    for task in tasks:
+                        if task in namespace:
+                            getattr(grader, f'grade_{task}')(namespace[task])
+                plt.close('all')
+            return grade
+        cases.append(Case(f'grade/{filename}', 'grade', setup, 1, 'notebooks'))
+    return cases
+
+
+CASES = {
+    'pi': pi_cases,
+    'montyhall': montyhall_cases,
+    'backprop': backprop_cases,
+    'grade': grade_cases,
+}
+
+
+# -- running ---------------------------------------------------------------------------
+
+def measure(case, warmup, repeats):
+    """Time one case; returns its result dict"""
+    for _ in range(warmup):
+        case.setup()()
+
+    wall, cpu = [], []
+    for _ in range(repeats):
+        run = case.setup()
+        cpu_start, start = time.process_time(), time.perf_counter()
+        run()
+        wall.append(time.perf_counter() - start)
+        cpu.append(time.process_time() - cpu_start)
+
+    run = case.setup()
+    tracemalloc.start()
+    try:
+        run()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    median = statistics.median(wall)
+    return {
+        'group': case.group,
+        'units': case.units,
+        'unit': case.unit,
+        'wall_seconds': wall,
+        'median_seconds': median,
+        'best_seconds': min(wall),
+        'cpu_seconds': statistics.median(cpu),
+        'rate': case.units / median,
+        'peak_bytes': peak,
+    }
+
+
+def environment():
+    import numpy as np
+    return {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'processor': platform.processor() or platform.machine(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+def format_result(name, result):
+    cpu_share = result['cpu_seconds'] / result['median_seconds'] if result['median_seconds'] else 0
+    rate = f"{result['rate']:,.0f}" if result['rate'] >= 100 else f"{result['rate']:.2f}"
+    return (f"{name:<48}{result['median_seconds'] * 1e3:>11.2f}{result['best_seconds'] * 1e3:>11.2f}"
+            f"{rate:>14} {result['unit'] + '/s':<12}{cpu_share:>6.0%}"
+            f"{result['peak_bytes'] / 2**20:>10.1f}")
+
+
+def run(args):
+    # The lesson scripts import pyplot; never open windows while timing
+    os.environ.setdefault('MPLBACKEND', 'Agg')
+    warnings.filterwarnings('ignore')
+
+    header = (f"{'case':<48}{'median ms':>11}{'best ms':>11}{'rate':>14} {'':<12}"
+              f"{'CPU':>6}{'peak MB':>10}")
+    print(header)
+    print('-' * len(header))
+    results, skipped = {}, {}
+    for group in args.only or GROUPS:
+        try:
+            cases = CASES[group](args.quick)
+        except Exception as exc:
+            skipped[group] = f"{type(exc).__name__}: {exc}"
+            print(f"{group:<48}skipped: {skipped[group]}")
+            continue
+        for case in cases:
+            try:
+                results[case.name] = measure(case, args.warmup, args.repeats)
+            except Exception as exc:
+                skipped[case.name] = f"{type(exc).__name__}: {exc}"
+                print(f"{case.name:<48}skipped: {skipped[case.name]}")
+                continue
+            print(format_result(case.name, results[case.name]))
+
+    report = {
+        'environment': environment(),
+        'settings': {'quick': args.quick, 'warmup': args.warmup, 'repeats': args.repeats},
+        'results': results,
+        'skipped': skipped,
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\nSaved to {args.output}")
+
+
+def compare(args):
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+    if baseline['settings'].get('quick') != current['settings'].get('quick'):
+        print("Warning: one file is a --quick run and the other isn't; "
+              "the workloads differ\n")
+
+    header = f"{'case':<48}{'baseline ms':>13}{'current ms':>13}{'change':>10}"
+    print(header)
+    print('-' * len(header))
+    regressions = []
+    for name, new in current['results'].items():
+        old = baseline['results'].get(name)
+        if old is None:
+            print(f"{name:<48}{'':>13}{new['median_seconds'] * 1e3:>13.2f}{'new':>10}")
+            continue
+        change = new['median_seconds'] / old['median_seconds'] - 1
+        flag = ''
+        if change > args.threshold:
+            flag = '  REGRESSION'
+            regressions.append(name)
+        elif change < -args.threshold:
+            flag = '  faster'
+        print(f"{name:<48}{old['median_seconds'] * 1e3:>13.2f}{new['median_seconds'] * 1e3:>13.2f}"
+              f"{change:>+10.1%}{flag}")
+    for name in baseline['results']:
+        if name not in current['results']:
+            print(f"{name:<48}{'(not in current run)':>26}")
+
+    if regressions:
+        print(f"\n{len(regressions)} case(s) slower by more than {args.threshold:.0%}")
+        return 1
+    print(f"\nNo case slower by more than {args.threshold:.0%}")
+    return 0
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the hot paths of the three lessons.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help="run the benchmarks and save the results")
+    run_parser.add_argument('--only', nargs='+', choices=GROUPS, metavar='GROUP',
+                            help=f"groups to run ({', '.join(GROUPS)}; default: all)")
+    run_parser.add_argument('--quick', action='store_true', help="smaller workloads, for a fast check")
+    run_parser.add_argument('--warmup', type=int, default=1, help="untimed runs per case (default 1)")
+    run_parser.add_argument('--repeats', type=int, default=5, help="timed runs per case (default 5)")
+    run_parser.add_argument('--output', default=DEFAULT_OUTPUT,
+                            help="JSON file for the results (default benchmarks/results.json)")
+
+    compare_parser = commands.add_parser('compare', help="compare two result files")
+    compare_parser.add_argument('baseline', help="results to compare against")
+    compare_parser.add_argument('current', help="new results")
+    compare_parser.add_argument('--threshold', type=float, default=0.10,
+                                help="relative slowdown that counts as a regression (default 0.10)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.command == 'run':
+        run(args)
+        return 0
+    return compare(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
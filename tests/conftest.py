@@ -0,0 +1,4 @@
+import os
+
+# Notebooks and plots call plt.show(); tests never open windows
+os.environ.setdefault('MPLBACKEND', 'Agg')
@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from ai_fellows.backprop import Tape
+from ai_fellows.backprop.autodiff import relu, sigmoid, tanh
+
+
+def numerical_gradient(f, value, eps=1e-6):
+    """Central differences of the scalar f() with respect to every element of value"""
+    grad = np.zeros_like(value)
+    for index in np.ndindex(value.shape):
+        saved = value[index]
+        value[index] = saved + eps
+        up = f()
+        value[index] = saved - eps
+        down = f()
+        value[index] = saved
+        grad[index] = (up - down) / (2 * eps)
+    return grad
+
+
+def test_worksheet_gradients():
+    tape = Tape()
+    w1 = tape.variable(1.0, 'w1')
+    w2 = tape.variable(3.0, 'w2')
+    y = 2 * (3 * 2 + w1) + w2
+    E = 0.5 * (y - 20) ** 2
+    assert tape.gradients(E, [w1, w2]) == [-6.0, -3.0]
+
+
+@pytest.mark.parametrize('reduction', ['sum', 'mean'])
+def test_reduction_gradient_has_variable_shape(reduction):
+    rng = np.random.RandomState(0)
+    tape = Tape()
+    w = tape.variable(rng.randn(3, 4), 'w')
+    out = getattr(w * w, reduction)()
+    tape.backward(out)
+    assert w.grad.shape == (3, 4)
+
+    def f():
+        return getattr(np.square(w.value), reduction)()
+    np.testing.assert_allclose(w.grad, numerical_gradient(f, w.value), rtol=1e-6, atol=1e-8)
+
+
+def test_direct_reduction_of_a_variable():
+    tape = Tape()
+    w = tape.variable(np.arange(6.0).reshape(2, 3), 'w')
+    tape.backward(w.mean())
+    np.testing.assert_allclose(w.grad, np.full((2, 3), 1 / 6))
+    tape.backward(w.sum())
+    np.testing.assert_allclose(w.grad, np.ones((2, 3)))
+
+
+@pytest.mark.parametrize('activation', [sigmoid, tanh, relu])
+def test_layer_gradients_match_finite_differences(activation):
+    rng = np.random.RandomState(1)
+    x = rng.randn(5, 3)
+    target = rng.randn(5, 2)
+    tape = Tape()
+    W = tape.variable(rng.randn(3, 2), 'W')
+    b = tape.variable(rng.randn(1, 2), 'b')
+    out = activation(tape.constant(x) @ W + b)
+    loss = ((out - target) ** 2).mean()
+    tape.backward(loss)
+    assert W.grad.shape == W.value.shape
+    assert b.grad.shape == b.value.shape
+
+    def f():
+        tape.replay()
+        return float(loss.value)
+    np.testing.assert_allclose(W.grad, numerical_gradient(f, W.value), rtol=1e-5, atol=1e-8)
+    np.testing.assert_allclose(b.grad, numerical_gradient(f, b.value), rtol=1e-5, atol=1e-8)
@@ -0,0 +1,77 @@
+import os
+import stat
+
+import numpy as np
+import pytest
+
+from ai_fellows.backprop import (
+    MLP,
+    Checkpointer,
+    History,
+    NonlinearNetwork,
+    RegressionNetwork,
+    load_checkpoint,
+    make_regression_data,
+    resume,
+    save_checkpoint,
+    train,
+)
+from ai_fellows.backprop.optimizers import Adam, Momentum
+
+
+def worksheet():
+    return NonlinearNetwork(1.0, 3.0, history=History(stride=3), optimizer=Momentum()), 2.0, 0.5
+
+
+def regression():
+    x, y = make_regression_data(n_points=40, seed=3)
+    np.random.seed(0)
+    return RegressionNetwork(history=History(max_length=8), optimizer=Adam()), x, y
+
+
+def mlp():
+    x = np.linspace(-1, 1, 32).reshape(-1, 1)
+    net = MLP.build([1, 8, 1], activation='tanh', seed=0)
+    net.optimizer = Adam()
+    return net, x, np.sin(3 * x)
+
+
+@pytest.mark.parametrize('make', [worksheet, regression, mlp])
+def test_resume_matches_training_straight_through(make, tmp_path):
+    path = tmp_path / 'run.npz'
+    straight, x, target = make()
+    expected = train(straight, x, target, steps=40, learning_rate=0.01)
+
+    net, x, target = make()
+    first = train(net, x, target, steps=25, learning_rate=0.01,
+                  callback=Checkpointer(path, every=25))
+    net, step = resume(path)
+    assert step == 25
+    rest = train(net, x, target, steps=15, learning_rate=0.01)
+
+    np.testing.assert_array_equal(first + rest, expected)
+    assert set(net.history) == set(straight.history)
+    for field in net.history:
+        np.testing.assert_array_equal(net.history[field], straight.history[field])
+        np.testing.assert_array_equal(net.history.steps(field), straight.history.steps(field))
+
+
+def test_loading_leaves_numpy_global_state_alone(tmp_path):
+    path = tmp_path / 'run.npz'
+    net, x, target = regression()
+    save_checkpoint(path, net)
+    before = np.random.get_state()[1].copy()
+    restored = load_checkpoint(path)['network']
+    np.testing.assert_array_equal(np.random.get_state()[1], before)
+    assert (restored.w, restored.b) == (net.w, net.b)
+    assert restored.dtype == net.dtype
+
+
+@pytest.mark.skipif(os.name != 'posix', reason='POSIX file modes')
+def test_checkpoint_file_gets_the_usual_mode(tmp_path):
+    umask = os.umask(0o022)
+    try:
+        path = save_checkpoint(tmp_path / 'run.npz', mlp()[0])
+    finally:
+        os.umask(umask)
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o644
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from ai_fellows.backprop import (
+    History,
+    SimpleNetwork,
+    closed_form_steps_to_tolerance,
+    cross_check,
+    divergence_threshold,
+    jump,
+    steps_to_tolerance,
+    train_iteratively,
+)
+
+LEARNING_RATES = (0.01, 0.1, 0.15, 0.2, 0.3, 0.39)
+
+
+def test_cross_check_agrees_with_training():
+    report = cross_check(learning_rates=LEARNING_RATES)
+    for learning_rate, differences in report.items():
+        assert differences['iterative'] < 1e-9, learning_rate
+        assert differences['matrix_power'] < 1e-9, learning_rate
+
+
+def test_jump_broadcasts_over_steps_and_learning_rates():
+    steps = np.arange(0, 40, 7)[:, None]
+    learning_rates = np.array(LEARNING_RATES)
+    grid = jump(steps, learning_rate=learning_rates)
+    assert grid.w1.shape == (len(steps), len(learning_rates))
+    for i, k in enumerate(steps[:, 0]):
+        for j, learning_rate in enumerate(learning_rates):
+            expected = train_iteratively(k, learning_rate=learning_rate)
+            np.testing.assert_allclose(grid.w1[i, j], expected.w1, rtol=1e-12, atol=1e-12)
+            np.testing.assert_allclose(grid.w2[i, j], expected.w2, rtol=1e-12, atol=1e-12)
+
+
+@pytest.mark.parametrize('learning_rate', LEARNING_RATES)
+@pytest.mark.parametrize('tolerance', (1e-2, 1e-6, 1e-10))
+def test_steps_to_tolerance_matches_training(learning_rate, tolerance):
+    net = SimpleNetwork(1.0, 3.0, history=History.off())
+    expected = steps_to_tolerance(net, 2, 20, tolerance=tolerance, learning_rate=learning_rate,
+                                  max_steps=10_000)
+    assert closed_form_steps_to_tolerance(tolerance, learning_rate=learning_rate) == expected
+
+
+def test_steps_to_tolerance_never_at_or_above_threshold():
+    learning_rates = np.array([divergence_threshold(), 0.5])
+    assert closed_form_steps_to_tolerance(learning_rate=learning_rates).tolist() == [-1, -1]
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from ai_fellows.backprop import (
+    History,
+    NonlinearNetwork,
+    RegressionNetwork,
+    SimpleNetwork,
+    make_regression_data,
+    steps_to_tolerance,
+    train_ensemble,
+)
+from ai_fellows.backprop.ensemble import CONVERGED
+
+
+@pytest.mark.parametrize('network_class', [SimpleNetwork, NonlinearNetwork])
+def test_worksheet_ensemble_counts_steps_like_training(network_class):
+    learning_rates = np.array([0.05, 0.1, 0.2, 0.3])
+    result = train_ensemble(network_class, {'w1': 1.0, 'w2': 3.0}, learning_rates,
+                            steps=5000, tolerance=1e-6)
+    for learning_rate, steps, status in zip(learning_rates, result.steps, result.status):
+        net = network_class(1.0, 3.0, history=History.off())
+        expected = steps_to_tolerance(net, 2, 20, tolerance=1e-6, learning_rate=learning_rate,
+                                      max_steps=5000)
+        assert status == CONVERGED
+        assert steps == expected
+
+
+def test_regression_ensemble_counts_steps_like_training():
+    x, y = make_regression_data(n_points=50, seed=1)
+    slope, intercept = np.polyfit(x, y, 1)
+    best = float(np.mean((slope * x + intercept - y) ** 2))
+    w = np.array([0.5, 1.0, 2.0])
+    b = np.array([0.0, -1.0, 3.0])
+    result = train_ensemble(RegressionNetwork, {'w': w, 'b': b}, 0.001, x, y,
+                            steps=20000, tolerance=1e-3, best_error=best)
+    for i in range(3):
+        net = RegressionNetwork(history=History.off())
+        net.w, net.b = w[i], b[i]
+        expected = steps_to_tolerance(net, x, y, tolerance=1e-3, learning_rate=0.001,
+                                      best_error=best, max_steps=20000)
+        assert result.steps[i] == expected
+        assert result.weights['w'][i] == pytest.approx(net.w, rel=1e-9)
+        assert result.weights['b'][i] == pytest.approx(net.b, rel=1e-9)
+
+
+def test_weights_are_matched_by_name():
+    x, y = make_regression_data(n_points=50, seed=1)
+    w = np.array([0.5, 1.0])
+    b = np.array([0.0, 3.0])
+    forward = train_ensemble(RegressionNetwork, {'w': w, 'b': b}, 0.001, x, y, steps=50)
+    backward = train_ensemble(RegressionNetwork, {'b': b, 'w': w}, 0.001, x, y, steps=50)
+    np.testing.assert_array_equal(forward.weights['w'], backward.weights['w'])
+    np.testing.assert_array_equal(forward.error, backward.error)
+
+
+@pytest.mark.parametrize('network_class, weights', [
+    (RegressionNetwork, {'w1': 1.0, 'w2': 3.0}),
+    (SimpleNetwork, {'w': 1.0, 'b': 3.0}),
+    (SimpleNetwork, {'w1': 1.0}),
+])
+def test_wrong_weight_names_are_rejected(network_class, weights):
+    with pytest.raises(ValueError, match='needs weights'):
+        train_ensemble(network_class, weights, 0.1)
@@ -0,0 +1,26 @@
+import os
+
+from ai_fellows.grading import extract_functions_from_notebook, strip_notebook_magics
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_magics_at_statement_level_become_pass():
+    source = "if IN_COLAB:\n    !pip install -q numpy\n%matplotlib inline\nx = 1"
+    assert strip_notebook_magics(source) == "if IN_COLAB:\n    pass\npass\nx = 1"
+
+
+def test_continuation_lines_are_kept():
+    source = 'label = ("%d points"\n         % n)\ntotal = 7 \\\n    % 3'
+    assert strip_notebook_magics(source) == source
+
+
+def test_strings_are_kept():
+    source = 'doc = """\n!not a magic\n%neither\n"""'
+    assert strip_notebook_magics(source) == source
+
+
+def test_key_notebook_runs():
+    path = os.path.join(ROOT, 'calculating-pi', 'monte_carlo_pi_simulation_KEY.ipynb')
+    namespace = extract_functions_from_notebook(path)
+    assert callable(namespace['estimate_pi'])
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from ai_fellows.backprop import History, SimpleNetwork
+
+
+def logged(history, steps):
+    history.start(('a', 'b'), a=-1.0)
+    for step in range(1, steps + 1):
+        history.log(float(step), 10.0 * step)
+    return history
+
+
+def test_log_writes_every_step_and_grows():
+    history = logged(History(capacity=2), 100)
+    np.testing.assert_array_equal(history['a'], np.r_[-1.0, 1:101])
+    np.testing.assert_array_equal(history['b'], 10.0 * np.arange(1, 101))
+    np.testing.assert_array_equal(history.steps('b'), np.arange(1, 101))
+
+
+def test_stride_keeps_every_nth_step():
+    history = logged(History(stride=3), 10)
+    np.testing.assert_array_equal(history['b'], [30.0, 60.0, 90.0])
+    np.testing.assert_array_equal(history.steps('b'), [3, 6, 9])
+
+
+@pytest.mark.parametrize('capacity', [1, 4, 64])
+def test_max_length_keeps_the_most_recent_steps(capacity):
+    history = logged(History(max_length=7, capacity=capacity), 25)
+    np.testing.assert_array_equal(history['b'], 10.0 * np.arange(19, 26))
+    np.testing.assert_array_equal(history.steps('b'), np.arange(19, 26))
+    assert history._data.shape[1] == 7
+
+
+def test_off_records_nothing():
+    history = History.off()
+    assert not history.enabled
+    net = SimpleNetwork(1.0, 3.0, history=history)
+    net.train_step(2.0, 20.0)
+    assert len(history) == 0
+    assert history.state() == {'off': True}
+    assert not History.from_state(history.state()).enabled
+
+
+@pytest.mark.parametrize('max_length', [None, 5])
+def test_state_round_trip_carries_on(max_length):
+    original = logged(History(stride=2, max_length=max_length, capacity=2), 13)
+    copy = History.from_state(original.state())
+    for history in (original, copy):
+        for step in range(14, 30):
+            history.log(float(step), 10.0 * step)
+    for field in ('a', 'b'):
+        np.testing.assert_array_equal(copy[field], original[field])
+        np.testing.assert_array_equal(copy.steps(field), original.steps(field))
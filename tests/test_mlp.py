@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from ai_fellows.backprop import (
+    MLP,
+    History,
+    NonlinearNetwork,
+    RegressionNetwork,
+    SimpleNetwork,
+    WORKSHEET_TARGET,
+    WORKSHEET_X,
+)
+
+
+@pytest.mark.parametrize('activation', ['sigmoid', 'tanh', 'relu'])
+def test_mlp_gradients_match_finite_differences(activation):
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=(8, 3))
+    target = rng.normal(size=(8, 2))
+    net = MLP.build([3, 5, 4, 2], activation=activation, seed=1)
+    net.forward(x, target)
+    net.backward()
+
+    eps = 1e-6
+    for layer in net.layers:
+        for array, grad in ((layer.W, layer.dW), (layer.b, layer.db)):
+            numerical = np.zeros_like(array)
+            for index in np.ndindex(array.shape):
+                saved = array[index]
+                array[index] = saved + eps
+                up = net.forward(x, target)[1]
+                array[index] = saved - eps
+                down = net.forward(x, target)[1]
+                array[index] = saved
+                numerical[index] = (up - down) / (2 * eps)
+            np.testing.assert_allclose(grad, numerical, rtol=1e-5, atol=1e-9)
+
+
+@pytest.mark.parametrize('network_class', [SimpleNetwork, NonlinearNetwork])
+def test_worksheet_networks_agree_with_to_mlp(network_class):
+    net = network_class(1.0, 3.0, history=History.off())
+    mlp = net.to_mlp()
+    for _ in range(20):
+        error = net.train_step(WORKSHEET_X, WORKSHEET_TARGET, learning_rate=0.05)
+        mlp_error = mlp.train_step(WORKSHEET_X, WORKSHEET_TARGET, learning_rate=0.05)
+        assert mlp_error == pytest.approx(error, rel=1e-12)
+        assert mlp.layers[0].db[0] == pytest.approx(net.dE_dw1, rel=1e-12)
+        assert mlp.layers[1].db[0] == pytest.approx(net.dE_dw2, rel=1e-12)
+    assert mlp.layers[0].b[0] == pytest.approx(net.w1, rel=1e-12)
+    assert mlp.layers[1].b[0] == pytest.approx(net.w2, rel=1e-12)
+
+
+def test_regression_network_agrees_with_to_mlp():
+    rng = np.random.default_rng(2)
+    x = rng.uniform(0, 1, 50)
+    y = 3 * x + 1 + rng.normal(0, 0.1, 50)
+    np.random.seed(0)
+    net = RegressionNetwork(history=History.off())
+    mlp = net.to_mlp()
+    for _ in range(20):
+        mlp.train_step(x, y, learning_rate=0.1)
+        loss = net.train_step(x, y, learning_rate=0.1)
+    assert mlp.layers[0].W[0, 0] == pytest.approx(net.w, rel=1e-12)
+    assert mlp.layers[0].b[0] == pytest.approx(net.b, rel=1e-12)
+    # RegressionNetwork reports mean squared error, the MLP half of it
+    assert 2 * mlp.forward(x, y)[1] == pytest.approx(loss, rel=1e-12)
@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+from ai_fellows.montecarlo import estimate_pi_parallel
+
+N = 200_000
+BLOCK = 30_000      # several blocks, the last one partly filled
+
+
+@pytest.mark.parametrize('workers', [2, 4])
+def test_same_result_for_any_number_of_workers(workers):
+    serial = estimate_pi_parallel(N, seed=42, workers=1, block_size=BLOCK)
+    parallel = estimate_pi_parallel(N, seed=42, workers=workers, block_size=BLOCK)
+    assert parallel.inside == serial.inside
+    assert parallel.pi == serial.pi
+    assert parallel.blocks == 7
+
+
+def test_result_is_close_to_pi():
+    result = estimate_pi_parallel(N, seed=0, workers=1, block_size=BLOCK)
+    assert abs(result.pi - np.pi) < 5 * result.standard_error
+
+
+def test_seed_sequence_is_not_consumed():
+    root = np.random.SeedSequence(7)
+    first = estimate_pi_parallel(N, seed=root, workers=1, block_size=BLOCK)
+    second = estimate_pi_parallel(N, seed=root, workers=1, block_size=BLOCK)
+    assert root.n_children_spawned == 0
+    assert first.inside == second.inside
+    assert first.inside == estimate_pi_parallel(N, seed=7, workers=1, block_size=BLOCK).inside
+
+
+@pytest.mark.parametrize('n', [0, -5])
+def test_rejects_empty_runs(n):
+    with pytest.raises(ValueError):
+        estimate_pi_parallel(n, seed=0)
@@ -0,0 +1,56 @@
+import json
+
+import pytest
+
+from ai_fellows.backprop import History, Profiler, SimpleNetwork
+
+
+def test_attach_times_every_phase_and_detaches():
+    net = SimpleNetwork()
+    profiler = Profiler(every=10, allocations=True)
+    with profiler.attach(net):
+        for _ in range(25):
+            net.train_step(2, 20, learning_rate=0.01)
+    assert type(net) is SimpleNetwork
+    assert type(net.history) is History
+    assert '_profiler' not in vars(net)
+
+    assert set(profiler.totals) == {'forward', 'backward', 'update', 'history',
+                                    'train_step (inline)'}
+    for calls, seconds, blocks in profiler.totals.values():
+        assert calls == 25
+        assert seconds >= 0
+    assert [window['steps'] for window in profiler.windows] == [10, 20, 25]
+    assert 'blocks' in profiler.summary()
+
+
+def test_detached_network_is_not_timed():
+    net = SimpleNetwork()
+    profiler = Profiler()
+    with profiler.attach(net):
+        net.train_step(2, 20)
+    net.train_step(2, 20)
+    assert profiler.totals['forward'][0] == 1
+
+
+def test_second_profiler_cannot_take_over():
+    net = SimpleNetwork()
+    outer = Profiler()
+    with outer.attach(net):
+        with pytest.raises(RuntimeError, match='already attached'):
+            with Profiler().attach(net):
+                pass
+        net.train_step(2, 20)
+    assert outer.totals['forward'][0] == 1
+    assert type(net) is SimpleNetwork
+
+
+def test_chrome_trace(tmp_path):
+    net = SimpleNetwork()
+    profiler = Profiler(every=5)
+    with profiler.attach(net):
+        for _ in range(10):
+            net.train_step(2, 20)
+    with open(profiler.write_chrome_trace(tmp_path / 'trace.json')) as f:
+        events = json.load(f)['traceEvents']
+    assert sum(event['ph'] == 'X' for event in events) == 2
@@ -0,0 +1,70 @@
+import time
+
+import numpy as np
+
+from ai_fellows.backprop import grid_search
+from ai_fellows.backprop.search import CANCELLED, DONE
+
+X = np.linspace(0, 1, 10)
+Y = 2 * X
+
+# Epochs a config runs for unless cancelled (about 10 s at the losers' delay)
+FOREVER = 2000
+
+
+def scripted_training(config, x, y, report):
+    """Report config['loss'] for config['epochs'] epochs, config['delay'] seconds apart"""
+    epochs = config.get('epochs', FOREVER)
+    for epoch in range(epochs):
+        time.sleep(config.get('delay', 0.0))
+        if not report(epoch, config['loss']) and epoch + 1 < epochs:
+            return True
+    return False
+
+
+def run(configs, workers, **kwargs):
+    results = grid_search(configs, X, Y, train_fn=scripted_training, workers=workers,
+                          min_epochs=3, **kwargs)
+    return {result.index: result for result in results}
+
+
+def test_losers_are_cancelled_when_configs_outnumber_workers():
+    # Config 0 is the best; the losers only ever stop if they are cancelled,
+    # including the ones that start after config 0 has finished
+    best = {'loss': 1.0, 'epochs': FOREVER}
+    loser = {'loss': 100.0, 'delay': 0.005}
+    close = {'loss': 1.5, 'epochs': 5}
+    results = run([best, loser, loser, loser, close, close], workers=2)
+    assert [results[i].status for i in range(6)] == [DONE, CANCELLED, CANCELLED, CANCELLED,
+                                                     DONE, DONE]
+    for i in (1, 2, 3):
+        assert 3 <= len(results[i].losses) < FOREVER
+
+
+def test_loser_that_starts_first_is_cancelled_once_a_better_config_reports():
+    results = run([{'loss': 100.0, 'delay': 0.005}, {'loss': 1.0, 'epochs': FOREVER}], workers=2)
+    assert results[0].status == CANCELLED
+    assert results[1].status == DONE
+
+
+def test_finished_config_counts_as_done():
+    # On one worker config 0 finishes before config 1 reports anything better
+    results = run([{'loss': 10.0, 'epochs': 3}, {'loss': 1.0, 'epochs': 3}], workers=1)
+    assert results[0].status == DONE
+    assert results[0].losses == [10.0] * 3
+    assert results[1].status == DONE
+
+
+def test_no_cancelling_without_ratio():
+    results = run([{'loss': 10.0, 'epochs': 5}, {'loss': 1.0, 'epochs': 5}], workers=2,
+                  cancel_ratio=None)
+    assert [results[i].status for i in (0, 1)] == [DONE, DONE]
+
+
+def test_closing_the_generator_stops_the_workers():
+    configs = [{'loss': 1.0, 'delay': 0.05} for _ in range(2)]
+    configs.append({'loss': 1.0, 'epochs': 1})
+    start = time.perf_counter()
+    for result in grid_search(configs, X, Y, train_fn=scripted_training, workers=3):
+        break
+    assert time.perf_counter() - start < 3.0